@@ -0,0 +1,41 @@
+# Compares two JSON reports written by benchmarks/suite.py:
+#
+#   python benchmarks/compare.py before.json after.json [--threshold 1.1]
+#
+# Exits with status 1 if any case got slower than the threshold ratio.
+
+import argparse
+import json
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('before')
+	parser.add_argument('after')
+	parser.add_argument('--threshold', type = float, default = 1.1, help = 'ratio of best times that counts as a regression')
+	args = parser.parse_args()
+
+	with open(args.before) as file:
+		before = {(result['group'], result['name']): result for result in json.load(file)['results']}
+	with open(args.after) as file:
+		after = json.load(file)['results']
+
+	regressions = 0
+	for result in after:
+		old = before.get((result['group'], result['name']))
+		if old is None:
+			print(f'{result["group"]:<11} {result["name"]:<40} {"":>14}    {result["best_ns"]:14.1f} ns   new')
+			continue
+		ratio = result['best_ns'] / old['best_ns']
+		mark = ''
+		if ratio > args.threshold:
+			mark = '  slower'
+			regressions += 1
+		elif ratio < 1 / args.threshold:
+			mark = '  faster'
+		print(f'{result["group"]:<11} {result["name"]:<40} {old["best_ns"]:14.1f} -> {result["best_ns"]:14.1f} ns   x{ratio:.2f}{mark}')
+	raise SystemExit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+	main()
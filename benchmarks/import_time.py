@@ -0,0 +1,54 @@
+# Wall-clock cost of importing temporal in a fresh interpreter, minus the cost
+# of starting one. Run from the repository root:
+#
+#   python benchmarks/import_time.py [--repeat N] [--json]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+SCENARIOS = {
+	'import temporal': 'import temporal',
+	'PlainDate': 'from temporal import PlainDate',
+	'Instant': 'from temporal import Instant',
+	'Duration': 'from temporal import Duration',
+	'ZonedDateTime': 'from temporal import ZonedDateTime; ZonedDateTime.from_("2024-01-01T00:00[Europe/Warsaw]")',
+	'Now.instant': 'from temporal import Now; Now.instant()',
+	'Now.time_zone_id': 'from temporal import Now; Now.time_zone_id()',
+}
+
+
+def run(code: str, repeat: int, /) -> float:
+	env = {**os.environ, 'PYTHONPATH': SRC, 'PYTHONDONTWRITEBYTECODE': '1'}
+	timings: list[float] = []
+	for _ in range(repeat):
+		start = time.perf_counter()
+		subprocess.run([sys.executable, '-c', code], env = env, check = True)
+		timings.append(time.perf_counter() - start)
+	return statistics.median(timings)
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--repeat', type = int, default = 20)
+	parser.add_argument('--json', action = 'store_true')
+	args = parser.parse_args()
+
+	baseline = run('pass', args.repeat)
+	results = {name: (run(code, args.repeat) - baseline) * 1000 for name, code in SCENARIOS.items()}
+	if args.json:
+		print(json.dumps({'baseline_ms': baseline * 1000, 'import_ms': results}, indent = '\t'))
+		return
+	print(f'{"interpreter startup":<20} {baseline * 1000:8.1f} ms')
+	for name, milliseconds in results.items():
+		print(f'{name:<20} {milliseconds:8.1f} ms')
+
+
+if __name__ == '__main__':
+	main()
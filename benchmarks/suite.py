@@ -0,0 +1,210 @@
+# Micro-benchmarks for temporal next to the closest stdlib datetime/zoneinfo
+# equivalent. Run from the repository root:
+#
+#   python benchmarks/suite.py [--output results.json] [--filter TEXT] [--quick]
+#
+# Every case reports nanoseconds per call (best and median of several timeit
+# repeats). The JSON output also records the interpreter, platform and git
+# commit, so two runs can be diffed with benchmarks/compare.py.
+
+import argparse
+import bisect
+import datetime as py_datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import zoneinfo as py_zoneinfo
+from array import array
+from typing import Any, Callable, NamedTuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from temporal import Duration, Instant, InstantArray, InstantIndex, Now, PlainDate, PlainDateTime, PlainTime, TimeZone, ZonedDateTime, get_iso_fields_columns, tumbling_windows  # noqa: E402
+
+BULK = 10000
+
+
+class Case(NamedTuple):
+	group: str
+	name: str
+	function: Callable[[], Any]
+	# the stdlib code doing the same job, if there is one
+	baseline: Callable[[], Any] | None = None
+	# turns a mode on for the case and returns the function turning it off
+	setup: Callable[[], Callable[[], None]] | None = None
+
+
+def cases() -> list[Case]:
+	utc = py_datetime.timezone.utc
+	warsaw = py_zoneinfo.ZoneInfo('Europe/Warsaw')
+	time_zone = TimeZone('Europe/Warsaw')
+
+	instant = Instant.from_('2024-05-06T07:08:09.123456789Z')
+	plain_date = PlainDate(2024, 5, 6)
+	plain_time = PlainTime(7, 8, 9, 123, 456, 789)
+	plain_date_time = PlainDateTime(2024, 5, 6, 7, 8, 9, 123, 456, 789)
+	zoned_date_time = instant.to_zoned_date_time_iso(time_zone)
+	duration = Duration(0, 0, 0, 0, 1, 30)
+
+	py_instant = py_datetime.datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo = utc)
+	py_date = py_datetime.date(2024, 5, 6)
+	py_time = py_datetime.time(7, 8, 9, 123456)
+	py_naive = py_datetime.datetime(2024, 5, 6, 7, 8, 9, 123456)
+	py_zoned = py_instant.astimezone(warsaw)
+	py_delta = py_datetime.timedelta(hours = 1, minutes = 30)
+
+	instant_text = str(instant)
+	plain_date_text = str(plain_date)
+	plain_time_text = str(plain_time)
+	plain_date_time_text = str(plain_date_time)
+	zoned_date_time_text = str(zoned_date_time)
+	py_instant_text = py_instant.isoformat()
+	py_zoned_text = py_zoned.isoformat()
+
+	epoch_nanoseconds = [instant.epoch_nanoseconds + i * 1000003 for i in range(BULK)]
+	instants = [Instant(value) for value in epoch_nanoseconds]
+	instant_array = InstantArray.from_epoch_nanoseconds(epoch_nanoseconds)
+	instant_texts = [str(value) for value in instants[:1000]]
+	instant_bytes = Instant.to_bytes_many(instants)
+	py_instants = [py_datetime.datetime.fromtimestamp(value / 1e9, utc) for value in epoch_nanoseconds]
+	py_instant_texts = [value.isoformat() for value in py_instants[:1000]]
+	instant_index = InstantIndex(instant_array)
+	wall_nanoseconds = array('q', [value + 7200000000000 for value in epoch_nanoseconds])
+	py_naives = [value.replace(tzinfo = None) for value in py_instants]
+
+	def coarse_clock() -> Callable[[], None]:
+		# Coarse mode reads CLOCK_REALTIME_COARSE where there is one and reuses
+		# the Instant of the current tick.
+		Now.set_coarse_clock()
+		return lambda: Now.set_coarse_clock(None)
+
+	return [
+		# construction
+		Case('construct', 'Instant', lambda: Instant(1714979289123456789), lambda: py_datetime.datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo = utc)),
+		Case('construct', 'PlainDate', lambda: PlainDate(2024, 5, 6), lambda: py_datetime.date(2024, 5, 6)),
+		Case('construct', 'PlainTime', lambda: PlainTime(7, 8, 9, 123, 456, 789), lambda: py_datetime.time(7, 8, 9, 123456)),
+		Case('construct', 'PlainDateTime', lambda: PlainDateTime(2024, 5, 6, 7, 8, 9, 123, 456, 789), lambda: py_datetime.datetime(2024, 5, 6, 7, 8, 9, 123456)),
+		Case('construct', 'ZonedDateTime', lambda: ZonedDateTime(1714979289123456789, time_zone), lambda: py_datetime.datetime.fromtimestamp(1714979289.123456, warsaw)),
+		Case('construct', 'Duration', lambda: Duration(0, 0, 0, 0, 1, 30), lambda: py_datetime.timedelta(hours = 1, minutes = 30)),
+		Case('construct', 'TimeZone', lambda: TimeZone('Europe/Warsaw'), lambda: py_zoneinfo.ZoneInfo('Europe/Warsaw')),
+		# parsing
+		Case('parse', 'Instant.from_', lambda: Instant.from_(instant_text), lambda: py_datetime.datetime.fromisoformat(py_instant_text)),
+		Case('parse', 'PlainDate.from_', lambda: PlainDate.from_(plain_date_text), lambda: py_datetime.date.fromisoformat(plain_date_text)),
+		Case('parse', 'PlainTime.from_', lambda: PlainTime.from_(plain_time_text), lambda: py_datetime.time.fromisoformat(py_time.isoformat())),
+		Case('parse', 'PlainDateTime.from_', lambda: PlainDateTime.from_(plain_date_time_text), lambda: py_datetime.datetime.fromisoformat(py_naive.isoformat())),
+		Case('parse', 'ZonedDateTime.from_', lambda: ZonedDateTime.from_(zoned_date_time_text), lambda: py_datetime.datetime.fromisoformat(py_zoned_text).astimezone(warsaw)),
+		Case('parse', 'Duration.from_', lambda: Duration.from_('PT1H30M')),
+		# formatting
+		Case('format', 'str(Instant)', lambda: str(instant), lambda: py_instant.isoformat()),
+		Case('format', 'str(PlainDate)', lambda: str(plain_date), lambda: py_date.isoformat()),
+		Case('format', 'str(PlainTime)', lambda: str(plain_time), lambda: py_time.isoformat()),
+		Case('format', 'str(PlainDateTime)', lambda: str(plain_date_time), lambda: py_naive.isoformat()),
+		Case('format', 'str(ZonedDateTime)', lambda: str(zoned_date_time), lambda: py_zoned.isoformat()),
+		Case('format', 'Instant.to_string(smallest_unit)', lambda: instant.to_string(smallest_unit = 'millisecond'), lambda: py_instant.isoformat(timespec = 'milliseconds')),
+		Case('format', 'Instant.to_string(time_zone)', lambda: instant.to_string(time_zone = time_zone), lambda: py_instant.astimezone(warsaw).isoformat()),
+		Case('format', 'str(Duration)', lambda: str(duration), lambda: str(py_delta)),
+		# time zones
+		Case('zone', 'Instant.to_zoned_date_time_iso', lambda: instant.to_zoned_date_time_iso(time_zone), lambda: py_instant.astimezone(warsaw)),
+		Case('zone', 'TimeZone.get_offset_nanoseconds_for', lambda: time_zone.get_offset_nanoseconds_for(instant), lambda: warsaw.utcoffset(py_instant)),
+		Case('zone', 'TimeZone.get_plain_date_time_for', lambda: time_zone.get_plain_date_time_for(instant), lambda: py_instant.astimezone(warsaw).replace(tzinfo = None)),
+		# now
+		Case('now', 'Now.instant', Now.instant, lambda: py_datetime.datetime.now(utc)),
+		Case('now', 'Now.instant (coarse clock)', Now.instant, lambda: py_datetime.datetime.now(utc), coarse_clock),
+		Case('now', 'Now.zoned_date_time_iso', lambda: Now.zoned_date_time_iso(time_zone), lambda: py_datetime.datetime.now(warsaw)),
+		Case('now', 'Now.plain_date_iso', lambda: Now.plain_date_iso(time_zone), lambda: py_datetime.datetime.now(warsaw).date()),
+		Case('now', 'Now.time_zone_id', Now.time_zone_id),
+		# field access
+		Case('fields', 'PlainDate.year', lambda: plain_date.year, lambda: py_date.year),
+		Case('fields', 'PlainDate.month', lambda: plain_date.month, lambda: py_date.month),
+		Case('fields', 'PlainDate.day', lambda: plain_date.day, lambda: py_date.day),
+		Case('fields', 'PlainDate.day_of_week', lambda: plain_date.day_of_week, lambda: py_date.isoweekday()),
+		Case('fields', 'PlainDate.week_of_year', lambda: plain_date.week_of_year, lambda: py_date.isocalendar()[1]),
+		Case('fields', 'PlainDateTime.hour', lambda: plain_date_time.hour, lambda: py_naive.hour),
+		Case('fields', 'PlainDateTime.get_iso_fields', plain_date_time.get_iso_fields),
+		Case('fields', 'ZonedDateTime.hour', lambda: zoned_date_time.hour, lambda: py_zoned.hour),
+		Case('fields', 'ZonedDateTime.offset', lambda: zoned_date_time.offset, lambda: py_zoned.utcoffset()),
+		# arithmetic
+		Case('arithmetic', 'Instant.add', lambda: instant.add(duration), lambda: py_instant + py_delta),
+		Case('arithmetic', 'Instant.until', lambda: instant.until(zoned_date_time), lambda: py_zoned - py_instant),
+		Case('arithmetic', 'ZonedDateTime.add', lambda: zoned_date_time.add(duration), lambda: (py_zoned.astimezone(utc) + py_delta).astimezone(warsaw)),
+		Case('arithmetic', 'Instant.compare', lambda: instant < instants[1], lambda: py_instant < py_instants[1]),
+		Case('arithmetic', 'InstantIndex.asof', lambda: instant_index.asof(zoned_date_time), lambda: py_instants[bisect.bisect_right(py_instants, py_zoned) - 1]),
+		Case('arithmetic', 'Duration.total', lambda: duration.total('second'), lambda: py_delta.total_seconds()),
+		# bulk, per 10000 values unless noted
+		Case('bulk', 'InstantArray.from_epoch_nanoseconds', lambda: InstantArray.from_epoch_nanoseconds(epoch_nanoseconds), lambda: [py_datetime.datetime.fromtimestamp(value / 1e9, utc) for value in epoch_nanoseconds]),
+		Case('bulk', 'Instant.from_iter (1000)', lambda: list(Instant.from_iter(instant_texts)), lambda: [py_datetime.datetime.fromisoformat(text) for text in py_instant_texts]),
+		Case('bulk', 'InstantArray.sorted', lambda: instant_array.sorted(reverse = True), lambda: sorted(py_instants, reverse = True)),
+		Case('bulk', 'InstantArray.until', lambda: instant_array.until(instant), lambda: [py_instant - value for value in py_instants]),
+		Case('bulk', 'InstantArray.get_iso_fields', lambda: instant_array.get_iso_fields(time_zone), lambda: [value.astimezone(warsaw).timetuple() for value in py_instants]),
+		Case('bulk', 'get_iso_fields_columns', lambda: get_iso_fields_columns(instants, time_zone)),
+		Case('bulk', 'TimeZone.get_instants_for', lambda: time_zone.get_instants_for(wall_nanoseconds), lambda: [value.replace(tzinfo = warsaw) for value in py_naives]),
+		Case('bulk', 'tumbling_windows (day)', lambda: list(tumbling_windows(instant_array, time_zone, 'day')), lambda: [(value.astimezone(warsaw).date(), value) for value in py_instants]),
+		Case('bulk', 'Instant.to_bytes_many', lambda: Instant.to_bytes_many(instants)),
+		Case('bulk', 'Instant.from_bytes_iter', lambda: list(Instant.from_bytes_iter(instant_bytes))),
+	]
+
+
+def measure(function: Callable[[], Any], repeat: int, minimum_seconds: float, /) -> dict[str, float]:
+	timer = timeit.Timer(function)
+	number = 1
+	while True:
+		if timer.timeit(number) >= minimum_seconds:
+			break
+		number *= 10
+	timings = [timing / number * 1e9 for timing in timer.repeat(repeat, number)]
+	return {'best_ns': min(timings), 'median_ns': statistics.median(timings), 'loops': number}
+
+
+def git_commit() -> str | None:
+	try:
+		return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd = ROOT, capture_output = True, text = True, check = True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--output', help = 'write the results as JSON to this file')
+	parser.add_argument('--filter', default = '', help = 'only run cases whose group or name contains this text')
+	parser.add_argument('--quick', action = 'store_true', help = 'fewer and shorter repeats, for smoke testing')
+	args = parser.parse_args()
+	repeat, minimum_seconds = (3, 0.02) if args.quick else (7, 0.2)
+
+	results: list[dict[str, Any]] = []
+	for case in cases():
+		if args.filter not in f'{case.group} {case.name}':
+			continue
+		teardown = case.setup() if case.setup is not None else None
+		try:
+			result: dict[str, Any] = {'group': case.group, 'name': case.name, **measure(case.function, repeat, minimum_seconds)}
+		finally:
+			if teardown is not None:
+				teardown()
+		line = f'{case.group:<11} {case.name:<40} {result["best_ns"]:14.1f} ns'
+		if case.baseline is not None:
+			result['baseline'] = measure(case.baseline, repeat, minimum_seconds)
+			line += f'   stdlib {result["baseline"]["best_ns"]:14.1f} ns   x{result["best_ns"] / result["baseline"]["best_ns"]:.2f}'
+		print(line, flush = True)
+		results.append(result)
+
+	if args.output:
+		report = {
+			'commit': git_commit(),
+			'python': sys.version,
+			'implementation': platform.python_implementation(),
+			'platform': platform.platform(),
+			'machine': platform.machine(),
+			'results': results,
+		}
+		with open(args.output, 'w') as file:
+			json.dump(report, file, indent = '\t')
+			file.write('\n')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,103 @@
+# Multithreaded stress test: every thread runs the same mix of cached and
+# lazily computed operations on shared objects, checks each result against a
+# single-threaded reference and reports the throughput for each thread count.
+# On a free-threaded build (python3.13t) throughput should grow with the
+# cores; with the GIL it stays flat. Run from the repository root:
+#
+#   python benchmarks/threads.py [--threads 1,2,4,8] [--iterations N] [--json]
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from temporal import Instant, PlainDateTime, TimeZone, ZonedDateTime  # noqa: E402
+
+ZONES = ['Europe/Warsaw', 'America/New_York', 'Asia/Kolkata', 'Australia/Lord_Howe', 'UTC']
+SAMPLES = 64
+
+
+def gil_enabled() -> bool:
+	is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+	return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def workload(epoch_nanoseconds: list[int], /) -> list[object]:
+	# One pass over the samples. The ZonedDateTimes are shared between the
+	# threads, so their wall-clock fields are first computed concurrently.
+	zoned_date_times = [ZonedDateTime(value, TimeZone(ZONES[i % len(ZONES)])) for i, value in enumerate(epoch_nanoseconds)]
+	return shared_workload(zoned_date_times)
+
+
+def shared_workload(zoned_date_times: list[ZonedDateTime], /) -> list[object]:
+	results: list[object] = []
+	for zoned_date_time in zoned_date_times:
+		time_zone = TimeZone(zoned_date_time.time_zone_id)
+		results.append(time_zone is zoned_date_time._time_zone)
+		results.append(zoned_date_time.hour)
+		results.append(str(zoned_date_time))
+		results.append(zoned_date_time.to_string(smallest_unit = 'millisecond'))
+		results.append(Instant.from_(str(Instant(zoned_date_time.epoch_nanoseconds))).epoch_nanoseconds)
+		results.append(time_zone.get_instant_for(PlainDateTime(2024, 3, 31, 2, 30)).epoch_nanoseconds)
+	return results
+
+
+def run(threads: int, iterations: int, epoch_nanoseconds: list[int], expected: list[object], /) -> dict[str, float]:
+	errors: list[str] = []
+	barrier = threading.Barrier(threads + 1)
+
+	def worker():
+		barrier.wait()
+		for _ in range(iterations):
+			if workload(epoch_nanoseconds) != expected:
+				errors.append('private objects')
+		# the same fresh objects in every thread at once
+		shared_barrier.wait()
+		if shared_workload(shared) != expected:
+			errors.append('shared objects')
+
+	shared = [ZonedDateTime(value, TimeZone(ZONES[i % len(ZONES)])) for i, value in enumerate(epoch_nanoseconds)]
+	shared_barrier = threading.Barrier(threads)
+	workers = [threading.Thread(target = worker) for _ in range(threads)]
+	for thread in workers:
+		thread.start()
+	barrier.wait()
+	start = time.perf_counter()
+	for thread in workers:
+		thread.join()
+	elapsed = time.perf_counter() - start
+	if errors:
+		raise AssertionError(f'{threads} threads: wrong results from {", ".join(sorted(set(errors)))}')
+	operations = threads * (iterations + 1) * len(epoch_nanoseconds)
+	return {'threads': threads, 'seconds': elapsed, 'operations_per_second': operations / elapsed}
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	default_threads = sorted({1, 2, 4, os.cpu_count() or 1})
+	parser.add_argument('--threads', default = ','.join(map(str, default_threads)))
+	parser.add_argument('--iterations', type = int, default = 200)
+	parser.add_argument('--json', action = 'store_true')
+	args = parser.parse_args()
+
+	epoch_nanoseconds = [1711846800000000000 + i * 3600000000123 for i in range(SAMPLES)]
+	expected = workload(epoch_nanoseconds)
+	results = [run(threads, args.iterations, epoch_nanoseconds, expected) for threads in map(int, args.threads.split(','))]
+	single = results[0]['operations_per_second'] / results[0]['threads']
+	for result in results:
+		result['speedup'] = result['operations_per_second'] / single
+	if args.json:
+		print(json.dumps({'python': sys.version, 'gil_enabled': gil_enabled(), 'cpu_count': os.cpu_count(), 'results': results}, indent = '\t'))
+		return
+	print(f'python {sys.version.split()[0]}, GIL {"enabled" if gil_enabled() else "disabled"}, {os.cpu_count()} CPUs')
+	for result in results:
+		print(f'{result["threads"]:>3} threads  {result["operations_per_second"]:12.0f} samples/s  x{result["speedup"]:.2f}')
+
+
+if __name__ == '__main__':
+	main()
@@ -1,10 +1,61 @@
 # isort: skip_file
-__all__ = ['PlainDate', 'PlainTime', 'PlainDateTime', 'TimeZone', 'ZonedDateTime', 'Instant', 'Now']
-
-from ._zoned_date_time import ZonedDateTime
-from ._plain_date_time import PlainDateTime
-from ._plain_date import PlainDate
-from ._plain_time import PlainTime
-from ._time_zone import TimeZone
-from ._instant import Instant
-from ._now import Now
+__all__ = ['PlainDate', 'PlainTime', 'PlainDateTime', 'TimeZone', 'ZonedDateTime', 'Instant', 'InstantArray', 'InstantIndex', 'IndexEntry', 'Duration', 'DurationArray', 'Now', 'ISOFieldsColumns', 'get_iso_fields_columns', 'Window', 'tumbling_windows', 'sliding_windows', 'date_range', 'recurrence', 'ResolvedInstants']
+
+# The public names are imported on first access, so `import temporal` stays
+# cheap for programs that only use a part of it.
+_MODULES = {
+	'ZonedDateTime': '_zoned_date_time',
+	'PlainDateTime': '_plain_date_time',
+	'PlainDate': '_plain_date',
+	'PlainTime': '_plain_time',
+	'TimeZone': '_time_zone',
+	'Instant': '_instant',
+	'InstantArray': '_instant_array',
+	'InstantIndex': '_instant_index',
+	'IndexEntry': '_instant_index',
+	'Duration': '_duration',
+	'DurationArray': '_duration_array',
+	'Now': '_now',
+	'ISOFieldsColumns': '_iso_columns',
+	'get_iso_fields_columns': '_iso_columns',
+	'Window': '_windows',
+	'tumbling_windows': '_windows',
+	'sliding_windows': '_windows',
+	'date_range': '_recurrence',
+	'recurrence': '_recurrence',
+	'ResolvedInstants': '_time_zone',
+}
+
+# not typing.TYPE_CHECKING, importing typing would cost more than the rest of this
+# file; type checkers go by the name, and it is deleted again below
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from ._zoned_date_time import ZonedDateTime
+	from ._plain_date_time import PlainDateTime
+	from ._plain_date import PlainDate
+	from ._plain_time import PlainTime
+	from ._time_zone import ResolvedInstants, TimeZone
+	from ._instant import Instant
+	from ._instant_array import InstantArray
+	from ._instant_index import IndexEntry, InstantIndex
+	from ._duration import Duration
+	from ._duration_array import DurationArray
+	from ._now import Now
+	from ._iso_columns import ISOFieldsColumns, get_iso_fields_columns
+	from ._recurrence import date_range, recurrence
+	from ._windows import Window, sliding_windows, tumbling_windows
+del TYPE_CHECKING
+
+
+def __getattr__(name: str):
+	module = _MODULES.get(name)
+	if module is None:
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+	from importlib import import_module
+	value = getattr(import_module(f'.{module}', __name__), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__():
+	return sorted({*globals(), *__all__})
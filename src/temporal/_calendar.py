@@ -0,0 +1,154 @@
+__all__ = [
+	'is_leap_year',
+	'days_in_month',
+	'day_of_year',
+	'day_of_week',
+	'iso_week',
+	'epoch_days_from_iso',
+	'iso_from_epoch_days',
+	'iso_date_time_from_epoch_nanoseconds',
+	'epoch_nanoseconds_from_iso_date_time',
+	'add_iso_date',
+	'difference_iso_date',
+]
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# days before the first of each month, for common and leap years
+_DAYS_BEFORE_MONTH = (
+	(0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334),
+	(0, 0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335),
+)
+
+
+def is_leap_year(year: int, /) -> bool:
+	return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year: int, month: int, /) -> int:
+	if month == 2 and is_leap_year(year):
+		return 29
+	return _DAYS_IN_MONTH[month]
+
+
+def day_of_year(year: int, month: int, day: int, /) -> int:
+	return _DAYS_BEFORE_MONTH[is_leap_year(year)][month] + day
+
+
+def day_of_week(epoch_days: int, /) -> int:
+	# ISO numbering, Monday is 1; 1970-01-01 was a Thursday
+	return (epoch_days + 3) % 7 + 1
+
+
+def _december_31_weekday(year: int, /) -> int:
+	# Sunday is 0
+	return (year + year // 4 - year // 100 + year // 400) % 7
+
+
+def _weeks_in_year(year: int, /) -> int:
+	# 53 when the year starts on a Thursday, or is a leap year starting on a Wednesday
+	return 53 if _december_31_weekday(year) == 4 or _december_31_weekday(year - 1) == 3 else 52
+
+
+def iso_week(year: int, month: int, day: int, epoch_days: int, /) -> tuple[int, int]:
+	# (year of week, week of year) of the ISO week date
+	week = (day_of_year(year, month, day) - day_of_week(epoch_days) + 10) // 7
+	if week < 1:
+		return year - 1, _weeks_in_year(year - 1)
+	if week > _weeks_in_year(year):
+		return year + 1, 1
+	return year, week
+
+
+# Proleptic Gregorian <-> days since 1970-01-01, counted in 400-year eras
+# that start on March 1st so that the leap day is the last day of the year.
+# http://howardhinnant.github.io/date_algorithms.html
+
+
+def epoch_days_from_iso(year: int, month: int, day: int, /) -> int:
+	if month <= 2:
+		year -= 1
+	era, year_of_era = divmod(year, 400)
+	day_of_year = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+	day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+	return era * 146097 + day_of_era - 719468
+
+
+def iso_from_epoch_days(epoch_days: int, /) -> tuple[int, int, int]:
+	era, day_of_era = divmod(epoch_days + 719468, 146097)
+	year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+	day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+	mp = (5 * day_of_year + 2) // 153
+	day = day_of_year - (153 * mp + 2) // 5 + 1
+	month = mp + 3 if mp < 10 else mp - 9
+	year = era * 400 + year_of_era + (month <= 2)
+	return year, month, day
+
+
+def iso_date_time_from_epoch_nanoseconds(epoch_nanoseconds: int, /) -> tuple[int, int, int, int, int, int, int, int, int]:
+	days, nanoseconds = divmod(epoch_nanoseconds, 86400000000000)
+	year, month, day = iso_from_epoch_days(days)
+	seconds, nanoseconds = divmod(nanoseconds, 1000000000)
+	milliseconds, nanoseconds = divmod(nanoseconds, 1000000)
+	microseconds, nanoseconds = divmod(nanoseconds, 1000)
+	return year, month, day, seconds // 3600, seconds // 60 % 60, seconds % 60, milliseconds, microseconds, nanoseconds
+
+
+def epoch_nanoseconds_from_iso_date_time(year: int, month: int, day: int, hour: int, minute: int, second: int, millisecond: int, microsecond: int, nanosecond: int, /) -> int:
+	return (epoch_days_from_iso(year, month, day) * 86400 + hour * 3600 + minute * 60 + second) * 1000000000 + millisecond * 1000000 + microsecond * 1000 + nanosecond
+
+
+def _add_months(year: int, month: int, months: int, /) -> tuple[int, int]:
+	year, month = divmod(year * 12 + month - 1 + months, 12)
+	return year, month + 1
+
+
+def add_iso_date(year: int, month: int, day: int, years: int, months: int, weeks: int, days: int, overflow: str, /) -> int:
+	# Epoch days of a date plus a duration. Years and months move the month and
+	# keep the day, clamped to the end of a shorter month unless overflow is
+	# 'reject'; weeks and days are added after that.
+	year, month = _add_months(year, month, years * 12 + months)
+	length = days_in_month(year, month)
+	if day > length:
+		if overflow == 'reject':
+			raise ValueError(f'invalid date: {year}-{month}-{day}')
+		day = length
+	return epoch_days_from_iso(year, month, day) + weeks * 7 + days
+
+
+def difference_iso_date(one: tuple[int, int, int], two: tuple[int, int, int], largest_unit: str, /) -> tuple[int, int, int, int]:
+	# (years, months, weeks, days) from one to two, as in Temporal: the most
+	# whole years and months that do not pass two, counted with the day of one
+	# before clamping it to the month, and the days left after that.
+	sign = (two > one) - (two < one)
+	if not sign:
+		return 0, 0, 0, 0
+	if largest_unit in ('year', 'month'):
+		year, month, day = one
+		years = 0
+		candidate = two[0] - year
+		if candidate:
+			candidate -= sign
+		while not _surpasses(sign, (year + candidate, month, day), two):
+			years = candidate
+			candidate += sign
+		months = 0
+		candidate = sign
+		while not _surpasses(sign, (*_add_months(year + years, month, candidate), day), two):
+			months = candidate
+			candidate += sign
+		if largest_unit == 'month':
+			months += years * 12
+			years = 0
+		year, month = _add_months(year + years, month, months)
+		days = epoch_days_from_iso(*two) - epoch_days_from_iso(year, month, min(day, days_in_month(year, month)))
+		return years, months, 0, days
+	days = epoch_days_from_iso(*two) - epoch_days_from_iso(*one)
+	if largest_unit == 'week':
+		weeks, days = divmod(days * sign, 7)
+		return 0, 0, weeks * sign, days * sign
+	return 0, 0, 0, days
+
+
+def _surpasses(sign: int, date: tuple[int, int, int], two: tuple[int, int, int], /) -> bool:
+	return date > two if sign > 0 else date < two
@@ -0,0 +1,27 @@
+from importlib import import_module
+from typing import Any
+
+__all__ = ['deferred_module']
+
+
+class _DeferredModule:
+	# Stands in for a sibling module in the globals of a module that only uses
+	# it inside functions. The first attribute read imports the module and puts
+	# it in place of this object, so later reads are plain module lookups.
+	__slots__ = ('_namespace', '_name')
+
+	def __init__(self, namespace: dict[str, Any], name: str, /):
+		self._namespace = namespace
+		self._name = name
+
+	def __getattr__(self, attribute: str, /) -> Any:
+		module = import_module(f'.{self._name}', __package__)
+		self._namespace[self._name] = module
+		return getattr(module, attribute)
+
+
+def deferred_module(namespace: dict[str, Any], name: str, /) -> Any:
+	# The core modules refer to each other both ways; importing those references
+	# on first use, instead of at the end of each module, keeps the cycle from
+	# loading every module whenever one of them is imported.
+	return _DeferredModule(namespace, name)
@@ -1,14 +1,432 @@
-from dataclasses import dataclass
-from typing import Self
+from dataclasses import FrozenInstanceError
+from typing import Any, Literal, Self
 
+from ._formatter import format_plan
+from ._parser import parse_duration
+from ._rounding import ROUNDING_MODES, RoundingMode, round_to_increment
 
-@dataclass
-class Duration:
-	...
+__all__ = ['Duration', 'difference_settings', 'round_settings']
+
+Unit = Literal['year', 'month', 'week', 'day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond']
+
+_UNITS = ('year', 'month', 'week', 'day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond')
+_UNIT_INDEX = {unit: index for index, unit in enumerate(_UNITS)}
+_DAY_INDEX = 3
+_SECOND_INDEX = 6
+
+_UNIT_NANOSECONDS = {
+	'day': 86400000000000,
+	'hour': 3600000000000,
+	'minute': 60000000000,
+	'second': 1000000000,
+	'millisecond': 1000000,
+	'microsecond': 1000,
+	'nanosecond': 1,
+}
+
+# how many of each unit make up the next larger one, from hours per day down
+_UNIT_SIZES = (24, 60, 60, 1000, 1000, 1000)
+
+_MAXIMUM_INCREMENT = {'hour': 24, 'minute': 60, 'second': 60, 'millisecond': 1000, 'microsecond': 1000, 'nanosecond': 1000}
+
+# Instant.round takes any increment that divides a 24-hour day, up to a whole day
+_INSTANT_MAXIMUM_INCREMENT = {unit: 86400000000000 // _UNIT_NANOSECONDS[unit] for unit in _MAXIMUM_INCREMENT}
+
+# Temporal's limits: calendar fields below 2**32, the rest below 2**53 seconds
+_MAX_CALENDAR_FIELD = 2**32
+_MAX_NANOSECONDS = 2**53 * 1000000000
+
+
+def _balance(nanoseconds: int, largest_unit_index: int, /) -> list[int]:
+	# Splits an exact nanosecond count into days..nanoseconds, with nothing
+	# above `largest_unit_index` (an index into _UNITS, day or smaller).
+	fields = [0] * 7
+	remainder = -nanoseconds if nanoseconds < 0 else nanoseconds
+	for index in range(6, largest_unit_index - _DAY_INDEX, -1):
+		remainder, fields[index] = divmod(remainder, _UNIT_SIZES[index - 1])
+	fields[largest_unit_index - _DAY_INDEX] = remainder
+	if nanoseconds < 0:
+		return [-field for field in fields]
+	return fields
+
+
+def _validate(fields: tuple[int, ...], /) -> tuple[int, int]:
+	# returns the normalized time part and the sign
+	sign = 0
+	for field in fields:
+		if type(field) is not int:
+			raise TypeError(f'Duration fields must be integers: {field!r}')
+		if field:
+			field_sign = 1 if field > 0 else -1
+			if sign and field_sign != sign:
+				raise ValueError(f'Duration fields must not have mixed signs: {fields}')
+			sign = field_sign
+	years, months, weeks, days, hours, minutes, seconds, milliseconds, microseconds, nanoseconds = fields
+	if abs(years) >= _MAX_CALENDAR_FIELD or abs(months) >= _MAX_CALENDAR_FIELD or abs(weeks) >= _MAX_CALENDAR_FIELD:
+		raise ValueError(f'Duration out of range: {fields}')
+	time_nanoseconds = ((hours * 60 + minutes) * 60 + seconds) * 1000000000 + milliseconds * 1000000 + microseconds * 1000 + nanoseconds
+	if abs(days * 86400000000000 + time_nanoseconds) >= _MAX_NANOSECONDS:
+		raise ValueError(f'Duration out of range: {fields}')
+	return time_nanoseconds, sign
+
+
+def _unit_index(unit: str, name: str, /) -> int:
+	try:
+		return _UNIT_INDEX[unit]
+	except KeyError:
+		raise ValueError(f'invalid {name}: {unit!r}') from None
+
+
+def _rounding_increment_nanoseconds(unit: str, rounding_increment: int, rounding_mode: RoundingMode, /) -> int:
+	if rounding_mode not in ROUNDING_MODES:
+		raise ValueError(f'invalid rounding mode: {rounding_mode!r}')
+	maximum = _MAXIMUM_INCREMENT.get(unit)
+	if type(rounding_increment) is not int or rounding_increment < 1 or maximum is not None and (rounding_increment >= maximum or maximum % rounding_increment):
+		raise ValueError(f'invalid rounding increment for {unit!r}: {rounding_increment!r}')
+	return rounding_increment * _UNIT_NANOSECONDS[unit]
+
+
+def difference_settings(
+	largest_unit: str,
+	smallest_unit: str,
+	rounding_increment: int,
+	rounding_mode: RoundingMode,
+	/,
+) -> tuple[Unit, int]:
+	# Validates until/since options for differences of exact times, which go
+	# from hours down; returns the largest unit and the increment in nanoseconds.
+	smallest_unit_index = _unit_index(smallest_unit, 'smallest unit')
+	if largest_unit == 'auto':
+		largest_unit_index = min(_SECOND_INDEX, smallest_unit_index)
+	else:
+		largest_unit_index = _unit_index(largest_unit, 'largest unit')
+	if smallest_unit_index <= _DAY_INDEX or largest_unit_index <= _DAY_INDEX:
+		raise ValueError(f'units must be hours or smaller: {largest_unit!r}, {smallest_unit!r}')
+	if largest_unit_index > smallest_unit_index:
+		raise ValueError(f'largest unit {largest_unit!r} is smaller than smallest unit {smallest_unit!r}')
+	return _UNITS[largest_unit_index], _rounding_increment_nanoseconds(smallest_unit, rounding_increment, rounding_mode)  # type: ignore
+
+
+def round_settings(
+	smallest_unit: str,
+	rounding_increment: int,
+	rounding_mode: RoundingMode,
+	kind: Literal['instant', 'time', 'date_time'],
+	/,
+) -> int:
+	# Validates round() options for points in time; returns the increment in
+	# nanoseconds. Only date-times round to whole days, one at a time.
+	if rounding_mode not in ROUNDING_MODES:
+		raise ValueError(f'invalid rounding mode: {rounding_mode!r}')
+	if smallest_unit == 'day' and kind == 'date_time':
+		if rounding_increment != 1:
+			raise ValueError(f"invalid rounding increment for 'day': {rounding_increment!r}")
+		return 86400000000000
+	if smallest_unit not in _MAXIMUM_INCREMENT:
+		raise ValueError(f'invalid smallest unit: {smallest_unit!r}')
+	if kind != 'instant':
+		return _rounding_increment_nanoseconds(smallest_unit, rounding_increment, rounding_mode)
+	maximum = _INSTANT_MAXIMUM_INCREMENT[smallest_unit]
+	if type(rounding_increment) is not int or not 1 <= rounding_increment <= maximum or maximum % rounding_increment:
+		raise ValueError(f'invalid rounding increment for {smallest_unit!r}: {rounding_increment!r}')
+	return rounding_increment * _UNIT_NANOSECONDS[smallest_unit]
+
+
+class _DurationBase:
+	__slots__ = ('_fields', '_time_nanoseconds', '_sign')
+
+	# _fields: years, months, weeks, days, hours, minutes, seconds, milliseconds, microseconds, nanoseconds
+	# _time_nanoseconds: hours..nanoseconds as one exact total, computed once
+	_fields: tuple[int, int, int, int, int, int, int, int, int, int]
+	_time_nanoseconds: int
+	_sign: int
+
+	def __setattr__(self, name: str, value: Any, /):
+		raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+	def __delattr__(self, name: str, /):
+		raise FrozenInstanceError(f'cannot delete field {name!r}')
+
+	@classmethod
+	def _new(cls, fields: tuple[int, ...], time_nanoseconds: int, sign: int, /) -> Self:
+		# Skips validation, for callers that derive `fields` from a valid Duration.
+		self = object.__new__(cls)
+		_set_fields(self, fields)
+		_set_time_nanoseconds(self, time_nanoseconds)
+		_set_sign(self, sign)
+		return self
+
+	@classmethod
+	def _from_fields(cls, fields: tuple[int, ...], /) -> Self:
+		return cls._new(fields, *_validate(fields))
+
+	@classmethod
+	def _from_nanoseconds(cls, nanoseconds: int, largest_unit: Unit = 'hour', /) -> Self:
+		# Balances an exact nanosecond count, e.g. a difference of two instants.
+		return cls._from_fields((0, 0, 0, *_balance(nanoseconds, _UNIT_INDEX[largest_unit])))
+
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._fields == other._fields  # type: ignore
+
+	def __hash__(self) -> int:
+		return hash(self._fields)
+
+	def __reduce__(self):
+		return (type(self), self._fields)
+
+	def __copy__(self) -> Self:
+		return self
+
+	def __deepcopy__(self, memo: dict[int, Any], /) -> Self:
+		return self
+
+
+_set_fields = _DurationBase._fields.__set__  # type: ignore
+_set_time_nanoseconds = _DurationBase._time_nanoseconds.__set__  # type: ignore
+_set_sign = _DurationBase._sign.__set__  # type: ignore
+
+
+class Duration(_DurationBase):
+	__slots__ = ()
+
+	def __init__(
+		self,
+		years: int = 0,
+		months: int = 0,
+		weeks: int = 0,
+		days: int = 0,
+		hours: int = 0,
+		minutes: int = 0,
+		seconds: int = 0,
+		milliseconds: int = 0,
+		microseconds: int = 0,
+		nanoseconds: int = 0,
+		/,
+	):
+		fields = (years, months, weeks, days, hours, minutes, seconds, milliseconds, microseconds, nanoseconds)
+		time_nanoseconds, sign = _validate(fields)
+		_set_fields(self, fields)
+		_set_time_nanoseconds(self, time_nanoseconds)
+		_set_sign(self, sign)
 
 	@classmethod
 	def from_(cls, thing: 'Duration | str', /) -> Self:
+		if thing.__class__ is cls:
+			return thing  # type: ignore
 		if isinstance(thing, Duration):
-			return cls()
-		# TODO parse
-		return cls()
+			return cls._new(thing._fields, thing._time_nanoseconds, thing._sign)
+		return cls._from_fields(parse_duration(thing))
+
+	@staticmethod
+	def compare(one: 'Duration | str', two: 'Duration | str', /) -> Literal[-1, 0, 1]:
+		if not isinstance(one, Duration):
+			one = Duration.from_(one)
+		if not isinstance(two, Duration):
+			two = Duration.from_(two)
+		difference = one._total_nanoseconds('compare') - two._total_nanoseconds('compare')
+		return 1 if difference > 0 else -1 if difference < 0 else 0
+
+	def with_(
+		self,
+		/,
+		*,
+		years: int | None = None,
+		months: int | None = None,
+		weeks: int | None = None,
+		days: int | None = None,
+		hours: int | None = None,
+		minutes: int | None = None,
+		seconds: int | None = None,
+		milliseconds: int | None = None,
+		microseconds: int | None = None,
+		nanoseconds: int | None = None,
+	) -> Self:
+		changes = (years, months, weeks, days, hours, minutes, seconds, milliseconds, microseconds, nanoseconds)
+		return self._from_fields(tuple(field if change is None else change for field, change in zip(self._fields, changes)))
+
+	@property
+	def years(self) -> int:
+		return self._fields[0]
+
+	@property
+	def months(self) -> int:
+		return self._fields[1]
+
+	@property
+	def weeks(self) -> int:
+		return self._fields[2]
+
+	@property
+	def days(self) -> int:
+		return self._fields[3]
+
+	@property
+	def hours(self) -> int:
+		return self._fields[4]
+
+	@property
+	def minutes(self) -> int:
+		return self._fields[5]
+
+	@property
+	def seconds(self) -> int:
+		return self._fields[6]
+
+	@property
+	def milliseconds(self) -> int:
+		return self._fields[7]
+
+	@property
+	def microseconds(self) -> int:
+		return self._fields[8]
+
+	@property
+	def nanoseconds(self) -> int:
+		return self._fields[9]
+
+	@property
+	def sign(self) -> Literal[-1, 0, 1]:
+		return self._sign  # type: ignore
+
+	@property
+	def blank(self) -> bool:
+		return not self._sign
+
+	@property
+	def _has_calendar_units(self) -> bool:
+		fields = self._fields
+		return bool(fields[0] or fields[1] or fields[2])
+
+	@property
+	def _default_largest_unit_index(self) -> int:
+		for index, field in enumerate(self._fields):
+			if field:
+				return index
+		return 9
+
+	def _total_nanoseconds(self, operation: str, /) -> int:
+		# Without a starting point days are exactly 24 hours, as in Temporal,
+		# but years, months and weeks have no fixed length.
+		if self._has_calendar_units:
+			raise ValueError(f'cannot {operation} a Duration with years, months or weeks without a starting point: {self}')
+		return self._fields[3] * 86400000000000 + self._time_nanoseconds
+
+	def negated(self) -> Self:
+		return self._new(tuple(-field for field in self._fields), -self._time_nanoseconds, -self._sign)
+
+	def abs(self) -> Self:
+		if self._sign < 0:
+			return self.negated()
+		return self
+
+	def add(self, other: 'Duration | str', /) -> 'Duration':
+		if not isinstance(other, Duration):
+			other = Duration.from_(other)
+		nanoseconds = self._total_nanoseconds('add') + other._total_nanoseconds('add')
+		largest_unit_index = min(self._default_largest_unit_index, other._default_largest_unit_index)
+		return Duration._from_fields((0, 0, 0, *_balance(nanoseconds, largest_unit_index)))
+
+	def subtract(self, other: 'Duration | str', /) -> 'Duration':
+		if not isinstance(other, Duration):
+			other = Duration.from_(other)
+		return self.add(other.negated())
+
+	def round(
+		self,
+		/,
+		smallest_unit: Literal['day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] | None = None,
+		*,
+		largest_unit: Literal['auto', 'day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] | None = None,
+		rounding_increment: int = 1,
+		rounding_mode: RoundingMode = 'halfExpand',
+	) -> 'Duration':
+		if smallest_unit is None and largest_unit is None:
+			raise ValueError('at least one of smallest_unit and largest_unit is required')
+		smallest_unit_index = _unit_index(smallest_unit or 'nanosecond', 'smallest unit')
+		if largest_unit is None or largest_unit == 'auto':
+			largest_unit_index = min(self._default_largest_unit_index, smallest_unit_index)
+		else:
+			largest_unit_index = _unit_index(largest_unit, 'largest unit')
+		if smallest_unit_index < _DAY_INDEX or largest_unit_index < _DAY_INDEX:
+			raise ValueError('cannot round to years, months or weeks without a starting point')
+		if largest_unit_index > smallest_unit_index:
+			raise ValueError(f'largest unit {_UNITS[largest_unit_index]!r} is smaller than smallest unit {_UNITS[smallest_unit_index]!r}')
+		increment = _rounding_increment_nanoseconds(_UNITS[smallest_unit_index], rounding_increment, rounding_mode)
+		nanoseconds = round_to_increment(self._total_nanoseconds('round'), increment, rounding_mode)
+		return Duration._from_fields((0, 0, 0, *_balance(nanoseconds, largest_unit_index)))
+
+	def total(self, unit: Literal['day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'], /) -> float:
+		unit_index = _unit_index(unit, 'unit')
+		if unit_index < _DAY_INDEX:
+			raise ValueError('cannot total years, months or weeks without a starting point')
+		# int / int is correctly rounded, however large the total
+		return self._total_nanoseconds('total') / _UNIT_NANOSECONDS[unit]
+
+	def to_string(
+		self,
+		/,
+		*,
+		fractional_second_digits: Literal['auto', 0, 1, 2, 3, 4, 5, 6, 7, 8, 9] = 'auto',
+		smallest_unit: Literal['second', 'millisecond', 'microsecond', 'nanosecond'] | None = None,
+		rounding_mode: RoundingMode = 'trunc',
+	) -> str:
+		if smallest_unit in ('hour', 'minute'):
+			raise ValueError(f'invalid smallest unit: {smallest_unit!r}')
+		increment = format_plan(fractional_second_digits, smallest_unit, rounding_mode).increment
+		if smallest_unit is None and fractional_second_digits == 'auto':
+			return self._format(self._fields, None)
+		digits = 10 - len(str(increment))
+		if increment == 1:
+			return self._format(self._fields, digits)
+		# Only the time part is rounded, as if the duration were signed nanoseconds,
+		# and then balanced up to at least seconds; days only take any carry.
+		time_nanoseconds = round_to_increment(self._time_nanoseconds, increment, rounding_mode)
+		largest_unit_index = min(self._default_largest_unit_index, _SECOND_INDEX)
+		balanced = _balance(time_nanoseconds, max(largest_unit_index, _DAY_INDEX))
+		years, months, weeks, days = self._fields[:4]
+		fields = (years, months, weeks, days + balanced[0], *balanced[1:])
+		_validate(fields)
+		return self._format(fields, digits)
+
+	@staticmethod
+	def _format(fields: tuple[int, ...], digits: int | None, /) -> str:
+		years, months, weeks, days, hours, minutes, seconds, milliseconds, microseconds, nanoseconds = (abs(field) for field in fields)
+		text = '-P' if any(field < 0 for field in fields) else 'P'
+		if years:
+			text += f'{years}Y'
+		if months:
+			text += f'{months}M'
+		if weeks:
+			text += f'{weeks}W'
+		if days:
+			text += f'{days}D'
+		time = ''
+		if hours:
+			time += f'{hours}H'
+		if minutes:
+			time += f'{minutes}M'
+		extra_seconds, subseconds = divmod(milliseconds * 1000000 + microseconds * 1000 + nanoseconds, 1000000000)
+		seconds += extra_seconds
+		if seconds or subseconds or digits is not None or not any(fields[:6]):
+			time += str(seconds)
+			if digits is None:
+				if subseconds:
+					time += f'.{subseconds:09}'.rstrip('0')
+			elif digits:
+				time += f'.{subseconds:09}'[:digits + 1]
+			time += 'S'
+		if time:
+			text += 'T' + time
+		return text
+
+	def to_locale_string(self) -> str:  # TODO options
+		# TODO
+		return str(self)
+
+	def __str__(self):
+		return self._format(self._fields, None)
+
+	def __repr__(self):
+		return f'{type(self).__name__}.from_("{self}")'
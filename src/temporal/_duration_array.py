@@ -0,0 +1,85 @@
+from array import array
+from typing import Iterable, Iterator, Literal, Self, Sequence, overload
+
+from ._duration import Duration, Unit
+
+__all__ = ['DurationArray']
+
+_UNIT_NANOSECONDS = {
+	'hour': 3600000000000,
+	'minute': 60000000000,
+	'second': 1000000000,
+	'millisecond': 1000000,
+	'microsecond': 1000,
+	'nanosecond': 1,
+}
+
+
+class DurationArray(Sequence[Duration]):
+	# Exact time differences as one int64 of nanoseconds per element, e.g. the
+	# result of InstantArray.until. Elements are balanced up to largest_unit
+	# and materialized as Duration only on access.
+	__slots__ = ('_nanoseconds', '_largest_unit')
+
+	_nanoseconds: 'array[int]'
+	_largest_unit: Unit
+
+	@classmethod
+	def _from_array(cls, nanoseconds: 'array[int]', largest_unit: Unit, /) -> Self:
+		self = object.__new__(cls)
+		self._nanoseconds = nanoseconds
+		self._largest_unit = largest_unit
+		return self
+
+	@classmethod
+	def from_nanoseconds(
+		cls,
+		nanoseconds: Iterable[int],
+		largest_unit: Literal['hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'second',
+		/,
+	) -> Self:
+		if largest_unit not in _UNIT_NANOSECONDS:
+			raise ValueError(f'invalid largest unit: {largest_unit!r}')
+		return cls._from_array(array('q', nanoseconds), largest_unit)
+
+	@property
+	def nanoseconds(self) -> memoryview:
+		return memoryview(self._nanoseconds).toreadonly()
+
+	@property
+	def largest_unit(self) -> Unit:
+		return self._largest_unit
+
+	def total(self, unit: Literal['hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'], /) -> 'array[float]':
+		if unit not in _UNIT_NANOSECONDS:
+			raise ValueError(f'invalid unit: {unit!r}')
+		divisor = _UNIT_NANOSECONDS[unit]
+		return array('d', [value / divisor for value in self._nanoseconds])
+
+	def __len__(self) -> int:
+		return len(self._nanoseconds)
+
+	@overload
+	def __getitem__(self, index: int, /) -> Duration:
+		...
+
+	@overload
+	def __getitem__(self, index: slice, /) -> Self:
+		...
+
+	def __getitem__(self, index: int | slice, /) -> 'Duration | Self':
+		if isinstance(index, slice):
+			return self._from_array(self._nanoseconds[index], self._largest_unit)
+		return Duration._from_nanoseconds(self._nanoseconds[index], self._largest_unit)
+
+	def __iter__(self) -> Iterator[Duration]:
+		largest_unit = self._largest_unit
+		return (Duration._from_nanoseconds(value, largest_unit) for value in self._nanoseconds)
+
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._largest_unit == other._largest_unit and self._nanoseconds == other._nanoseconds  # type: ignore
+
+	def __repr__(self):
+		return f'{type(self).__name__}.from_nanoseconds({self._nanoseconds.tolist()}, "{self._largest_unit}")'
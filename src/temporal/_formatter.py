@@ -0,0 +1,120 @@
+from typing import Callable, Literal, NamedTuple
+
+from ._calendar import iso_date_time_from_epoch_nanoseconds
+from ._rounding import ROUNDING_MODES, RoundingMode, as_if_positive, round_to_increment
+
+__all__ = ['FormatPlan', 'format_plan', 'DEFAULT_PLAN', 'format_date', 'format_offset', 'format_offset_rounded']
+
+_UNIT_DIGITS = {'second': 0, 'millisecond': 3, 'microsecond': 6, 'nanosecond': 9}
+
+
+class FormatPlan(NamedTuple):
+	increment: int  # nanoseconds
+	rounding_mode: RoundingMode  # already mapped with as_if_positive()
+	format_time: Callable[[int, int, int, int], str]  # hour, minute, second, nanosecond
+
+	def format_date_time(self, wall_nanoseconds: int, /) -> str:
+		# wall_nanoseconds must be rounded already
+		year, month, day, hour, minute, second, millisecond, microsecond, nanosecond = iso_date_time_from_epoch_nanoseconds(wall_nanoseconds)
+		return f'{format_date(year, month, day)}T{self.format_time(hour, minute, second, millisecond * 1000000 + microsecond * 1000 + nanosecond)}'
+
+	def format_wall(self, wall_nanoseconds: int, /) -> str:
+		return self.format_date_time(round_to_increment(wall_nanoseconds, self.increment, self.rounding_mode))
+
+
+def _format_minutes(hour: int, minute: int, second: int, nanosecond: int, /) -> str:
+	return f'{hour:02}:{minute:02}'
+
+
+def _format_seconds(hour: int, minute: int, second: int, nanosecond: int, /) -> str:
+	return f'{hour:02}:{minute:02}:{second:02}'
+
+
+def _format_auto(hour: int, minute: int, second: int, nanosecond: int, /) -> str:
+	if not nanosecond:
+		return f'{hour:02}:{minute:02}:{second:02}'
+	return f'{hour:02}:{minute:02}:{second:02}.{nanosecond:09}'.rstrip('0')
+
+
+def _fixed_digits_formatter(digits: int, /) -> Callable[[int, int, int, int], str]:
+	divisor = 10**(9 - digits)
+	template = f'%02d:%02d:%02d.%0{digits}d'
+
+	def format_time(hour: int, minute: int, second: int, nanosecond: int, /) -> str:
+		return template % (hour, minute, second, nanosecond // divisor)
+
+	return format_time
+
+
+# option combination -> plan; only valid combinations are stored, so it stays small
+_PLANS: dict[tuple[object, object, object], FormatPlan] = {}
+
+
+def format_plan(
+	fractional_second_digits: Literal['auto', 0, 1, 2, 3, 4, 5, 6, 7, 8, 9] = 'auto',
+	smallest_unit: Literal['minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] | None = None,
+	rounding_mode: RoundingMode = 'trunc',
+	/,
+) -> FormatPlan:
+	# Each distinct option combination is validated and turned into a plan
+	# once; formatting then only rounds an int and fills in a template. A plain
+	# dict rather than lru_cache, whose every call takes a lock on free-threaded builds.
+	if fractional_second_digits.__class__ is not int and fractional_second_digits != 'auto':
+		# True and 1.0 hash and compare like 1, so they would find its plan
+		raise ValueError(f'invalid fractional second digits: {fractional_second_digits!r}')
+	key = (fractional_second_digits, smallest_unit, rounding_mode)
+	plan = _PLANS.get(key)
+	if plan is None:
+		plan = _PLANS.setdefault(key, _format_plan(fractional_second_digits, smallest_unit, rounding_mode))
+	return plan
+
+
+def _format_plan(
+	fractional_second_digits: Literal['auto', 0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+	smallest_unit: Literal['minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] | None,
+	rounding_mode: RoundingMode,
+	/,
+) -> FormatPlan:
+	if rounding_mode not in ROUNDING_MODES:
+		raise ValueError(f'invalid rounding mode: {rounding_mode!r}')
+	rounding_mode = as_if_positive(rounding_mode)
+	if smallest_unit == 'minute':
+		return FormatPlan(60000000000, rounding_mode, _format_minutes)
+	if smallest_unit is not None:
+		if smallest_unit not in _UNIT_DIGITS:
+			raise ValueError(f'invalid smallest unit: {smallest_unit!r}')
+		fractional_second_digits = _UNIT_DIGITS[smallest_unit]  # type: ignore
+	if fractional_second_digits == 'auto':
+		return FormatPlan(1, rounding_mode, _format_auto)
+	if type(fractional_second_digits) is not int or not 0 <= fractional_second_digits <= 9:
+		raise ValueError(f'invalid fractional second digits: {fractional_second_digits!r}')
+	if not fractional_second_digits:
+		return FormatPlan(1000000000, rounding_mode, _format_seconds)
+	return FormatPlan(10**(9 - fractional_second_digits), rounding_mode, _fixed_digits_formatter(fractional_second_digits))
+
+
+DEFAULT_PLAN = format_plan()
+
+
+def format_date(year: int, month: int, day: int, /) -> str:
+	if 0 <= year <= 9999:
+		return f'{year:04}-{month:02}-{day:02}'
+	return f'{year:+07}-{month:02}-{day:02}'
+
+
+def format_offset(offset_nanoseconds: int, /) -> str:
+	sign = '-' if offset_nanoseconds < 0 else '+'
+	seconds, nanoseconds = divmod(abs(offset_nanoseconds), 1000000000)
+	text = f'{sign}{seconds // 3600:02}:{seconds // 60 % 60:02}'
+	if seconds % 60 or nanoseconds:
+		text += f':{seconds % 60:02}'
+		if nanoseconds:
+			text += f'.{nanoseconds:09}'.rstrip('0')
+	return text
+
+
+def format_offset_rounded(offset_nanoseconds: int, /) -> str:
+	# ISO strings of an instant carry the offset rounded to whole minutes
+	minutes = round_to_increment(offset_nanoseconds, 60000000000, 'halfExpand') // 60000000000
+	sign = '-' if minutes < 0 else '+'
+	return f'{sign}{abs(minutes) // 60:02}:{abs(minutes) % 60:02}'
@@ -1,26 +1,112 @@
 import datetime as py_datetime
-from dataclasses import dataclass
-from typing import Literal, Self
+from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, Self
 
-from ._duration import Duration
+from ._deferred import deferred_module
+from ._duration import Duration, difference_settings, round_settings
+from ._formatter import DEFAULT_PLAN, format_offset_rounded, format_plan
+from ._parse_many import ParseError, instant_nanoseconds_parser, parse_many
+from ._parser import parse_date_time
+from ._rounding import as_if_positive, round_to_increment
+from ._wire import INSTANT, iter_unpack, pack, pack_column, unpack
 
 __all__ = ['Instant']
 
+_UTC = py_datetime.timezone.utc
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = _UTC)
+
+# Temporal limits instants to 10**8 days on either side of the epoch.
+_MAX_EPOCH_NANOSECONDS = 86400 * 10**8 * 10**9
+
+
+def _py_datetime_to_epoch_nanoseconds(py_datetimeaware: py_datetime.datetime, /) -> int:
+	delta = py_datetimeaware - _EPOCH
+	return ((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds) * 1000
+
+
+def _epoch_nanoseconds_to_py_datetimeutc(epoch_nanoseconds: int, /) -> py_datetime.datetime:
+	return _EPOCH + py_datetime.timedelta(microseconds = epoch_nanoseconds // 1000)
+
+
+def _instant_addend(duration: Duration, /) -> int:
+	# Instants have no calendar, so only exact units can be added, as in Temporal.
+	if duration.years or duration.months or duration.weeks or duration.days:
+		raise ValueError(f'cannot add years, months, weeks or days to an Instant: {duration}')
+	return duration._time_nanoseconds
+
 
-@dataclass(frozen = True, order = True)
 class _InstantBase:
-	py_datetimeutc: py_datetime.datetime
+	__slots__ = ('_epoch_nanoseconds', )
+
+	_epoch_nanoseconds: int
+
+	def __setattr__(self, name: str, value: Any, /):
+		raise FrozenInstanceError(f'cannot assign to field {name!r}')
 
-	def __post_init__(self):
-		assert self.py_datetimeutc.tzinfo is py_datetime.timezone.utc
+	def __delattr__(self, name: str, /):
+		raise FrozenInstanceError(f'cannot delete field {name!r}')
+
+	@property
+	def py_datetimeutc(self) -> py_datetime.datetime:
+		return _epoch_nanoseconds_to_py_datetimeutc(self._epoch_nanoseconds)
 
 	@classmethod
 	def from_py_datetimeutc(cls, py_datetimeutc: py_datetime.datetime, /):
-		return cls(py_datetimeutc = py_datetimeutc)
+		assert py_datetimeutc.tzinfo is _UTC
+		return cls._from_epoch_nanoseconds(_py_datetime_to_epoch_nanoseconds(py_datetimeutc))
+
+	@classmethod
+	def _from_epoch_nanoseconds(cls, epoch_nanoseconds: int, /) -> Self:
+		# Skips the range check, for callers that already know the value is valid.
+		self = object.__new__(cls)
+		_set_epoch_nanoseconds(self, epoch_nanoseconds)
+		return self
+
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._epoch_nanoseconds == other._epoch_nanoseconds  # type: ignore
+
+	# Instants and ZonedDateTimes order by their exact time, whatever the zone;
+	# equality stays within one class, since a ZonedDateTime also has a zone.
+	def __lt__(self, other: object, /) -> bool:
+		if not isinstance(other, _InstantBase):
+			return NotImplemented
+		return self._epoch_nanoseconds < other._epoch_nanoseconds  # type: ignore
+
+	def __le__(self, other: object, /) -> bool:
+		if not isinstance(other, _InstantBase):
+			return NotImplemented
+		return self._epoch_nanoseconds <= other._epoch_nanoseconds  # type: ignore
+
+	def __gt__(self, other: object, /) -> bool:
+		if not isinstance(other, _InstantBase):
+			return NotImplemented
+		return self._epoch_nanoseconds > other._epoch_nanoseconds  # type: ignore
+
+	def __ge__(self, other: object, /) -> bool:
+		if not isinstance(other, _InstantBase):
+			return NotImplemented
+		return self._epoch_nanoseconds >= other._epoch_nanoseconds  # type: ignore
+
+	def __hash__(self) -> int:
+		return hash(self._epoch_nanoseconds)
+
+	def __reduce__(self):
+		return (type(self), (self._epoch_nanoseconds, ))
+
+	def __copy__(self) -> Self:
+		return self
+
+	def __deepcopy__(self, memo: dict[int, Any], /) -> Self:
+		return self
+
+
+_set_epoch_nanoseconds = _InstantBase._epoch_nanoseconds.__set__  # type: ignore
 
 
-@dataclass(frozen = True)
 class Instant(_InstantBase):
+	__slots__ = ()
 
 	def __init__(
 		self,
@@ -29,64 +115,94 @@ class Instant(_InstantBase):
 		*,
 		py_datetimeutc: py_datetime.datetime | None = None,
 	):
-		if not py_datetimeutc:
-			if epoch_nanoseconds is None:
-				raise TypeError("Instant.__init__() missing 1 required positional argument: 'epoch_nanoseconds'")
-			py_datetimeutc = py_datetime.datetime.fromtimestamp(epoch_nanoseconds // 1000000000, tz = py_datetime.timezone.utc)
-			py_datetimeutc = py_datetimeutc.replace(microsecond = int(epoch_nanoseconds / 1000))
-		super().__init__(py_datetimeutc)
+		if py_datetimeutc:
+			assert py_datetimeutc.tzinfo is _UTC
+			epoch_nanoseconds = _py_datetime_to_epoch_nanoseconds(py_datetimeutc)
+		elif epoch_nanoseconds is None:
+			raise TypeError("Instant.__init__() missing 1 required positional argument: 'epoch_nanoseconds'")
+		if not -_MAX_EPOCH_NANOSECONDS <= epoch_nanoseconds <= _MAX_EPOCH_NANOSECONDS:
+			raise ValueError(f'epoch_nanoseconds out of range: {epoch_nanoseconds}')
+		_set_epoch_nanoseconds(self, epoch_nanoseconds)
 
 	@classmethod
 	def from_(cls, thing: 'Instant | str', /) -> Self:
+		if thing.__class__ is cls:
+			return thing  # type: ignore
 		if isinstance(thing, Instant):
-			return cls(py_datetimeutc = thing.py_datetimeutc.replace())
-		# TODO parse
-		val = py_datetime.datetime.fromisoformat(thing)
-		return cls(py_datetimeutc = val.astimezone(py_datetime.timezone.utc))
+			return cls._from_epoch_nanoseconds(thing._epoch_nanoseconds)
+		epoch_nanoseconds = parse_date_time(thing).epoch_nanoseconds
+		if epoch_nanoseconds is None:
+			raise ValueError(f'Instant string must have a UTC offset or Z: {thing!r}')
+		return cls(epoch_nanoseconds)
+
+	@classmethod
+	def from_iter(
+		cls,
+		source: Iterable[str],
+		/,
+		*,
+		errors: Literal['raise', 'skip'] | list[ParseError] = 'raise',
+	) -> Iterator[Self]:
+		parse = instant_nanoseconds_parser()
+		return parse_many(lambda text: cls(parse(text)), source, errors = errors)
+
+	@classmethod
+	def from_bytes(cls, data: bytes | bytearray | memoryview, /) -> Self:
+		return cls._from_epoch_nanoseconds(unpack(INSTANT, data)[0])
+
+	@classmethod
+	def from_bytes_iter(cls, data: bytes | bytearray | memoryview, /) -> Iterator[Self]:
+		new = cls._from_epoch_nanoseconds
+		return (new(epoch_nanoseconds) for epoch_nanoseconds, in iter_unpack(INSTANT, data))
+
+	@staticmethod
+	def to_bytes_many(instants: 'Iterable[Instant]', /) -> bytes:
+		return pack_column('q', [instant._epoch_nanoseconds for instant in instants])
+
+	def to_bytes(self) -> bytes:
+		return pack(INSTANT, self._epoch_nanoseconds)
 
 	@classmethod
 	def from_epoch_seconds(cls, epoch_seconds: int, /) -> Self:
-		return cls(py_datetimeutc = py_datetime.datetime.fromtimestamp(epoch_seconds, py_datetime.timezone.utc))
+		return cls(epoch_seconds * 1000000000)
 
 	@classmethod
 	def from_epoch_milliseconds(cls, epoch_milliseconds: int, /) -> Self:
-		return cls(py_datetimeutc = py_datetime.datetime.fromtimestamp(epoch_milliseconds // 1000, py_datetime.timezone.utc).replace(microsecond = epoch_milliseconds * 1000))
+		return cls(epoch_milliseconds * 1000000)
 
 	@classmethod
 	def from_epoch_microseconds(cls, epoch_microseconds: int, /) -> Self:
-		return cls(py_datetimeutc = py_datetime.datetime.fromtimestamp(epoch_microseconds // 1000000, py_datetime.timezone.utc).replace(microsecond = epoch_microseconds))
+		return cls(epoch_microseconds * 1000)
 
 	@classmethod
 	def from_epoch_nanoseconds(cls, epoch_nanoseconds: int, /) -> Self:
-		return cls(py_datetimeutc = py_datetime.datetime.fromtimestamp(epoch_nanoseconds // 1000000000, py_datetime.timezone.utc).replace(microsecond = int(epoch_nanoseconds / 1000)))
+		return cls(epoch_nanoseconds)
 
 	@property
 	def epoch_seconds(self) -> int:
-		return int(self.py_datetimeutc.timestamp())
+		return self._epoch_nanoseconds // 1000000000
 
 	@property
 	def epoch_milliseconds(self) -> int:
-		return int(self.py_datetimeutc.timestamp() * 1000)
+		return self._epoch_nanoseconds // 1000000
 
 	@property
 	def epoch_microseconds(self) -> int:
-		return int(self.py_datetimeutc.timestamp() * 1000000)
+		return self._epoch_nanoseconds // 1000
 
 	@property
 	def epoch_nanoseconds(self) -> int:
-		return int(self.py_datetimeutc.timestamp() * 1000000) * 1000
+		return self._epoch_nanoseconds
 
 	def add(self, duration: 'Duration | str', /) -> 'Instant':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		return Instant(self._epoch_nanoseconds + _instant_addend(duration))
 
 	def subtract(self, duration: 'Duration | str', /) -> 'Instant':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		return Instant(self._epoch_nanoseconds - _instant_addend(duration))
 
 	def until(
 		self,
@@ -100,8 +216,8 @@ class Instant(_InstantBase):
 	) -> 'Duration':
 		if not isinstance(other, type(self)):
 			other = type(self).from_(other)
-		# TODO
-		return Duration()
+		largest_unit, increment = difference_settings(largest_unit, smallest_unit, rounding_increment, rounding_mode)
+		return Duration._from_nanoseconds(round_to_increment(other._epoch_nanoseconds - self._epoch_nanoseconds, increment, rounding_mode), largest_unit)
 
 	def since(
 		self,
@@ -115,8 +231,8 @@ class Instant(_InstantBase):
 	) -> 'Duration':
 		if not isinstance(other, type(self)):
 			other = type(self).from_(other)
-		# TODO
-		return Duration()
+		largest_unit, increment = difference_settings(largest_unit, smallest_unit, rounding_increment, rounding_mode)
+		return Duration._from_nanoseconds(round_to_increment(self._epoch_nanoseconds - other._epoch_nanoseconds, increment, rounding_mode), largest_unit)
 
 	def round(
 		self,
@@ -126,27 +242,34 @@ class Instant(_InstantBase):
 		rounding_increment: int = 1,
 		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'halfExpand',
 	) -> Self:
-		# TODO
-		return self
+		increment = round_settings(smallest_unit, rounding_increment, rounding_mode, 'instant')
+		# the range limits are whole days, so rounding cannot leave it
+		return self._from_epoch_nanoseconds(round_to_increment(self._epoch_nanoseconds, increment, as_if_positive(rounding_mode)))
 
 	def to_string(
 		self,
 		/,
 		*,
-		time_zone: '_time_zone.TimeZone | str',
+		time_zone: '_time_zone.TimeZone | str | None' = None,
 		fractional_second_digits: Literal['auto', 0, 1, 2, 3, 4, 5, 6, 7, 8, 9] = 'auto',
 		smallest_unit: Literal['minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] | None = None,
 		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'trunc',
 	) -> str:
-		# TODO
-		return str(self)
+		plan = format_plan(fractional_second_digits, smallest_unit, rounding_mode)
+		epoch_nanoseconds = round_to_increment(self._epoch_nanoseconds, plan.increment, plan.rounding_mode)
+		if time_zone is None:
+			return plan.format_date_time(epoch_nanoseconds) + 'Z'
+		if isinstance(time_zone, str):
+			time_zone = _time_zone.TimeZone.from_(time_zone)
+		offset_nanoseconds = time_zone._rules.offset_nanoseconds_for(epoch_nanoseconds)
+		return plan.format_date_time(epoch_nanoseconds + offset_nanoseconds) + format_offset_rounded(offset_nanoseconds)
 
 	def to_locale_string(self) -> str:  # TODO options
 		# TODO
 		return str(self)
 
 	def __str__(self):
-		return self.py_datetimeutc.replace(tzinfo = None).isoformat() + 'Z'
+		return DEFAULT_PLAN.format_date_time(self._epoch_nanoseconds) + 'Z'
 
 	def __repr__(self):
 		return f'{type(self).__name__}.from_("{self}")'
@@ -158,10 +281,14 @@ class Instant(_InstantBase):
 	) -> '_zoned_date_time.ZonedDateTime':
 		if isinstance(time_zone, str):
 			time_zone = _time_zone.TimeZone(time_zone)
-		return _zoned_date_time.ZonedDateTime.from_py_datetimezoned(self.py_datetimeutc.astimezone(time_zone.py_tzinfo))
+		return _zoned_date_time.ZonedDateTime(self._epoch_nanoseconds, time_zone)
 
 	def to_instant(self):
-		return Instant.from_py_datetimeutc(self.py_datetimeutc)
+		return Instant._from_epoch_nanoseconds(self._epoch_nanoseconds)
 
 
-from . import _time_zone, _zoned_date_time  # type: ignore
+if TYPE_CHECKING:
+	from . import _time_zone, _zoned_date_time
+else:
+	_time_zone = deferred_module(globals(), '_time_zone')
+	_zoned_date_time = deferred_module(globals(), '_zoned_date_time')
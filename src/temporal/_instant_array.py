@@ -0,0 +1,263 @@
+from array import array
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, Self, Sequence, overload
+
+from ._deferred import deferred_module
+from ._duration import Duration, difference_settings, round_settings
+from ._duration_array import DurationArray
+from ._instant import Instant, _instant_addend
+from ._parse_many import ParseError, instant_nanoseconds_parser, parse_many
+from ._rounding import RoundingMode, as_if_positive, round_array
+from ._time_zone import TimeZone
+from ._wire import _BIG_ENDIAN
+
+__all__ = ['InstantArray']
+
+_MIN_INT64 = -2**63
+_MAX_INT64 = 2**63 - 1
+
+
+def _checked(values: 'list[int] | array[Any]', /, factor: int = 1, unit: str = 'nanoseconds') -> 'array[int]':
+	# values are epoch nanoseconds, `factor` times the caller's epoch `unit`
+	try:
+		return array('q', values)
+	except OverflowError:
+		value = next(value for value in values if not _MIN_INT64 <= value <= _MAX_INT64)
+		raise ValueError(f'epoch {unit} out of range for InstantArray: {value // factor}') from None
+
+
+def _scaled(values: Iterable[int], factor: int, unit: str, /) -> 'array[int]':
+	return _checked([value * factor for value in values], factor, unit)
+
+
+class InstantArray(Sequence[Instant]):
+	# Columnar storage: one int64 of epoch nanoseconds per element, so only
+	# the years 1677-2262 fit. Elements are materialized as Instant on access.
+	__slots__ = ('_epoch_nanoseconds', )
+
+	_epoch_nanoseconds: 'array[int]'
+
+	def __init__(self, instants: 'Iterable[Instant | str]' = (), /):
+		self._epoch_nanoseconds = _checked([(instant if isinstance(instant, Instant) else Instant.from_(instant)).epoch_nanoseconds for instant in instants])
+
+	@classmethod
+	def _from_array(cls, epoch_nanoseconds: 'array[int]', /) -> Self:
+		self = object.__new__(cls)
+		self._epoch_nanoseconds = epoch_nanoseconds
+		return self
+
+	@classmethod
+	def from_iter(
+		cls,
+		source: Iterable[str],
+		/,
+		*,
+		errors: Literal['raise', 'skip'] | list[ParseError] = 'raise',
+	) -> Self:
+		return cls._from_array(array('q', parse_many(instant_nanoseconds_parser(_MIN_INT64, _MAX_INT64), source, errors = errors)))
+
+	@classmethod
+	def from_epoch_seconds(cls, epoch_seconds: Iterable[int], /) -> Self:
+		return cls._from_array(_scaled(epoch_seconds, 1000000000, 'seconds'))
+
+	@classmethod
+	def from_epoch_milliseconds(cls, epoch_milliseconds: Iterable[int], /) -> Self:
+		return cls._from_array(_scaled(epoch_milliseconds, 1000000, 'milliseconds'))
+
+	@classmethod
+	def from_epoch_microseconds(cls, epoch_microseconds: Iterable[int], /) -> Self:
+		return cls._from_array(_scaled(epoch_microseconds, 1000, 'microseconds'))
+
+	@classmethod
+	def from_epoch_nanoseconds(cls, epoch_nanoseconds: Iterable[int], /) -> Self:
+		# A memoryview of native int64, like epoch_nanoseconds or a numpy column,
+		# and array('q', array('q')) are plain memory copies. Raw bytes are the
+		# little-endian encoding, which only from_bytes reads.
+		if isinstance(epoch_nanoseconds, memoryview) and epoch_nanoseconds.format not in ('B', 'b', 'c'):
+			if epoch_nanoseconds.format in ('q', 'l') and epoch_nanoseconds.itemsize == 8 and epoch_nanoseconds.c_contiguous:
+				values = array('q')
+				values.frombytes(epoch_nanoseconds.cast('B'))
+				return cls._from_array(values)
+		elif isinstance(epoch_nanoseconds, (bytes, bytearray, memoryview)):
+			raise TypeError('bytes are not epoch nanoseconds; use InstantArray.from_bytes() for the binary encoding')
+		return cls._from_array(_checked(epoch_nanoseconds if isinstance(epoch_nanoseconds, (array, list)) else list(epoch_nanoseconds)))
+
+	@classmethod
+	def from_bytes(cls, data: bytes | bytearray | memoryview, /) -> Self:
+		# The Instant binary encoding, one little-endian int64 per element,
+		# copied into the column in a single block.
+		values = array('q')
+		try:
+			values.frombytes(memoryview(data).cast('B'))
+		except ValueError:
+			raise ValueError(f'buffer size is not a multiple of 8 bytes: {memoryview(data).nbytes}') from None
+		if _BIG_ENDIAN:
+			values.byteswap()
+		return cls._from_array(values)
+
+	def to_bytes(self) -> bytes:
+		if _BIG_ENDIAN:
+			values = array('q', self._epoch_nanoseconds)
+			values.byteswap()
+			return values.tobytes()
+		return self._epoch_nanoseconds.tobytes()
+
+	@property
+	def epoch_seconds(self) -> memoryview:
+		return memoryview(array('q', [value // 1000000000 for value in self._epoch_nanoseconds])).toreadonly()
+
+	@property
+	def epoch_milliseconds(self) -> memoryview:
+		return memoryview(array('q', [value // 1000000 for value in self._epoch_nanoseconds])).toreadonly()
+
+	@property
+	def epoch_microseconds(self) -> memoryview:
+		return memoryview(array('q', [value // 1000 for value in self._epoch_nanoseconds])).toreadonly()
+
+	@property
+	def epoch_nanoseconds(self) -> memoryview:
+		return memoryview(self._epoch_nanoseconds).toreadonly()
+
+	def __len__(self) -> int:
+		return len(self._epoch_nanoseconds)
+
+	@overload
+	def __getitem__(self, index: int, /) -> Instant:
+		...
+
+	@overload
+	def __getitem__(self, index: slice, /) -> Self:
+		...
+
+	def __getitem__(self, index: int | slice, /) -> 'Instant | Self':
+		if isinstance(index, slice):
+			return self._from_array(self._epoch_nanoseconds[index])
+		return Instant._from_epoch_nanoseconds(self._epoch_nanoseconds[index])
+
+	def __iter__(self) -> Iterator[Instant]:
+		return map(Instant._from_epoch_nanoseconds, self._epoch_nanoseconds)
+
+	def __reversed__(self) -> Iterator[Instant]:
+		return map(Instant._from_epoch_nanoseconds, reversed(self._epoch_nanoseconds))
+
+	def __contains__(self, value: object, /) -> bool:
+		return isinstance(value, Instant) and value.epoch_nanoseconds in self._epoch_nanoseconds
+
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._epoch_nanoseconds == other._epoch_nanoseconds  # type: ignore
+
+	def compare(self, other: 'InstantArray | Instant | str', /) -> 'array[int]':
+		if isinstance(other, InstantArray):
+			if len(other) != len(self):
+				raise ValueError(f'length mismatch: {len(self)} != {len(other)}')
+			return array('b', [(a > b) - (a < b) for a, b in zip(self._epoch_nanoseconds, other._epoch_nanoseconds)])
+		if not isinstance(other, Instant):
+			other = Instant.from_(other)
+		b = other.epoch_nanoseconds
+		return array('b', [(a > b) - (a < b) for a in self._epoch_nanoseconds])
+
+	def add(self, duration: 'Duration | str', /) -> Self:
+		if not isinstance(duration, Duration):
+			duration = Duration.from_(duration)
+		addend = _instant_addend(duration)
+		return self._from_array(_checked([value + addend for value in self._epoch_nanoseconds]))
+
+	def subtract(self, duration: 'Duration | str', /) -> Self:
+		if not isinstance(duration, Duration):
+			duration = Duration.from_(duration)
+		addend = _instant_addend(duration)
+		return self._from_array(_checked([value - addend for value in self._epoch_nanoseconds]))
+
+	def _differences(self, other: 'InstantArray | Instant | str', since: bool, /) -> 'list[int]':
+		# other - self for until, self - other for since; pairwise or against one Instant
+		if isinstance(other, InstantArray):
+			if len(other) != len(self):
+				raise ValueError(f'length mismatch: {len(self)} != {len(other)}')
+			pairs = zip(self._epoch_nanoseconds, other._epoch_nanoseconds)
+			if since:
+				return [a - b for a, b in pairs]
+			return [b - a for a, b in pairs]
+		if not isinstance(other, Instant):
+			other = Instant.from_(other)
+		b = other.epoch_nanoseconds
+		if since:
+			return [a - b for a in self._epoch_nanoseconds]
+		return [b - a for a in self._epoch_nanoseconds]
+
+	def until(
+		self,
+		other: 'InstantArray | Instant | str',
+		/,
+		*,
+		largest_unit: Literal['auto', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'auto',
+		smallest_unit: Literal['hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'nanosecond',
+		rounding_increment: int = 1,
+		rounding_mode: RoundingMode = 'trunc',
+	) -> DurationArray:
+		largest_unit, increment = difference_settings(largest_unit, smallest_unit, rounding_increment, rounding_mode)
+		try:
+			return DurationArray._from_array(round_array(self._differences(other, False), increment, rounding_mode), largest_unit)
+		except OverflowError:
+			raise ValueError('difference out of range for DurationArray') from None
+
+	def since(
+		self,
+		other: 'InstantArray | Instant | str',
+		/,
+		*,
+		largest_unit: Literal['auto', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'auto',
+		smallest_unit: Literal['hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'nanosecond',
+		rounding_increment: int = 1,
+		rounding_mode: RoundingMode = 'trunc',
+	) -> DurationArray:
+		largest_unit, increment = difference_settings(largest_unit, smallest_unit, rounding_increment, rounding_mode)
+		try:
+			return DurationArray._from_array(round_array(self._differences(other, True), increment, rounding_mode), largest_unit)
+		except OverflowError:
+			raise ValueError('difference out of range for DurationArray') from None
+
+	def round(
+		self,
+		/,
+		smallest_unit: Literal['hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'],
+		*,
+		rounding_increment: int = 1,
+		rounding_mode: RoundingMode = 'halfExpand',
+	) -> Self:
+		increment = round_settings(smallest_unit, rounding_increment, rounding_mode, 'instant')
+		try:
+			return self._from_array(round_array(self._epoch_nanoseconds, increment, as_if_positive(rounding_mode)))
+		except OverflowError:
+			raise ValueError('result out of range for InstantArray') from None
+
+	def get_iso_fields(self, time_zone: 'TimeZone | str', /, *, as_numpy: bool = False) -> '_iso_columns.ISOFieldsColumns | Any':
+		if isinstance(time_zone, str):
+			time_zone = TimeZone(time_zone)
+		return _iso_columns._columns_for_epoch_nanoseconds(self._epoch_nanoseconds, time_zone, as_numpy)
+
+	def min(self) -> Instant:
+		return Instant._from_epoch_nanoseconds(min(self._epoch_nanoseconds))
+
+	def max(self) -> Instant:
+		return Instant._from_epoch_nanoseconds(max(self._epoch_nanoseconds))
+
+	def sorted(self, *, reverse: bool = False) -> Self:
+		return self._from_array(array('q', sorted(self._epoch_nanoseconds, reverse = reverse)))
+
+	def argsort(self, *, reverse: bool = False) -> 'array[int]':
+		values = self._epoch_nanoseconds
+		return array('q', sorted(range(len(values)), key = values.__getitem__, reverse = reverse))
+
+	def take(self, indices: Iterable[int], /) -> Self:
+		values = self._epoch_nanoseconds
+		return self._from_array(array('q', [values[i] for i in indices]))
+
+	def __repr__(self):
+		return f'{type(self).__name__}.from_epoch_nanoseconds({self._epoch_nanoseconds.tolist()})'
+
+
+if TYPE_CHECKING:
+	from . import _iso_columns
+else:
+	_iso_columns = deferred_module(globals(), '_iso_columns')
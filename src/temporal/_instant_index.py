@@ -0,0 +1,132 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, NamedTuple, Self, Sequence, overload
+
+from ._instant import Instant
+from ._instant_array import InstantArray
+
+__all__ = ['IndexEntry', 'InstantIndex']
+
+
+class IndexEntry(NamedTuple):
+	instant: Instant
+	row_id: int
+
+
+def _key(thing: 'Instant | str', /) -> int:
+	# ZonedDateTime is an Instant; strings go through Instant.from_
+	return (thing if isinstance(thing, Instant) else Instant.from_(thing))._epoch_nanoseconds
+
+
+class InstantIndex(Sequence[IndexEntry]):
+	# Epoch nanoseconds in ascending order next to the row id of each, as two
+	# int64 arrays. Lookups bisect the first one; equal instants keep the order
+	# they were added in. Row ids default to the position in the input.
+	__slots__ = ('_epoch_nanoseconds', '_row_ids')
+
+	_epoch_nanoseconds: 'array[int]'
+	_row_ids: 'array[int]'
+
+	def __init__(self, instants: 'InstantArray | Iterable[Instant | str]' = (), /, row_ids: Iterable[int] | None = None):
+		values = instants._epoch_nanoseconds if isinstance(instants, InstantArray) else InstantArray(instants)._epoch_nanoseconds
+		ids = array('q', range(len(values)) if row_ids is None else row_ids)
+		if len(ids) != len(values):
+			raise ValueError(f'length mismatch: {len(values)} instants, {len(ids)} row ids')
+		# a stable sort, and linear for input that is already sorted
+		order = sorted(range(len(values)), key = values.__getitem__)
+		self._epoch_nanoseconds = array('q', [values[i] for i in order])
+		self._row_ids = array('q', [ids[i] for i in order])
+
+	@classmethod
+	def _from_arrays(cls, epoch_nanoseconds: 'array[int]', row_ids: 'array[int]', /) -> Self:
+		self = object.__new__(cls)
+		self._epoch_nanoseconds = epoch_nanoseconds
+		self._row_ids = row_ids
+		return self
+
+	@property
+	def instants(self) -> InstantArray:
+		return InstantArray._from_array(array('q', self._epoch_nanoseconds))
+
+	@property
+	def row_ids(self) -> memoryview:
+		return memoryview(self._row_ids).toreadonly()
+
+	def __len__(self) -> int:
+		return len(self._epoch_nanoseconds)
+
+	@overload
+	def __getitem__(self, index: int, /) -> IndexEntry:
+		...
+
+	@overload
+	def __getitem__(self, index: slice, /) -> Self:
+		...
+
+	def __getitem__(self, index: int | slice, /) -> 'IndexEntry | Self':
+		if isinstance(index, slice):
+			if index.step is not None and index.step < 0:
+				raise ValueError('InstantIndex slices must be ascending')
+			return self._from_arrays(self._epoch_nanoseconds[index], self._row_ids[index])
+		return IndexEntry(Instant._from_epoch_nanoseconds(self._epoch_nanoseconds[index]), self._row_ids[index])
+
+	def __iter__(self) -> Iterator[IndexEntry]:
+		return map(IndexEntry, map(Instant._from_epoch_nanoseconds, self._epoch_nanoseconds), self._row_ids)
+
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._epoch_nanoseconds == other._epoch_nanoseconds and self._row_ids == other._row_ids  # type: ignore
+
+	def append(self, instant: 'Instant | str', /, row_id: int | None = None):
+		# O(1) for instants at or after the last one, the usual case for event
+		# streams; anything earlier is inserted in place. The two arrays are
+		# updated one after the other, so appending while other threads read
+		# needs a lock around both; queries alone are safe to share.
+		value = _key(instant)
+		values = self._epoch_nanoseconds
+		if row_id is None:
+			row_id = len(values)
+		if not values or value >= values[-1]:
+			values.append(value)
+			self._row_ids.append(row_id)
+		else:
+			index = bisect_right(values, value)
+			values.insert(index, value)
+			self._row_ids.insert(index, row_id)
+
+	def between(self, start: 'Instant | str', end: 'Instant | str', /) -> Self:
+		# the entries from start up to but excluding end
+		values = self._epoch_nanoseconds
+		low = bisect_left(values, _key(start))
+		high = bisect_left(values, _key(end), low)
+		return self._from_arrays(values[low:high], self._row_ids[low:high])
+
+	def asof(self, instant: 'Instant | str', /) -> IndexEntry | None:
+		# the last entry at or before instant
+		index = bisect_right(self._epoch_nanoseconds, _key(instant)) - 1
+		if index < 0:
+			return None
+		return self[index]
+
+	def nearest(self, instant: 'Instant | str', /) -> IndexEntry | None:
+		# the entry closest to instant; the earlier one on a tie
+		values = self._epoch_nanoseconds
+		if not values:
+			return None
+		value = _key(instant)
+		index = bisect_left(values, value)
+		if index == len(values) or index and value - values[index - 1] <= values[index] - value:
+			index -= 1
+		return self[index]
+
+	def merge(self, other: 'InstantIndex', /) -> Self:
+		# a new index with the entries of both, ours first among equal instants;
+		# the sort sees two ascending runs and merges them in linear time
+		values = self._epoch_nanoseconds + other._epoch_nanoseconds
+		row_ids = self._row_ids + other._row_ids
+		order = sorted(range(len(values)), key = values.__getitem__)
+		return self._from_arrays(array('q', [values[i] for i in order]), array('q', [row_ids[i] for i in order]))
+
+	def __repr__(self):
+		return f'{type(self).__name__}({self.instants!r}, row_ids = {self._row_ids.tolist()})'
@@ -0,0 +1,149 @@
+from array import array
+from typing import TYPE_CHECKING, Any, Iterable, Literal, TypedDict, overload
+
+from ._calendar import day_of_week, iso_from_epoch_days, iso_week
+from ._deferred import deferred_module
+from ._instant import Instant
+from ._plain_date import PlainDate
+from ._plain_date_time import PlainDateTime
+from ._time_zone import TimeZone
+
+if TYPE_CHECKING:
+	import numpy
+
+__all__ = ['ISOFieldsColumns', 'get_iso_fields_columns']
+
+# (name, array typecode, numpy dtype); the ISOFields keys, then the derived columns
+_COLUMNS = (
+	('iso_year', 'i', 'i4'),
+	('iso_month', 'b', 'i1'),
+	('iso_day', 'b', 'i1'),
+	('iso_hour', 'b', 'i1'),
+	('iso_minute', 'b', 'i1'),
+	('iso_second', 'b', 'i1'),
+	('iso_millisecond', 'h', 'i2'),
+	('iso_microsecond', 'h', 'i2'),
+	('iso_nanosecond', 'h', 'i2'),
+	('day_of_week', 'b', 'i1'),
+	('week_of_year', 'b', 'i1'),
+	('offset_nanoseconds', 'q', 'i8'),
+)
+
+
+class ISOFieldsColumns(TypedDict):
+	iso_year: 'array[int]'
+	iso_month: 'array[int]'
+	iso_day: 'array[int]'
+	iso_hour: 'array[int]'
+	iso_minute: 'array[int]'
+	iso_second: 'array[int]'
+	iso_millisecond: 'array[int]'
+	iso_microsecond: 'array[int]'
+	iso_nanosecond: 'array[int]'
+	day_of_week: 'array[int]'
+	week_of_year: 'array[int]'
+	offset_nanoseconds: 'array[int]'
+
+
+def _date_fields(epoch_days: int, /) -> tuple[int, int, int, int, int]:
+	year, month, day = iso_from_epoch_days(epoch_days)
+	return year, month, day, day_of_week(epoch_days), iso_week(year, month, day, epoch_days)[1]
+
+
+def _rows(wall_nanoseconds: Iterable[int], offsets: Iterable[int], /) -> list[tuple[int, ...]]:
+	# The date part is computed once per distinct day, which is the common
+	# case for timestamps clustered in time; the time part is plain divmods.
+	dates: dict[int, tuple[int, int, int, int, int]] = {}
+	rows: list[tuple[int, ...]] = []
+	append = rows.append
+	for wall, offset in zip(wall_nanoseconds, offsets):
+		days, nanoseconds = divmod(wall, 86400000000000)
+		date = dates.get(days)
+		if date is None:
+			date = dates[days] = _date_fields(days)
+		year, month, day, weekday, week = date
+		seconds, nanoseconds = divmod(nanoseconds, 1000000000)
+		append((year, month, day, seconds // 3600, seconds // 60 % 60, seconds % 60, nanoseconds // 1000000, nanoseconds // 1000 % 1000, nanoseconds % 1000, weekday, week, offset))
+	return rows
+
+
+def _wall_and_offset(thing: 'PlainDate | PlainDateTime | _zoned_date_time.ZonedDateTime | Instant', time_zone: TimeZone | None, /) -> tuple[int, int]:
+	if isinstance(thing, _zoned_date_time.ZonedDateTime):
+		return thing._wall_nanoseconds, thing._offset_nanoseconds
+	if isinstance(thing, Instant):
+		if time_zone is None:
+			raise TypeError('a time zone is required for Instant values')
+		epoch_nanoseconds = thing._epoch_nanoseconds
+		offset = time_zone._rules.offset_nanoseconds_for(epoch_nanoseconds)
+		return epoch_nanoseconds + offset, offset
+	if isinstance(thing, PlainDateTime):
+		return thing._wall_nanoseconds, 0
+	if isinstance(thing, PlainDate):
+		return thing._epoch_days * 86400000000000, 0
+	raise TypeError(f'expected PlainDate, PlainDateTime, ZonedDateTime or Instant, got {type(thing).__name__}')
+
+
+def _columns(rows: list[tuple[int, ...]], as_numpy: bool, /) -> 'ISOFieldsColumns | numpy.ndarray[Any, Any]':
+	columns = list(zip(*rows)) if rows else [()] * len(_COLUMNS)
+	if as_numpy:
+		import numpy
+		result = numpy.empty(len(rows), dtype = [(name, dtype) for name, _, dtype in _COLUMNS])
+		for (name, _, _), column in zip(_COLUMNS, columns):
+			result[name] = column
+		return result
+	return ISOFieldsColumns(**{name: array(typecode, column) for (name, typecode, _), column in zip(_COLUMNS, columns)})  # type: ignore
+
+
+def _columns_for_epoch_nanoseconds(epoch_nanoseconds: Iterable[int], time_zone: TimeZone, as_numpy: bool, /) -> 'ISOFieldsColumns | numpy.ndarray[Any, Any]':
+	offset_for = time_zone._rules.offset_nanoseconds_for
+	offsets = [offset_for(value) for value in epoch_nanoseconds]
+	return _columns(_rows([value + offset for value, offset in zip(epoch_nanoseconds, offsets)], offsets), as_numpy)
+
+
+@overload
+def get_iso_fields_columns(
+	things: 'Iterable[PlainDate | PlainDateTime | _zoned_date_time.ZonedDateTime | Instant]',
+	/,
+	time_zone: 'TimeZone | str | None' = None,
+	*,
+	as_numpy: Literal[False] = False,
+) -> ISOFieldsColumns:
+	...
+
+
+@overload
+def get_iso_fields_columns(
+	things: 'Iterable[PlainDate | PlainDateTime | _zoned_date_time.ZonedDateTime | Instant]',
+	/,
+	time_zone: 'TimeZone | str | None' = None,
+	*,
+	as_numpy: Literal[True],
+) -> 'numpy.ndarray[Any, Any]':
+	...
+
+
+def get_iso_fields_columns(
+	things: 'Iterable[PlainDate | PlainDateTime | _zoned_date_time.ZonedDateTime | Instant]',
+	/,
+	time_zone: 'TimeZone | str | None' = None,
+	*,
+	as_numpy: bool = False,
+) -> 'ISOFieldsColumns | numpy.ndarray[Any, Any]':
+	# get_iso_fields for many values at once, as one array per field instead of
+	# one dict per value. Instants are viewed in time_zone; ZonedDateTimes keep
+	# their own zone; plain types have no offset and get 0.
+	if isinstance(time_zone, str):
+		time_zone = TimeZone(time_zone)
+	if isinstance(things, _instant_array.InstantArray):
+		if time_zone is None:
+			raise TypeError('a time zone is required for Instant values')
+		return _columns_for_epoch_nanoseconds(things._epoch_nanoseconds, time_zone, as_numpy)
+	pairs = [_wall_and_offset(thing, time_zone) for thing in things]
+	return _columns(_rows([wall for wall, _ in pairs], [offset for _, offset in pairs]), as_numpy)
+
+
+if TYPE_CHECKING:
+	from . import _instant_array, _zoned_date_time
+else:
+	_instant_array = deferred_module(globals(), '_instant_array')
+	_zoned_date_time = deferred_module(globals(), '_zoned_date_time')
@@ -1,6 +1,8 @@
-import datetime as py_datetime
-
-from tzlocal import get_localzone_name
+import os
+import sys
+import time
+from functools import partial
+from typing import Callable
 
 from ._instant import Instant
 from ._plain_date import PlainDate
@@ -11,39 +13,138 @@ from ._zoned_date_time import ZonedDateTime
 
 __all__ = ['Now']
 
+_LOCALTIME = '/etc/localtime'
+
+# (TZ, /etc/localtime identity) -> TimeZone, replaced as a whole on change
+_local_time_zone: tuple[tuple[object, ...], TimeZone] | None = None
+
+# /etc/localtime is looked at again at most once per interval
+_STAT_INTERVAL = 1000000000
+# (time.monotonic_ns() of the next look, identity), replaced as a whole
+_localtime_identity: tuple[int, tuple[int, ...]] | None = None
+
+
+def _local_time_zone_key(force: bool = False, /) -> tuple[object, ...]:
+	# TZ is compared on every call, it is only an environ lookup
+	global _localtime_identity
+	now = time.monotonic_ns()
+	checked = _localtime_identity
+	if checked is not None and now < checked[0] and not force:
+		return (os.environ.get('TZ'), *checked[1])
+	try:
+		stat = os.lstat(_LOCALTIME)
+	except OSError:
+		identity = ()
+	else:
+		identity = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+	_localtime_identity = (now + _STAT_INTERVAL, identity)
+	return (os.environ.get('TZ'), *identity)
+
+
+def _load_local_time_zone(key: tuple[object, ...], /) -> TimeZone:
+	# tzlocal brings in logging and more, so it is only loaded once the local zone is needed
+	import tzlocal
+	global _local_time_zone
+	if _local_time_zone is not None:
+		# tzlocal caches the name forever, make it look again
+		tzlocal.reload_localzone()
+	time_zone = TimeZone(tzlocal.get_localzone_name())
+	_local_time_zone = (key, time_zone)
+	return time_zone
+
+
+def _get_local_time_zone() -> TimeZone:
+	key = _local_time_zone_key()
+	cached = _local_time_zone
+	if cached is not None and cached[0] == key:
+		return cached[1]
+	return _load_local_time_zone(key)
+
+
+def _coarse_clock() -> Callable[[], int]:
+	# CLOCK_REALTIME_COARSE returns the time of the last kernel tick without
+	# reading the clock source. The time module has no name for it, so the
+	# Linux clock id is used; elsewhere the coarse mode reads time_ns().
+	if sys.platform == 'linux':
+		read = partial(time.clock_gettime_ns, getattr(time, 'CLOCK_REALTIME_COARSE', 5))
+		try:
+			read()
+		except OSError:
+			pass
+		else:
+			return read
+	return time.time_ns
+
+
+_coarse_tick = 0
+_read_coarse_clock = _coarse_clock()
+# (start, end, Instant of start) of the current tick, replaced as a whole
+_coarse_window: tuple[int, int, Instant | None] = (0, 0, None)
+
+
+def _coarse_instant(tick: int, /) -> Instant:
+	# All calls within one tick share one Instant, so they allocate nothing.
+	global _coarse_window
+	now = _read_coarse_clock()
+	start, end, cached = _coarse_window
+	if start <= now < end:
+		return cached  # type: ignore
+	start = now - now % tick
+	cached = Instant._from_epoch_nanoseconds(start)
+	_coarse_window = (start, start + tick, cached)
+	return cached
+
 
 class Now:
 
 	@staticmethod
 	def time_zone_id() -> str:
-		return get_localzone_name()
+		return _get_local_time_zone().id
+
+	@staticmethod
+	def refresh_time_zone_id() -> str:
+		# for zone changes that don't touch TZ or /etc/localtime, e.g. /etc/timezone
+		return _load_local_time_zone(_local_time_zone_key(True)).id
 
 	@staticmethod
 	def instant() -> Instant:
-		return Instant.from_py_datetimeutc(py_datetime.datetime.now(py_datetime.timezone.utc))
+		tick = _coarse_tick
+		if tick:
+			return _coarse_instant(tick)
+		return Instant._from_epoch_nanoseconds(time.time_ns())
+
+	@staticmethod
+	def set_coarse_clock(tick_nanoseconds: int | None = 1000000, /):
+		# Opt-in for hot logging paths: all calls within one tick share one
+		# Instant, truncated to the start of the tick. None turns it off. On
+		# Linux the time comes from the coarse kernel clock, which can lag the
+		# precise one by a few milliseconds.
+		global _coarse_tick, _coarse_window
+		if tick_nanoseconds is not None and tick_nanoseconds <= 0:
+			raise ValueError(f'tick_nanoseconds must be positive: {tick_nanoseconds}')
+		_coarse_tick = tick_nanoseconds or 0
+		_coarse_window = (0, 0, None)
 
 	@staticmethod
 	def zoned_date_time_iso(time_zone: TimeZone | str | None = None, /) -> ZonedDateTime:
 		if isinstance(time_zone, str):
 			time_zone = TimeZone(time_zone)
 		elif time_zone is None:
-			time_zone = TimeZone(Now.time_zone_id())
-		return ZonedDateTime.from_py_datetimezoned(py_datetime.datetime.now(time_zone.py_tzinfo))
+			time_zone = _get_local_time_zone()
+		return ZonedDateTime(Now.instant().epoch_nanoseconds, time_zone)
 
 	@staticmethod
 	def plain_date_time_iso(time_zone: TimeZone | str | None = None, /) -> PlainDateTime:
 		if isinstance(time_zone, str):
 			time_zone = TimeZone(time_zone)
-		return PlainDateTime.from_py_datetimenaive(py_datetime.datetime.now(time_zone.py_tzinfo if time_zone else None).replace(tzinfo = None))
+		elif time_zone is None:
+			time_zone = _get_local_time_zone()
+		return time_zone.get_plain_date_time_for(Now.instant())
 
 	@staticmethod
 	def plain_date_iso(time_zone: TimeZone | str | None = None, /) -> PlainDate:
-		if isinstance(time_zone, str):
-			time_zone = TimeZone(time_zone)
-		return PlainDate.from_py_date(py_datetime.datetime.now(time_zone.py_tzinfo if time_zone else None).date())
+		return Now.plain_date_time_iso(time_zone).to_plain_date()
 
 	@staticmethod
 	def plain_time_iso(time_zone: TimeZone | str | None = None, /) -> PlainTime:
-		if isinstance(time_zone, str):
-			time_zone = TimeZone(time_zone)
-		return PlainTime.from_py_time(py_datetime.datetime.now(time_zone.py_tzinfo if time_zone else None).time())
+		return Now.plain_date_time_iso(time_zone).to_plain_time()
@@ -0,0 +1,105 @@
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Literal, NamedTuple, TypeVar
+
+from ._calendar import epoch_days_from_iso
+from ._deferred import deferred_module
+from ._parser import parse_date_time, parse_offset
+
+__all__ = ['ParseError', 'parse_many', 'instant_nanoseconds_parser']
+
+T = TypeVar('T')
+
+
+class ParseError(NamedTuple):
+	index: int
+	text: str
+	error: ValueError
+
+
+_FRACTION_SCALE = (0, 100000000, 10000000, 1000000, 100000, 10000, 1000, 100, 10, 1)
+
+# per-parser caches are cleared instead of growing without bound
+_MAX_CACHED = 4096
+
+
+def instant_nanoseconds_parser(minimum: int | None = None, maximum: int | None = None, /) -> Callable[[str], int]:
+	# Log files repeat the same layout and the same few dates on every row, so
+	# the epoch day of each YYYY-MM-DD prefix and the value of each offset suffix
+	# are looked up in a dict instead of being parsed again. Rows that don't
+	# have the YYYY-MM-DDTHH:MM:SS[.fraction](Z|+HH:MM) shape, or whose prefix
+	# hasn't been seen yet, go through the full parser and seed the caches.
+	# Rows outside minimum..maximum, the Instant range by default, are errors
+	# like any other, so errors = 'skip' skips them.
+	days_cache: dict[str, int] = {}
+	offsets_cache: dict[str, int] = {'Z': 0, 'z': 0}
+	if minimum is None:
+		minimum = -_instant._MAX_EPOCH_NANOSECONDS
+	if maximum is None:
+		maximum = _instant._MAX_EPOCH_NANOSECONDS
+
+	def parse(text: str, /) -> int:
+		if len(text) >= 20 and text[10] in 'Tt ' and text[13] == ':' and text[16] == ':':
+			days = days_cache.get(text[:10])
+			tail = text[19:]
+			suffix = tail[-1:] if tail[-1] in 'Zz' else tail[-6:]
+			offset = offsets_cache.get(suffix)
+			if days is not None and offset is not None:
+				time = text[11:13] + text[14:16] + text[17:19]
+				fraction = tail[:-len(suffix)]
+				digits = fraction[1:]
+				if time.isdigit() and time.isascii() and (not fraction or (fraction[0] in '.,' and 0 < len(digits) < 10 and digits.isdigit() and digits.isascii())):
+					hour, minute, second = int(time[0:2]), int(time[2:4]), int(time[4:6])
+					if hour < 24 and minute < 60 and second < 60:
+						nanoseconds = int(digits) * _FRACTION_SCALE[len(digits)] if digits else 0
+						epoch_nanoseconds = (days * 86400 + hour * 3600 + minute * 60 + second) * 1000000000 + nanoseconds - offset
+						if not minimum <= epoch_nanoseconds <= maximum:
+							raise ValueError(f'date-time out of range: {text!r}')
+						return epoch_nanoseconds
+
+		parsed = parse_date_time(text)
+		epoch_nanoseconds = parsed.epoch_nanoseconds
+		if epoch_nanoseconds is None:
+			raise ValueError(f'Instant string must have a UTC offset or Z: {text!r}')
+		if not minimum <= epoch_nanoseconds <= maximum:
+			raise ValueError(f'date-time out of range: {text!r}')
+		if len(text) >= 20 and text[4] == '-' and text[7] == '-' and parsed.time_zone is None:
+			if len(days_cache) >= _MAX_CACHED:
+				days_cache.clear()
+			days_cache[text[:10]] = epoch_days_from_iso(parsed.year, parsed.month, parsed.day)
+			if not parsed.utc_designator and len(offsets_cache) < _MAX_CACHED and text[-6] in '+-' and text[-3] == ':':
+				offsets_cache[text[-6:]] = parse_offset(text[-6:])
+		return epoch_nanoseconds
+
+	return parse
+
+
+def parse_many(
+	parse_row: Callable[[str], T],
+	source: Iterable[str],
+	/,
+	*,
+	errors: Literal['raise', 'skip'] | list[ParseError] = 'raise',
+) -> Iterator[T]:
+	# Lines are stripped, so a text file can be passed as the source directly.
+	# Passing a list as `errors` skips bad rows and appends them to that list.
+	# checked here rather than in the generator, so a bad option fails at the call
+	if errors != 'raise' and errors != 'skip' and not isinstance(errors, list):
+		raise ValueError(f"errors must be 'raise', 'skip' or a list: {errors!r}")
+	return _parse_rows(parse_row, source, errors)
+
+
+def _parse_rows(parse_row: Callable[[str], T], source: Iterable[str], errors: Literal['raise', 'skip'] | list[ParseError], /) -> Iterator[T]:
+	for index, row in enumerate(source):
+		text = row.strip()
+		try:
+			yield parse_row(text)
+		except ValueError as e:
+			if errors == 'raise':
+				raise ValueError(f'row {index}: {e}') from e
+			if errors != 'skip':
+				errors.append(ParseError(index, text, e))
+
+
+if TYPE_CHECKING:
+	from . import _instant
+else:
+	_instant = deferred_module(globals(), '_instant')
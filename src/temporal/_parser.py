@@ -0,0 +1,224 @@
+import re
+from typing import NamedTuple
+
+from ._calendar import days_in_month, epoch_days_from_iso
+
+__all__ = ['ParsedDateTime', 'parse_date_time', 'parse_time', 'parse_offset', 'parse_duration']
+
+# RFC 9557 / ISO 8601 strings as accepted by Temporal, e.g.
+# 2024-04-21T05:40:53.582028123+02:00[Europe/Warsaw][u-ca=iso8601]
+
+
+class ParsedDateTime(NamedTuple):
+	year: int
+	month: int
+	day: int
+	hour: int
+	minute: int
+	second: int
+	nanosecond: int  # sub-second part, 0-999999999
+	has_time: bool
+	utc_designator: bool  # 'Z'
+	offset_nanoseconds: int | None
+	time_zone: str | None
+	calendar: str | None
+
+	@property
+	def wall_nanoseconds(self) -> int:
+		# nanoseconds since 1970-01-01T00:00 on the wall clock, ignoring any offset
+		return (epoch_days_from_iso(self.year, self.month, self.day) * 86400 + self.hour * 3600 + self.minute * 60 + self.second) * 1000000000 + self.nanosecond
+
+	@property
+	def epoch_nanoseconds(self) -> int | None:
+		if self.utc_designator:
+			return self.wall_nanoseconds
+		if self.offset_nanoseconds is not None:
+			return self.wall_nanoseconds - self.offset_nanoseconds
+		return None
+
+
+_FRACTION = r'[.,]\d{1,9}'
+_OFFSET = rf'[+-]\d{{2}}(?::?\d{{2}}(?::?\d{{2}}(?:{_FRACTION})?)?)?'
+_TIME = rf'(?P<hour>\d{{2}})(?:(?P<colon>:?)(?P<minute>\d{{2}})(?:(?P=colon)(?P<second>\d{{2}})(?:[.,](?P<fraction>\d{{1,9}}))?)?)?'
+_TAIL = rf'(?P<utc>[Zz])?(?P<offset>{_OFFSET})?(?P<annotations>(?:\[[^\[\]]*\])*)'
+
+_date_time_match = re.compile(
+	rf'(?P<year>[+-]\d{{6}}|\d{{4}})(?P<dash>-?)(?P<month>\d{{2}})(?P=dash)(?P<day>\d{{2}})(?:[Tt ]{_TIME})?{_TAIL}',
+	re.ASCII,
+).fullmatch
+_time_match = re.compile(rf'[Tt]?{_TIME}{_TAIL}', re.ASCII).fullmatch
+_fast_tail_match = re.compile(rf'(?:[.,](?P<fraction>\d{{1,9}}))?{_TAIL}', re.ASCII).fullmatch
+_offset_match = re.compile(rf'(?P<sign>[+-])(?P<hour>\d{{2}})(?::?(?P<minute>\d{{2}})(?::?(?P<second>\d{{2}})(?:[.,](?P<fraction>\d{{1,9}}))?)?)?', re.ASCII).fullmatch
+_duration_match = re.compile(
+	r'(?P<sign>[+-])?[Pp](?:(?P<years>\d+)[Yy])?(?:(?P<months>\d+)[Mm])?(?:(?P<weeks>\d+)[Ww])?(?:(?P<days>\d+)[Dd])?'
+	r'(?P<time>[Tt](?:(?P<hours>\d+)(?:[.,](?P<hours_fraction>\d{1,9}))?[Hh])?(?:(?P<minutes>\d+)(?:[.,](?P<minutes_fraction>\d{1,9}))?[Mm])?(?:(?P<seconds>\d+)(?:[.,](?P<seconds_fraction>\d{1,9}))?[Ss])?)?',
+	re.ASCII,
+).fullmatch
+_annotation_match = re.compile(r'\[(?P<critical>!?)(?:(?P<key>[a-z_][a-z0-9_-]*)=(?P<value>[A-Za-z0-9-]+)|(?P<time_zone>[^=\[\]!][^=\[\]]*))\]', re.ASCII).match
+
+
+def _fraction_nanoseconds(fraction: str | None, /) -> int:
+	if not fraction:
+		return 0
+	return int(fraction) * 10**(9 - len(fraction))
+
+
+def parse_offset(text: str, /) -> int:
+	match = _offset_match(text)
+	if not match:
+		raise ValueError(f'invalid UTC offset: {text!r}')
+	hour, minute, second = int(match['hour']), int(match['minute'] or 0), int(match['second'] or 0)
+	if hour > 23 or minute > 59 or second > 59:
+		raise ValueError(f'invalid UTC offset: {text!r}')
+	nanoseconds = (hour * 3600 + minute * 60 + second) * 1000000000 + _fraction_nanoseconds(match['fraction'])
+	return -nanoseconds if match['sign'] == '-' else nanoseconds
+
+
+def _parse_annotations(text: str, /) -> tuple[str | None, str | None]:
+	time_zone = None
+	calendar = None
+	pos = 0
+	while pos < len(text):
+		match = _annotation_match(text, pos)
+		if not match:
+			raise ValueError(f'invalid annotation: {text[pos:]!r}')
+		if match['time_zone']:
+			if pos:
+				raise ValueError(f'time zone annotation must come first: {text!r}')
+			time_zone = match['time_zone']
+		elif match['key'] == 'u-ca':
+			if calendar is None:
+				calendar = match['value']
+			elif match['critical']:
+				raise ValueError(f'conflicting calendar annotations: {text!r}')
+		elif match['critical']:
+			raise ValueError(f'unknown critical annotation: {match[0]!r}')
+		pos = match.end()
+	if calendar is not None and calendar.lower() != 'iso8601':
+		raise ValueError(f'unsupported calendar: {calendar!r}')
+	return time_zone, calendar
+
+
+def _check_time(hour: int, minute: int, second: int, text: str, /) -> int:
+	if hour > 23 or minute > 59 or second > 60:
+		raise ValueError(f'invalid time: {text!r}')
+	# leap seconds are accepted and clamped, as in Temporal
+	return 59 if second == 60 else second
+
+
+def _check_date(year: int, month: int, day: int, text: str, /):
+	if not 1 <= month <= 12 or not 1 <= day <= days_in_month(year, month):
+		raise ValueError(f'invalid date: {text!r}')
+
+
+def _finish(year: int, month: int, day: int, hour: int, minute: int, second: int, nanosecond: int, has_time: bool, tail: 're.Match[str]', text: str, /) -> ParsedDateTime:
+	_check_date(year, month, day, text)
+	second = _check_time(hour, minute, second, text)
+	offset = tail['offset']
+	time_zone, calendar = _parse_annotations(tail['annotations']) if tail['annotations'] else (None, None)
+	return ParsedDateTime(
+		year,
+		month,
+		day,
+		hour,
+		minute,
+		second,
+		nanosecond,
+		has_time,
+		tail['utc'] is not None,
+		parse_offset(offset) if offset else None,
+		time_zone,
+		calendar,
+	)
+
+
+def parse_date_time(text: str, /) -> ParsedDateTime:
+	# Fast path for the common fixed-width YYYY-MM-DDTHH:MM:SS prefix: fields are
+	# sliced at known positions and only the short tail goes through a regex.
+	if len(text) >= 19 and text[4] == '-' and text[7] == '-' and text[10] in 'Tt ' and text[13] == ':' and text[16] == ':':
+		head = text[0:4] + text[5:7] + text[8:10] + text[11:13] + text[14:16] + text[17:19]
+		if head.isdigit() and head.isascii():
+			tail = _fast_tail_match(text, 19)
+			if tail and not (tail['utc'] and tail['offset']):
+				return _finish(
+					int(head[0:4]),
+					int(head[4:6]),
+					int(head[6:8]),
+					int(head[8:10]),
+					int(head[10:12]),
+					int(head[12:14]),
+					_fraction_nanoseconds(tail['fraction']),
+					True,
+					tail,
+					text,
+				)
+
+	match = _date_time_match(text)
+	if not match or (match['utc'] and match['offset']) or match['year'] == '-000000':
+		raise ValueError(f'invalid ISO 8601 string: {text!r}')
+	has_time = match['hour'] is not None
+	if not has_time and (match['utc'] or match['offset']):
+		raise ValueError(f'invalid ISO 8601 string: {text!r}')
+	return _finish(
+		int(match['year']),
+		int(match['month']),
+		int(match['day']),
+		int(match['hour'] or 0),
+		int(match['minute'] or 0),
+		int(match['second'] or 0),
+		_fraction_nanoseconds(match['fraction']),
+		has_time,
+		match,
+		text,
+	)
+
+
+def parse_time(text: str, /) -> ParsedDateTime:
+	# A bare time, or the time part of a full date-time string. The date fields
+	# of the result are set to 1970-01-01 when the string has no date.
+	match = _time_match(text)
+	if match and not (match['utc'] and match['offset']):
+		return _finish(1970, 1, 1, int(match['hour']), int(match['minute'] or 0), int(match['second'] or 0), _fraction_nanoseconds(match['fraction']), True, match, text)
+	parsed = parse_date_time(text)
+	if not parsed.has_time:
+		raise ValueError(f'invalid ISO 8601 time string: {text!r}')
+	return parsed
+
+
+def parse_duration(text: str, /) -> tuple[int, int, int, int, int, int, int, int, int, int]:
+	# ISO 8601 durations, e.g. -P1Y2M3W4DT5H6M7.008009010S. Only the smallest
+	# time component may have a fraction, which is spread over the smaller fields.
+	match = _duration_match(text)
+	if (
+		not match
+		or match['time'] is not None and not (match['hours'] or match['minutes'] or match['seconds'])
+		or not (match['years'] or match['months'] or match['weeks'] or match['days'] or match['time'])
+		or match['hours_fraction'] and (match['minutes'] or match['seconds'])
+		or match['minutes_fraction'] and match['seconds']
+	):
+		raise ValueError(f'invalid ISO 8601 duration string: {text!r}')
+	if match['hours_fraction']:
+		fraction = _fraction_nanoseconds(match['hours_fraction']) * 3600
+	elif match['minutes_fraction']:
+		fraction = _fraction_nanoseconds(match['minutes_fraction']) * 60
+	else:
+		fraction = _fraction_nanoseconds(match['seconds_fraction'])
+	minutes, fraction = divmod(fraction, 60000000000)
+	seconds, fraction = divmod(fraction, 1000000000)
+	milliseconds, fraction = divmod(fraction, 1000000)
+	microseconds, nanoseconds = divmod(fraction, 1000)
+	fields = (
+		int(match['years'] or 0),
+		int(match['months'] or 0),
+		int(match['weeks'] or 0),
+		int(match['days'] or 0),
+		int(match['hours'] or 0),
+		int(match['minutes'] or 0) + minutes,
+		int(match['seconds'] or 0) + seconds,
+		milliseconds,
+		microseconds,
+		nanoseconds,
+	)
+	if match['sign'] == '-':
+		return tuple(-field for field in fields)  # type: ignore
+	return fields
@@ -1,87 +1,47 @@
 import datetime as py_datetime
-from dataclasses import dataclass
-from typing import Literal, Self, TypedDict
-
-from ._duration import Duration
-from ._time_zone import TimeZone
+from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, Self, TypedDict
+
+from ._calendar import add_iso_date, day_of_week, day_of_year, days_in_month, difference_iso_date, epoch_days_from_iso, is_leap_year, iso_from_epoch_days, iso_week
+from ._deferred import deferred_module
+from ._duration import Duration, round_settings
+from ._formatter import format_date
+from ._parse_many import ParseError, parse_many
+from ._parser import parse_date_time
+from ._rounding import negated
+from ._wire import PLAIN_DATE, iter_unpack, pack, pack_column, unpack
 
 __all__ = ['PlainDate']
 
+# date(1970, 1, 1).toordinal()
+_EPOCH_ORDINAL = 719163
 
-@dataclass(frozen = True)
-class _PlainDateBase:
-	py_date: py_datetime.date
+# Temporal's range for dates: -271821-04-19 to +275760-09-13
+_MIN_EPOCH_DAYS = -100000001
+_MAX_EPOCH_DAYS = 100000000
 
-	@classmethod
-	def from_py_date(cls, py_date: py_datetime.date, /):
-		return cls(py_date = py_date)
 
+class _DateFields:
+	# Calendar properties shared by every type with a date part. Subclasses
+	# provide _iso_date (year, month, day) and _epoch_days (days since 1970-01-01).
+	__slots__ = ()
 
-@dataclass(frozen = True)
-class PlainDate(_PlainDateBase):
-
-	def __init__(
-		self,
-		iso_year: int | None = None,
-		iso_month: int | None = None,
-		iso_day: int | None = None,
-		/,
-		calendar: Literal['iso8601'] = 'iso8601',
-		*,
-		py_date: py_datetime.date | None = None,
-	):
-		if py_date:
-			super().__init__(py_date)
-		else:
-			assert iso_year
-			assert iso_month
-			assert iso_day
-			super().__init__(py_datetime.date(iso_year, iso_month, iso_day))
+	_iso_date: tuple[int, int, int]
+	_epoch_days: int
 
 	@classmethod
-	def from_(
+	def from_iter(
 		cls,
-		thing: 'PlainDate | str',
+		source: Iterable[str],
 		/,
 		*,
-		overflow: Literal['constrain', 'reject'] = 'constrain',
-	) -> Self:
-		if isinstance(thing, PlainDate):
-			return cls(py_date = thing.py_date.replace())
-		# TODO parse
-		return cls(py_date = py_datetime.date(2000, 1, 1))
-
-	def with_(
-		self,
-		/,
-		*,
-		year: int | None = None,
-		month: int | None = None,
-		day: int | None = None,
-		overflow: Literal['constrain', 'reject'] = 'constrain',
-	) -> Self:
-		# TODO other props
-		return type(self)(
-			year if year is not None else self.year,
-			month if month is not None else self.month,
-			day if day is not None else self.day,
-		)
-
-	@property
-	def year(self, /) -> int:
-		return self.py_date.year
-
-	@property
-	def month(self, /) -> int:
-		return self.py_date.month
+		errors: Literal['raise', 'skip'] | list[ParseError] = 'raise',
+	) -> Iterator[Self]:
+		return parse_many(cls.from_, source, errors = errors)  # type: ignore
 
 	@property
 	def month_code(self, /) -> str:
-		return f'M{self.py_date.month:02}'
-
-	@property
-	def day(self, /) -> int:
-		return self.py_date.day
+		return f'M{self._iso_date[1]:02}'
 
 	@property
 	def calendarId(self, /) -> str:
@@ -97,19 +57,19 @@ class PlainDate(_PlainDateBase):
 
 	@property
 	def day_of_week(self, /) -> int:
-		return self.py_date.isoweekday()
+		return day_of_week(self._epoch_days)
 
 	@property
 	def day_of_year(self, /) -> int:
-		return (self.py_date - py_datetime.date(self.py_date.year, 1, 1)).days + 1
+		return day_of_year(*self._iso_date)
 
 	@property
 	def week_of_year(self, /) -> int:
-		return self.py_date.isocalendar().week
+		return iso_week(*self._iso_date, self._epoch_days)[1]
 
 	@property
 	def year_of_week(self, /) -> int:
-		return self.py_date.isocalendar().year
+		return iso_week(*self._iso_date, self._epoch_days)[0]
 
 	@property
 	def days_in_week(self, /) -> int:
@@ -117,15 +77,12 @@ class PlainDate(_PlainDateBase):
 
 	@property
 	def days_in_month(self, /) -> int:
-		d = self.py_date
-		while d.month == self.py_date.month:
-			d += py_datetime.timedelta(days = 1)
-		d -= py_datetime.timedelta(days = 1)
-		return d.day
+		year, month, _ = self._iso_date
+		return days_in_month(year, month)
 
 	@property
 	def days_in_year(self, /) -> int:
-		return (py_datetime.datetime(self.year, 12, 31) - py_datetime.datetime(self.year, 1, 1)).days + 1
+		return 366 if is_leap_year(self._iso_date[0]) else 365
 
 	@property
 	def months_in_year(self, /) -> int:
@@ -133,7 +90,160 @@ class PlainDate(_PlainDateBase):
 
 	@property
 	def in_leap_year(self, /) -> bool:
-		return self.days_in_year == 366
+		return is_leap_year(self._iso_date[0])
+
+	def to_plain_date(self) -> 'PlainDate':
+		return PlainDate._from_epoch_days(self._epoch_days)
+
+
+class _PlainDateBase:
+	__slots__ = ('_epoch_days', '_iso_date')
+
+	_epoch_days: int
+	# (year, month, day), kept next to _epoch_days so that fields are plain reads
+	_iso_date: tuple[int, int, int]
+
+	def __setattr__(self, name: str, value: Any, /):
+		raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+	def __delattr__(self, name: str, /):
+		raise FrozenInstanceError(f'cannot delete field {name!r}')
+
+	@property
+	def py_date(self) -> py_datetime.date:
+		return py_datetime.date.fromordinal(self._epoch_days + _EPOCH_ORDINAL)
+
+	@classmethod
+	def from_py_date(cls, py_date: py_datetime.date, /):
+		return cls._from_epoch_days(py_date.toordinal() - _EPOCH_ORDINAL)
+
+	@classmethod
+	def _from_epoch_days(cls, epoch_days: int, /) -> Self:
+		# Skips validation, for callers that already know the value is valid.
+		self = object.__new__(cls)
+		_set_epoch_days(self, epoch_days)
+		_set_iso_date(self, iso_from_epoch_days(epoch_days))
+		return self
+
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._epoch_days == other._epoch_days  # type: ignore
+
+	def __hash__(self) -> int:
+		return hash(self._epoch_days)
+
+	def __reduce__(self):
+		return (type(self), self._iso_date)
+
+	def __copy__(self) -> Self:
+		return self
+
+	def __deepcopy__(self, memo: dict[int, Any], /) -> Self:
+		return self
+
+
+_set_epoch_days = _PlainDateBase._epoch_days.__set__  # type: ignore
+_set_iso_date = _PlainDateBase._iso_date.__set__  # type: ignore
+
+
+class PlainDate(_PlainDateBase, _DateFields):
+	# Days since 1970-01-01, which compare and hash, and the ISO fields derived
+	# from them once on construction; the calendar properties are table lookups.
+	__slots__ = ()
+
+	def __init__(
+		self,
+		iso_year: int | None = None,
+		iso_month: int | None = None,
+		iso_day: int | None = None,
+		/,
+		calendar: Literal['iso8601'] = 'iso8601',
+		*,
+		py_date: py_datetime.date | None = None,
+	):
+		if py_date:
+			_set_epoch_days(self, py_date.toordinal() - _EPOCH_ORDINAL)
+			_set_iso_date(self, (py_date.year, py_date.month, py_date.day))
+			return
+		if iso_year is None or iso_month is None or iso_day is None:
+			raise TypeError('PlainDate.__init__() missing required positional arguments: iso_year, iso_month and iso_day')
+		if calendar != 'iso8601':
+			raise ValueError(f'unsupported calendar: {calendar!r}')
+		if not 1 <= iso_month <= 12 or not 1 <= iso_day <= days_in_month(iso_year, iso_month):
+			raise ValueError(f'invalid date: {iso_year}-{iso_month}-{iso_day}')
+		epoch_days = epoch_days_from_iso(iso_year, iso_month, iso_day)
+		if not _MIN_EPOCH_DAYS <= epoch_days <= _MAX_EPOCH_DAYS:
+			raise ValueError(f'date out of range: {iso_year}-{iso_month}-{iso_day}')
+		_set_epoch_days(self, epoch_days)
+		_set_iso_date(self, (iso_year, iso_month, iso_day))
+
+	@classmethod
+	def from_(
+		cls,
+		thing: 'PlainDate | _plain_date_time.PlainDateTime | str',
+		/,
+		*,
+		overflow: Literal['constrain', 'reject'] = 'constrain',
+	) -> Self:
+		if thing.__class__ is cls:
+			return thing  # type: ignore
+		if isinstance(thing, _DateFields):
+			return cls._from_epoch_days(thing._epoch_days)
+		parsed = parse_date_time(thing)
+		if parsed.utc_designator:
+			raise ValueError(f'Z designator not supported for PlainDate: {thing!r}')
+		return cls(parsed.year, parsed.month, parsed.day)
+
+	@classmethod
+	def _from_wire(cls, epoch_days: int, /) -> Self:
+		if not _MIN_EPOCH_DAYS <= epoch_days <= _MAX_EPOCH_DAYS:
+			raise ValueError(f'epoch days out of range: {epoch_days}')
+		return cls._from_epoch_days(epoch_days)
+
+	@classmethod
+	def from_bytes(cls, data: bytes | bytearray | memoryview, /) -> Self:
+		return cls._from_wire(unpack(PLAIN_DATE, data)[0])
+
+	@classmethod
+	def from_bytes_iter(cls, data: bytes | bytearray | memoryview, /) -> Iterator[Self]:
+		new = cls._from_wire
+		return (new(epoch_days) for epoch_days, in iter_unpack(PLAIN_DATE, data))
+
+	@staticmethod
+	def to_bytes_many(plain_dates: 'Iterable[PlainDate]', /) -> bytes:
+		return pack_column('i', [plain_date._epoch_days for plain_date in plain_dates])
+
+	def to_bytes(self) -> bytes:
+		return pack(PLAIN_DATE, self._epoch_days)
+
+	def with_(
+		self,
+		/,
+		*,
+		year: int | None = None,
+		month: int | None = None,
+		day: int | None = None,
+		overflow: Literal['constrain', 'reject'] = 'constrain',
+	) -> Self:
+		# TODO other props
+		return type(self)(
+			year if year is not None else self.year,
+			month if month is not None else self.month,
+			day if day is not None else self.day,
+		)
+
+	@property
+	def year(self, /) -> int:
+		return self._iso_date[0]
+
+	@property
+	def month(self, /) -> int:
+		return self._iso_date[1]
+
+	@property
+	def day(self, /) -> int:
+		return self._iso_date[2]
 
 	def add(
 		self,
@@ -143,8 +253,17 @@ class PlainDate(_PlainDateBase):
 	) -> 'PlainDate':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		if overflow not in ('constrain', 'reject'):
+			raise ValueError(f'invalid overflow: {overflow!r}')
+		# the time part counts in whole days, truncated towards zero
+		years, months, weeks, days = duration._fields[:4]
+		time_nanoseconds = duration._time_nanoseconds
+		days += time_nanoseconds // 86400000000000 if time_nanoseconds >= 0 else -(-time_nanoseconds // 86400000000000)
+		year, month, day = self._iso_date
+		epoch_days = add_iso_date(year, month, day, years, months, weeks, days, overflow)
+		if not _MIN_EPOCH_DAYS <= epoch_days <= _MAX_EPOCH_DAYS:
+			raise ValueError(f'date out of range: {self} + {duration}')
+		return self._from_epoch_days(epoch_days)
 
 	def subtract(
 		self,
@@ -154,8 +273,7 @@ class PlainDate(_PlainDateBase):
 	) -> 'PlainDate':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		return self.add(duration.negated(), overflow)
 
 	def until(
 		self,
@@ -169,8 +287,7 @@ class PlainDate(_PlainDateBase):
 	) -> 'Duration':
 		if not isinstance(other, type(self)):
 			other = type(self).from_(other)
-		# TODO
-		return Duration()
+		return self._difference(other, largest_unit, smallest_unit, rounding_increment, rounding_mode)
 
 	def since(
 		self,
@@ -184,11 +301,23 @@ class PlainDate(_PlainDateBase):
 	) -> 'Duration':
 		if not isinstance(other, type(self)):
 			other = type(self).from_(other)
-		# TODO
-		return Duration()
+		return self._difference(other, largest_unit, smallest_unit, rounding_increment, negated(rounding_mode)).negated()
+
+	def _difference(self, other: 'PlainDate', largest_unit: str, smallest_unit: str, rounding_increment: int, rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'], /) -> 'Duration':
+		# days are the default largest unit of PlainDate differences, and the
+		# difference is exact in days, so only the options need checking
+		if smallest_unit in ('year', 'month', 'week'):
+			raise ValueError(f'rounding to {smallest_unit!r} is not supported')
+		if smallest_unit != 'day':
+			raise ValueError(f'invalid smallest unit: {smallest_unit!r}')
+		if largest_unit == 'auto':
+			largest_unit = 'day'
+		elif largest_unit not in ('year', 'month', 'week', 'day'):
+			raise ValueError(f'invalid largest unit: {largest_unit!r}')
+		round_settings('day', rounding_increment, rounding_mode, 'date_time')
+		return Duration._from_fields((*difference_iso_date(self._iso_date, other._iso_date, largest_unit), 0, 0, 0, 0, 0, 0))
 
 	def to_string(self, /) -> str:
-		# TODO
 		return str(self)
 
 	def to_locale_string(self) -> str:  # TODO options
@@ -196,7 +325,7 @@ class PlainDate(_PlainDateBase):
 		return str(self)
 
 	def __str__(self):
-		return self.py_date.isoformat()
+		return format_date(*iso_from_epoch_days(self._epoch_days))
 
 	def __repr__(self):
 		return f'{type(self).__name__}.from_("{self}")'
@@ -206,12 +335,14 @@ class PlainDate(_PlainDateBase):
 		*,
 		plain_time: 'PlainTime | str',
 		time_zone: 'TimeZone',
+		disambiguation: Literal['compatible', 'earlier', 'later', 'reject'] = 'compatible',
 	) -> '_zoned_date_time.ZonedDateTime':
 		return _plain_date_time.PlainDateTime.to_zoned_date_time(
 			None,  # type: ignore
 			plain_date = self,
 			plain_time = plain_time,
 			time_zone = time_zone,
+			disambiguation = disambiguation,
 		)
 
 	def to_plain_date_time(
@@ -225,21 +356,24 @@ class PlainDate(_PlainDateBase):
 			plain_time = plain_time,
 		)
 
-	def to_plain_date(self) -> 'PlainDate':
-		return PlainDate.from_py_date(self.py_date)
-
 	class ISOFields(TypedDict):
 		iso_year: int
 		iso_month: int
 		iso_day: int
 
 	def get_iso_fields(self) -> ISOFields:
+		year, month, day = self._iso_date
 		return PlainDate.ISOFields(
-			iso_year = self.year,
-			iso_month = self.month,
-			iso_day = self.day,
+			iso_year = year,
+			iso_month = month,
+			iso_day = day,
 		)
 
 
-from . import _plain_date_time, _zoned_date_time  # type: ignore
-from ._plain_time import PlainTime
+if TYPE_CHECKING:
+	from . import _plain_date_time, _zoned_date_time
+	from ._plain_time import PlainTime
+	from ._time_zone import TimeZone
+else:
+	_plain_date_time = deferred_module(globals(), '_plain_date_time')
+	_zoned_date_time = deferred_module(globals(), '_zoned_date_time')
@@ -1,37 +1,98 @@
 import datetime as py_datetime
-from dataclasses import dataclass
-from typing import Literal, Self
+from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, Self
 
-from ._duration import Duration
-from ._plain_date import PlainDate
+from ._calendar import add_iso_date, days_in_month, difference_iso_date, epoch_days_from_iso, epoch_nanoseconds_from_iso_date_time, iso_date_time_from_epoch_nanoseconds, iso_from_epoch_days
+from ._deferred import deferred_module
+from ._duration import Duration, difference_settings, round_settings
+from ._formatter import DEFAULT_PLAN, format_plan
+from ._instant import _MAX_EPOCH_NANOSECONDS
+from ._parser import parse_date_time
+from ._plain_date import PlainDate, _DateFields
 from ._plain_time import PlainTime
-from ._time_zone import TimeZone
+from ._rounding import as_if_positive, negated, round_to_increment
+from ._wire import PLAIN_DATE_TIME, iter_unpack, pack, pack_column, unpack
 
 __all__ = ['PlainDateTime']
 
+# Temporal allows wall-clock times up to a day beyond the instant range
+_MAX_WALL_NANOSECONDS = _MAX_EPOCH_NANOSECONDS + 86400000000000
+
+_IsoDateTime = tuple[int, int, int, int, int, int, int, int, int]
+
+
+def _check_iso_date_time(iso_date_time: _IsoDateTime, /):
+	year, month, day, hour, minute, second, millisecond, microsecond, nanosecond = iso_date_time
+	if not 1 <= month <= 12 or not 1 <= day <= days_in_month(year, month):
+		raise ValueError(f'invalid date: {year}-{month}-{day}')
+	if not (0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59 and 0 <= millisecond <= 999 and 0 <= microsecond <= 999 and 0 <= nanosecond <= 999):
+		raise ValueError(f'invalid time: {hour}:{minute}:{second}.{millisecond:03}{microsecond:03}{nanosecond:03}')
+	if not -_MAX_WALL_NANOSECONDS < epoch_nanoseconds_from_iso_date_time(*iso_date_time) < _MAX_WALL_NANOSECONDS:
+		raise ValueError(f'date-time out of range: {year}-{month}-{day}')
+
 
-@dataclass(frozen = True)
 class _PlainDateTimeBase:
-	py_datetimenaive: py_datetime.datetime
+	__slots__ = ('_iso_date_time', )
+
+	# year, month, day, hour, minute, second, millisecond, microsecond, nanosecond
+	_iso_date_time: _IsoDateTime
 
-	def __post_init__(self):
-		assert self.py_datetimenaive.tzinfo is None
+	def __setattr__(self, name: str, value: Any, /):
+		raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+	def __delattr__(self, name: str, /):
+		raise FrozenInstanceError(f'cannot delete field {name!r}')
+
+	@property
+	def py_datetimenaive(self) -> py_datetime.datetime:
+		year, month, day, hour, minute, second, millisecond, microsecond, _ = self._iso_date_time
+		return py_datetime.datetime(year, month, day, hour, minute, second, millisecond * 1000 + microsecond)
 
 	@classmethod
 	def from_py_datetimenaive(cls, py_datetimenaive: py_datetime.datetime):
 		return cls(py_datetimenaive = py_datetimenaive)
 
+	@classmethod
+	def _new(cls, iso_date_time: _IsoDateTime, /) -> Self:
+		# Skips validation, for callers that already know the fields are valid.
+		self = object.__new__(cls)
+		_set_iso_date_time(self, iso_date_time)
+		return self
+
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._iso_date_time == other._iso_date_time  # type: ignore
+
+	def __hash__(self) -> int:
+		return hash(self._iso_date_time)
+
+	def __reduce__(self):
+		return (type(self), self._iso_date_time)
+
+	def __copy__(self) -> Self:
+		return self
+
+	def __deepcopy__(self, memo: dict[int, Any], /) -> Self:
+		return self
+
 
-@dataclass(frozen = True)
-class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
+_set_iso_date_time = _PlainDateTimeBase._iso_date_time.__set__  # type: ignore
+
+
+class PlainDateTime(_PlainDateTimeBase, _DateFields):
+	# The ISO fields are validated once and kept as a tuple of ints, so the
+	# accessors and get_iso_fields only index into it.
+	__slots__ = ()
 
 	@property
-	def py_date(self) -> py_datetime.date:  # type: ignore
-		return self.py_datetimenaive.date()
+	def py_date(self) -> py_datetime.date:
+		return py_datetime.date(*self._iso_date_time[:3])
 
 	@property
-	def py_time(self) -> py_datetime.time:  # type: ignore
-		return self.py_datetimenaive.time()
+	def py_time(self) -> py_datetime.time:
+		_, _, _, hour, minute, second, millisecond, microsecond, _ = self._iso_date_time
+		return py_datetime.time(hour, minute, second, millisecond * 1000 + microsecond)
 
 	def __init__(
 		self,
@@ -50,25 +111,62 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 		py_datetimenaive: py_datetime.datetime | None = None,
 	):
 		if py_datetimenaive:
-			super().__init__(py_datetimenaive)
-		else:
-			assert iso_year
-			assert iso_month
-			assert iso_day
-			super().__init__(py_datetime.datetime(iso_year, iso_month, iso_day, iso_hour, iso_minute, iso_second, iso_millisecond * 1000 + iso_microsecond))
+			assert py_datetimenaive.tzinfo is None
+			microsecond = py_datetimenaive.microsecond
+			_set_iso_date_time(self, (py_datetimenaive.year, py_datetimenaive.month, py_datetimenaive.day, py_datetimenaive.hour, py_datetimenaive.minute, py_datetimenaive.second, microsecond // 1000, microsecond % 1000, 0))
+			return
+		if iso_year is None or iso_month is None or iso_day is None:
+			raise TypeError('PlainDateTime.__init__() missing required positional arguments: iso_year, iso_month and iso_day')
+		if calendar != 'iso8601':
+			raise ValueError(f'unsupported calendar: {calendar!r}')
+		iso_date_time = (iso_year, iso_month, iso_day, iso_hour, iso_minute, iso_second, iso_millisecond, iso_microsecond, iso_nanosecond)
+		_check_iso_date_time(iso_date_time)
+		_set_iso_date_time(self, iso_date_time)
 
 	@classmethod
 	def from_(  # type: ignore
 			cls,
-			thing: 'PlainDateTime | str',
+			thing: 'PlainDateTime | _zoned_date_time.ZonedDateTime | PlainDate | str',
 			/,
 			*,
 			overflow: Literal['constrain', 'reject'] = 'constrain',
 	) -> Self:
-		if isinstance(thing, PlainDateTime):
-			return cls(py_datetimenaive = thing.py_datetimenaive.replace())
-		# TODO parse
-		return cls(py_datetimenaive = py_datetime.datetime(2000, 1, 1))
+		if thing.__class__ is cls:
+			return thing  # type: ignore
+		if isinstance(thing, (PlainDateTime, _zoned_date_time.ZonedDateTime)):
+			return cls._new(thing._iso_date_time)
+		if isinstance(thing, PlainDate):
+			return cls._new((*thing._iso_date, 0, 0, 0, 0, 0, 0))
+		parsed = parse_date_time(thing)
+		if parsed.utc_designator:
+			raise ValueError(f'Z designator not supported for PlainDateTime: {thing!r}')
+		return cls(
+			parsed.year,
+			parsed.month,
+			parsed.day,
+			parsed.hour,
+			parsed.minute,
+			parsed.second,
+			parsed.nanosecond // 1000000,
+			parsed.nanosecond // 1000 % 1000,
+			parsed.nanosecond % 1000,
+		)
+
+	@classmethod
+	def from_bytes(cls, data: bytes | bytearray | memoryview, /) -> Self:
+		return cls._new(iso_date_time_from_epoch_nanoseconds(unpack(PLAIN_DATE_TIME, data)[0]))
+
+	@classmethod
+	def from_bytes_iter(cls, data: bytes | bytearray | memoryview, /) -> Iterator[Self]:
+		new = cls._new
+		return (new(iso_date_time_from_epoch_nanoseconds(wall_nanoseconds)) for wall_nanoseconds, in iter_unpack(PLAIN_DATE_TIME, data))
+
+	@staticmethod
+	def to_bytes_many(plain_date_times: 'Iterable[PlainDateTime]', /) -> bytes:
+		return pack_column('q', [plain_date_time._wall_nanoseconds for plain_date_time in plain_date_times])
+
+	def to_bytes(self) -> bytes:
+		return pack(PLAIN_DATE_TIME, self._wall_nanoseconds)
 
 	def with_(
 		self,
@@ -86,49 +184,68 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 		overflow: Literal['constrain', 'reject'] = 'constrain',
 	) -> Self:
 		# TODO other props
-		return type(self)(
-			year if year is not None else self.year,
-			month if month is not None else self.month,
-			day if day is not None else self.day,
-			hour if hour is not None else self.hour,
-			minute if minute is not None else self.minute,
-			second if second is not None else self.second,
-			millisecond if millisecond is not None else self.millisecond,
-			microsecond if microsecond is not None else self.microsecond,
-			nanosecond if nanosecond is not None else self.nanosecond,
-		)
+		changes = (year, month, day, hour, minute, second, millisecond, microsecond, nanosecond)
+		return type(self)(*(field if change is None else change for field, change in zip(self._iso_date_time, changes)))
+
+	@property
+	def year(self, /) -> int:
+		return self._iso_date_time[0]
+
+	@property
+	def month(self, /) -> int:
+		return self._iso_date_time[1]
+
+	@property
+	def day(self, /) -> int:
+		return self._iso_date_time[2]
+
+	@property
+	def hour(self, /) -> int:
+		return self._iso_date_time[3]
+
+	@property
+	def minute(self, /) -> int:
+		return self._iso_date_time[4]
+
+	@property
+	def second(self, /) -> int:
+		return self._iso_date_time[5]
+
+	@property
+	def millisecond(self, /) -> int:
+		return self._iso_date_time[6]
+
+	@property
+	def microsecond(self, /) -> int:
+		return self._iso_date_time[7]
+
+	@property
+	def nanosecond(self, /) -> int:
+		return self._iso_date_time[8]
+
+	@property
+	def _iso_date(self) -> tuple[int, int, int]:
+		return self._iso_date_time[:3]  # type: ignore
+
+	@property
+	def _iso_time(self) -> tuple[int, int, int, int, int, int]:
+		return self._iso_date_time[3:]  # type: ignore
+
+	@property
+	def _epoch_days(self) -> int:
+		year, month, day = self._iso_date_time[:3]
+		return epoch_days_from_iso(year, month, day)
 
 	def with_plain_time(self, plain_time: 'PlainTime | str', /):
 		if isinstance(plain_time, str):
 			plain_time = PlainTime.from_(plain_time)
-		return type(self)(
-			self.year,
-			self.month,
-			self.day,
-			plain_time.hour,
-			plain_time.minute,
-			plain_time.second,
-			plain_time.millisecond,
-			plain_time.microsecond,
-			plain_time.nanosecond,
-		)
+		return type(self)._new((*self._iso_date_time[:3], *plain_time._iso_time))
 
 	def with_plain_date(self, plain_date: 'PlainDate | str', /):
 		if isinstance(plain_date, str):
 			plain_date = PlainDate.from_(plain_date)
 		assert plain_date.calendarId == 'iso8601'
-		return type(self)(
-			plain_date.year,
-			plain_date.month,
-			plain_date.day,
-			self.hour,
-			self.minute,
-			self.second,
-			self.millisecond,
-			self.microsecond,
-			self.nanosecond,
-			calendar = plain_date.calendarId,
-		)
+		return type(self)._new((*plain_date._iso_date, *self._iso_date_time[3:]))
 
 	def add(
 		self,
@@ -138,8 +255,19 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 	) -> 'PlainDateTime':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		if overflow not in ('constrain', 'reject'):
+			raise ValueError(f'invalid overflow: {overflow!r}')
+		wall_nanoseconds = self._wall_nanoseconds
+		years, months, weeks, days = duration._fields[:4]
+		if years or months or weeks or days:
+			# calendar units move the date and keep the time of day; the time part
+			# is exact after that and carries into the date
+			year, month, day = self._iso_date_time[:3]
+			wall_nanoseconds = add_iso_date(year, month, day, years, months, weeks, days, overflow) * 86400000000000 + wall_nanoseconds % 86400000000000
+		wall_nanoseconds += duration._time_nanoseconds
+		if not -_MAX_WALL_NANOSECONDS < wall_nanoseconds < _MAX_WALL_NANOSECONDS:
+			raise ValueError(f'date-time out of range: {self} + {duration}')
+		return self._new(iso_date_time_from_epoch_nanoseconds(wall_nanoseconds))
 
 	def subtract(
 		self,
@@ -149,8 +277,7 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 	) -> 'PlainDateTime':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		return self.add(duration.negated(), overflow)
 
 	def until(
 		self,
@@ -164,8 +291,7 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 	) -> 'Duration':
 		if not isinstance(other, type(self)):
 			other = type(self).from_(other)
-		# TODO
-		return Duration()
+		return self._difference(other, largest_unit, smallest_unit, rounding_increment, rounding_mode)
 
 	def since(
 		self,
@@ -179,8 +305,40 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 	) -> 'Duration':
 		if not isinstance(other, type(self)):
 			other = type(self).from_(other)
-		# TODO
-		return Duration()
+		return self._difference(other, largest_unit, smallest_unit, rounding_increment, negated(rounding_mode)).negated()
+
+	def _difference(self, other: 'PlainDateTime', largest_unit: str, smallest_unit: str, rounding_increment: int, rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'], /) -> 'Duration':
+		# days are the default largest unit of PlainDateTime differences
+		if largest_unit == 'auto':
+			largest_unit = 'day'
+		start = self._wall_nanoseconds
+		end = other._wall_nanoseconds
+		if largest_unit not in ('year', 'month', 'week', 'day'):
+			largest_unit, increment = difference_settings(largest_unit, smallest_unit, rounding_increment, rounding_mode)
+			return Duration._from_nanoseconds(round_to_increment(end - start, increment, rounding_mode), largest_unit)
+		if smallest_unit in ('year', 'month', 'week'):
+			raise ValueError(f'rounding to {smallest_unit!r} is not supported')
+		if smallest_unit == 'day':
+			increment = round_settings('day', rounding_increment, rounding_mode, 'date_time')
+		else:
+			increment = difference_settings('hour', smallest_unit, rounding_increment, rounding_mode)[1]
+		if start == end:
+			return Duration()
+		sign = 1 if end > start else -1
+		# the last day boundary, at the time of day of self, that does not pass
+		# other, with the time left after it
+		start_days, start_time = divmod(start, 86400000000000)
+		end_days, end_time = divmod(end, 86400000000000)
+		days = end_days - sign if (end_time - start_time) * sign < 0 else end_days
+		nanoseconds = end - days * 86400000000000 - start_time
+		if increment != 1:
+			# increments divide a day, so rounding up to a whole day stays a multiple
+			nanoseconds = round_to_increment(nanoseconds, increment, rounding_mode)
+			if (nanoseconds - 86400000000000 * sign) * sign >= 0:
+				days += sign
+				nanoseconds -= 86400000000000 * sign
+		date = difference_iso_date(iso_from_epoch_days(start_days), iso_from_epoch_days(days), largest_unit)
+		return Duration._from_fields((*date, *Duration._from_nanoseconds(nanoseconds)._fields[4:]))
 
 	def round(
 		self,
@@ -190,8 +348,13 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 		rounding_increment: int = 1,
 		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'halfExpand',
 	) -> Self:
-		# TODO
-		return self
+		increment = round_settings(smallest_unit, rounding_increment, rounding_mode, 'date_time')
+		# increments divide a day, so rounding the wall clock as if positive
+		# rounds the time of day and carries into the date
+		wall_nanoseconds = round_to_increment(self._wall_nanoseconds, increment, as_if_positive(rounding_mode))
+		if not -_MAX_WALL_NANOSECONDS < wall_nanoseconds < _MAX_WALL_NANOSECONDS:
+			raise ValueError(f'rounded date-time out of range: {self}')
+		return self._new(iso_date_time_from_epoch_nanoseconds(wall_nanoseconds))
 
 	def to_string(
 		self,
@@ -201,15 +364,18 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 		smallest_unit: Literal['minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] | None = None,
 		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'trunc',
 	) -> str:
-		# TODO
-		return str(self)
+		return format_plan(fractional_second_digits, smallest_unit, rounding_mode).format_wall(self._wall_nanoseconds)
+
+	@property
+	def _wall_nanoseconds(self) -> int:
+		return epoch_nanoseconds_from_iso_date_time(*self._iso_date_time)
 
 	def to_locale_string(self) -> str:  # TODO options
 		# TODO
 		return str(self)
 
 	def __str__(self):
-		return self.py_datetimenaive.isoformat()
+		return DEFAULT_PLAN.format_date_time(self._wall_nanoseconds)
 
 	def __repr__(self):
 		return f'{type(self).__name__}.from_("{self}")'
@@ -244,16 +410,31 @@ class PlainDateTime(_PlainDateTimeBase, PlainDate, PlainTime):
 			plain_time = PlainTime.from_(plain_time)
 		elif plain_time is None:
 			plain_time = self
-		return PlainDateTime.from_py_datetimenaive(py_datetime.datetime.combine(plain_date.py_date, plain_time.py_time))
+		return PlainDateTime._new((*plain_date._iso_date, *plain_time._iso_time))
+
+	def to_plain_time(self) -> PlainTime:
+		return PlainTime._from_nanosecond_of_day(self._wall_nanoseconds % 86400000000000)
 
 	class ISOFields(PlainDate.ISOFields, PlainTime.ISOFields):
 		pass
 
 	def get_iso_fields(self) -> ISOFields:
+		year, month, day, hour, minute, second, millisecond, microsecond, nanosecond = self._iso_date_time
 		return PlainDateTime.ISOFields(
-			**PlainDate.get_iso_fields(self),
-			**PlainTime.get_iso_fields(self),
+			iso_year = year,
+			iso_month = month,
+			iso_day = day,
+			iso_hour = hour,
+			iso_minute = minute,
+			iso_second = second,
+			iso_millisecond = millisecond,
+			iso_microsecond = microsecond,
+			iso_nanosecond = nanosecond,
 		)
 
 
-from . import _zoned_date_time  # type: ignore
+if TYPE_CHECKING:
+	from . import _zoned_date_time
+	from ._time_zone import TimeZone
+else:
+	_zoned_date_time = deferred_module(globals(), '_zoned_date_time')
@@ -1,27 +1,74 @@
 import datetime as py_datetime
-from dataclasses import dataclass
-from typing import Literal, Self, TypedDict
+from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, Self, TypedDict
 
-from ._duration import Duration
-from ._time_zone import TimeZone
+from ._deferred import deferred_module
+from ._duration import Duration, difference_settings, round_settings
+from ._formatter import DEFAULT_PLAN, format_plan
+from ._parse_many import ParseError, parse_many
+from ._parser import parse_time
+from ._rounding import negated, round_to_increment
+from ._wire import PLAIN_TIME, iter_unpack, pack, pack_column, unpack
 
 __all__ = ['PlainTime']
 
 
-@dataclass(frozen = True)
+def _time_from_nanosecond_of_day(nanosecond_of_day: int, /) -> tuple[int, int, int, int, int, int]:
+	seconds, nanoseconds = divmod(nanosecond_of_day, 1000000000)
+	return seconds // 3600, seconds // 60 % 60, seconds % 60, nanoseconds // 1000000, nanoseconds // 1000 % 1000, nanoseconds % 1000
+
+
 class _PlainTimeBase:
-	py_time: py_datetime.time
+	__slots__ = ('_nanosecond_of_day', )
+
+	_nanosecond_of_day: int
 
-	def __post_init__(self):
-		assert self.py_time.tzinfo is None
+	def __setattr__(self, name: str, value: Any, /):
+		raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+	def __delattr__(self, name: str, /):
+		raise FrozenInstanceError(f'cannot delete field {name!r}')
+
+	@property
+	def py_time(self) -> py_datetime.time:
+		hour, minute, second, millisecond, microsecond, _ = _time_from_nanosecond_of_day(self._nanosecond_of_day)
+		return py_datetime.time(hour, minute, second, millisecond * 1000 + microsecond)
 
 	@classmethod
 	def from_py_time(cls, py_time: py_datetime.time, /):
 		return cls(py_time = py_time)
 
+	@classmethod
+	def _from_nanosecond_of_day(cls, nanosecond_of_day: int, /) -> Self:
+		# Skips validation, for callers that already know the value is valid.
+		self = object.__new__(cls)
+		_set_nanosecond_of_day(self, nanosecond_of_day)
+		return self
+
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._nanosecond_of_day == other._nanosecond_of_day  # type: ignore
+
+	def __hash__(self) -> int:
+		return hash(self._nanosecond_of_day)
+
+	def __reduce__(self):
+		return (type(self), _time_from_nanosecond_of_day(self._nanosecond_of_day))
+
+	def __copy__(self) -> Self:
+		return self
+
+	def __deepcopy__(self, memo: dict[int, Any], /) -> Self:
+		return self
+
+
+_set_nanosecond_of_day = _PlainTimeBase._nanosecond_of_day.__set__  # type: ignore
+
 
-@dataclass(frozen = True)
 class PlainTime(_PlainTimeBase):
+	# A single int of nanoseconds since midnight.
+	__slots__ = ()
 
 	def __init__(
 		self,
@@ -35,20 +82,64 @@ class PlainTime(_PlainTimeBase):
 		*,
 		py_time: py_datetime.time | None = None,
 	):
-		super().__init__(py_time or py_datetime.time(iso_hour, iso_minute, iso_second, iso_millisecond * 1000 + iso_microsecond))
+		if py_time:
+			assert py_time.tzinfo is None
+			_set_nanosecond_of_day(self, ((py_time.hour * 3600 + py_time.minute * 60 + py_time.second) * 1000000 + py_time.microsecond) * 1000)
+			return
+		if not (0 <= iso_hour <= 23 and 0 <= iso_minute <= 59 and 0 <= iso_second <= 59 and 0 <= iso_millisecond <= 999 and 0 <= iso_microsecond <= 999 and 0 <= iso_nanosecond <= 999):
+			raise ValueError(f'invalid time: {iso_hour}:{iso_minute}:{iso_second}.{iso_millisecond:03}{iso_microsecond:03}{iso_nanosecond:03}')
+		_set_nanosecond_of_day(self, (iso_hour * 3600 + iso_minute * 60 + iso_second) * 1000000000 + iso_millisecond * 1000000 + iso_microsecond * 1000 + iso_nanosecond)
 
 	@classmethod
 	def from_(
 		cls,
-		thing: 'PlainTime | str',
+		thing: 'PlainTime | _plain_date_time.PlainDateTime | _zoned_date_time.ZonedDateTime | str',
 		/,
 		*,
 		overflow: Literal['constrain', 'reject'] = 'constrain',
 	) -> Self:
+		if thing.__class__ is cls:
+			return thing  # type: ignore
 		if isinstance(thing, PlainTime):
-			return cls(py_time = thing.py_time.replace())
-		# TODO parse
-		return cls(py_time = py_datetime.time())
+			return cls._from_nanosecond_of_day(thing._nanosecond_of_day)
+		if isinstance(thing, (_plain_date_time.PlainDateTime, _zoned_date_time.ZonedDateTime)):
+			return cls._from_nanosecond_of_day(thing._wall_nanoseconds % 86400000000000)
+		parsed = parse_time(thing)
+		if parsed.utc_designator:
+			raise ValueError(f'Z designator not supported for PlainTime: {thing!r}')
+		return cls(parsed.hour, parsed.minute, parsed.second, parsed.nanosecond // 1000000, parsed.nanosecond // 1000 % 1000, parsed.nanosecond % 1000)
+
+	@classmethod
+	def from_iter(
+		cls,
+		source: Iterable[str],
+		/,
+		*,
+		errors: Literal['raise', 'skip'] | list[ParseError] = 'raise',
+	) -> Iterator[Self]:
+		return parse_many(cls.from_, source, errors = errors)
+
+	@classmethod
+	def _from_wire(cls, nanosecond_of_day: int, /) -> Self:
+		if not 0 <= nanosecond_of_day < 86400000000000:
+			raise ValueError(f'nanosecond of day out of range: {nanosecond_of_day}')
+		return cls._from_nanosecond_of_day(nanosecond_of_day)
+
+	@classmethod
+	def from_bytes(cls, data: bytes | bytearray | memoryview, /) -> Self:
+		return cls._from_wire(unpack(PLAIN_TIME, data)[0])
+
+	@classmethod
+	def from_bytes_iter(cls, data: bytes | bytearray | memoryview, /) -> Iterator[Self]:
+		new = cls._from_wire
+		return (new(nanosecond_of_day) for nanosecond_of_day, in iter_unpack(PLAIN_TIME, data))
+
+	@staticmethod
+	def to_bytes_many(plain_times: 'Iterable[PlainTime]', /) -> bytes:
+		return pack_column('q', [plain_time._nanosecond_of_day for plain_time in plain_times])
+
+	def to_bytes(self) -> bytes:
+		return pack(PLAIN_TIME, self._nanosecond_of_day)
 
 	def with_(
 		self,
@@ -61,50 +152,47 @@ class PlainTime(_PlainTimeBase):
 		microsecond: int | None = None,
 		nanosecond: int | None = None,
 	) -> Self:
-		return type(self)(
-			hour if hour is not None else self.hour,
-			minute if minute is not None else self.minute,
-			second if second is not None else self.second,
-			millisecond if millisecond is not None else self.millisecond,
-			microsecond if microsecond is not None else self.microsecond,
-			nanosecond if nanosecond is not None else self.nanosecond,
-		)
+		changes = (hour, minute, second, millisecond, microsecond, nanosecond)
+		return type(self)(*(field if change is None else change for field, change in zip(self._iso_time, changes)))
 
 	@property
 	def hour(self, /) -> int:
-		return self.py_time.hour
+		return self._nanosecond_of_day // 3600000000000
 
 	@property
 	def minute(self, /) -> int:
-		return self.py_time.minute
+		return self._nanosecond_of_day // 60000000000 % 60
 
 	@property
 	def second(self, /) -> int:
-		return self.py_time.second
+		return self._nanosecond_of_day // 1000000000 % 60
 
 	@property
 	def millisecond(self, /) -> int:
-		return self.py_time.microsecond // 1000
+		return self._nanosecond_of_day // 1000000 % 1000
 
 	@property
 	def microsecond(self, /) -> int:
-		return self.py_time.microsecond % 1000
+		return self._nanosecond_of_day // 1000 % 1000
 
 	@property
 	def nanosecond(self, /) -> int:
-		return 0
+		return self._nanosecond_of_day % 1000
+
+	@property
+	def _iso_time(self) -> tuple[int, int, int, int, int, int]:
+		return _time_from_nanosecond_of_day(self._nanosecond_of_day)
 
 	def add(self, duration: 'Duration | str', /) -> 'PlainTime':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		# the time part wraps around midnight; days and larger units are ignored
+		return self._from_nanosecond_of_day((self._nanosecond_of_day + duration._time_nanoseconds) % 86400000000000)
 
 	def subtract(self, duration: 'Duration | str', /) -> 'PlainTime':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		return self._from_nanosecond_of_day((self._nanosecond_of_day - duration._time_nanoseconds) % 86400000000000)
 
 	def until(
 		self,
@@ -118,8 +206,7 @@ class PlainTime(_PlainTimeBase):
 	) -> 'Duration':
 		if not isinstance(other, type(self)):
 			other = type(self).from_(other)
-		# TODO
-		return Duration()
+		return self._difference(other, largest_unit, smallest_unit, rounding_increment, rounding_mode)
 
 	def since(
 		self,
@@ -133,8 +220,12 @@ class PlainTime(_PlainTimeBase):
 	) -> 'Duration':
 		if not isinstance(other, type(self)):
 			other = type(self).from_(other)
-		# TODO
-		return Duration()
+		return self._difference(other, largest_unit, smallest_unit, rounding_increment, negated(rounding_mode)).negated()
+
+	def _difference(self, other: 'PlainTime', largest_unit: str, smallest_unit: str, rounding_increment: int, rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'], /) -> 'Duration':
+		# hours are the default largest unit of PlainTime differences
+		largest_unit, increment = difference_settings('hour' if largest_unit == 'auto' else largest_unit, smallest_unit, rounding_increment, rounding_mode)
+		return Duration._from_nanoseconds(round_to_increment(other._nanosecond_of_day - self._nanosecond_of_day, increment, rounding_mode), largest_unit)
 
 	def round(
 		self,
@@ -144,8 +235,9 @@ class PlainTime(_PlainTimeBase):
 		rounding_increment: int = 1,
 		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'halfExpand',
 	) -> Self:
-		# TODO
-		return self
+		increment = round_settings(smallest_unit, rounding_increment, rounding_mode, 'time')
+		# rounding past midnight wraps around, as in Temporal
+		return self._from_nanosecond_of_day(round_to_increment(self._nanosecond_of_day, increment, rounding_mode) % 86400000000000)
 
 	def to_string(
 		self,
@@ -155,15 +247,19 @@ class PlainTime(_PlainTimeBase):
 		smallest_unit: Literal['minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] | None = None,
 		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'trunc',
 	) -> str:
-		# TODO
-		return str(self)
+		plan = format_plan(fractional_second_digits, smallest_unit, rounding_mode)
+		# rounding past midnight wraps around, as in Temporal
+		nanoseconds = round_to_increment(self._nanosecond_of_day, plan.increment, plan.rounding_mode) % 86400000000000
+		seconds, nanoseconds = divmod(nanoseconds, 1000000000)
+		return plan.format_time(seconds // 3600, seconds // 60 % 60, seconds % 60, nanoseconds)
 
 	def to_locale_string(self) -> str:  # TODO options
 		# TODO
 		return str(self)
 
 	def __str__(self):
-		return self.py_time.isoformat()
+		seconds, nanoseconds = divmod(self._nanosecond_of_day, 1000000000)
+		return DEFAULT_PLAN.format_time(seconds // 3600, seconds // 60 % 60, seconds % 60, nanoseconds)
 
 	def __repr__(self):
 		return f'{type(self).__name__}.from_("{self}")'
@@ -193,7 +289,7 @@ class PlainTime(_PlainTimeBase):
 		)
 
 	def to_plain_time(self) -> 'PlainTime':
-		return PlainTime.from_py_time(self.py_time)
+		return PlainTime._from_nanosecond_of_day(self._nanosecond_of_day)
 
 	class ISOFields(TypedDict):
 		iso_hour: int
@@ -204,15 +300,21 @@ class PlainTime(_PlainTimeBase):
 		iso_nanosecond: int
 
 	def get_iso_fields(self) -> ISOFields:
+		hour, minute, second, millisecond, microsecond, nanosecond = _time_from_nanosecond_of_day(self._nanosecond_of_day)
 		return PlainTime.ISOFields(
-			iso_hour = self.hour,
-			iso_minute = self.minute,
-			iso_second = self.second,
-			iso_millisecond = self.millisecond,
-			iso_microsecond = self.microsecond,
-			iso_nanosecond = self.nanosecond,
+			iso_hour = hour,
+			iso_minute = minute,
+			iso_second = second,
+			iso_millisecond = millisecond,
+			iso_microsecond = microsecond,
+			iso_nanosecond = nanosecond,
 		)
 
 
-from . import _plain_date_time, _zoned_date_time  # type: ignore
-from ._plain_date import PlainDate
+if TYPE_CHECKING:
+	from . import _plain_date_time, _zoned_date_time
+	from ._plain_date import PlainDate
+	from ._time_zone import TimeZone
+else:
+	_plain_date_time = deferred_module(globals(), '_plain_date_time')
+	_zoned_date_time = deferred_module(globals(), '_zoned_date_time')
@@ -0,0 +1,193 @@
+from typing import Iterable, Iterator, Literal
+
+from ._calendar import day_of_week, days_in_month, epoch_days_from_iso, iso_from_epoch_days
+from ._instant import _MAX_EPOCH_NANOSECONDS, Instant
+from ._plain_date import _MAX_EPOCH_DAYS, _MIN_EPOCH_DAYS, PlainDate
+from ._plain_date_time import PlainDateTime
+from ._time_zone import _DISAMBIGUATIONS, TimeZone
+from ._zoned_date_time import ZonedDateTime
+
+__all__ = ['date_range', 'recurrence']
+
+_MAX_YEAR = iso_from_epoch_days(_MAX_EPOCH_DAYS)[0]
+
+
+def date_range(
+	start: 'PlainDate | str',
+	stop: 'PlainDate | str | None' = None,
+	/,
+	unit: Literal['day', 'week', 'month'] = 'day',
+	*,
+	step: int = 1,
+) -> Iterator[PlainDate]:
+	# Lazily yields start, start + step units, ... up to but excluding stop,
+	# counting down for a negative step. Without stop it runs to the end of the
+	# supported range. Months keep the day of start, constrained to the month.
+	if unit not in ('day', 'week', 'month'):
+		raise ValueError(f'invalid range unit: {unit!r}')
+	if not step:
+		raise ValueError('range step must not be zero')
+	if not isinstance(start, PlainDate):
+		start = PlainDate.from_(start)
+	if stop is None:
+		stop_days = _MAX_EPOCH_DAYS + 1 if step > 0 else _MIN_EPOCH_DAYS - 1
+	else:
+		stop_days = (stop if isinstance(stop, PlainDate) else PlainDate.from_(stop))._epoch_days
+	if unit == 'month':
+		return _month_range(start, stop_days, step)
+	return _day_range(start._epoch_days, stop_days, step * 7 if unit == 'week' else step)
+
+
+def _day_range(epoch_days: int, stop_days: int, step: int, /) -> Iterator[PlainDate]:
+	new = PlainDate._from_epoch_days
+	stop_days = min(stop_days, _MAX_EPOCH_DAYS + 1) if step > 0 else max(stop_days, _MIN_EPOCH_DAYS - 1)
+	return map(new, range(epoch_days, stop_days, step))
+
+
+def _month_range(start: PlainDate, stop_days: int, step: int, /) -> Iterator[PlainDate]:
+	year, month, day = start._iso_date
+	first = year * 12 + month - 1
+	index = 0
+	while True:
+		year, month = divmod(first + index * step, 12)
+		month += 1
+		epoch_days = epoch_days_from_iso(year, month, min(day, days_in_month(year, month)))
+		if (epoch_days >= stop_days if step > 0 else epoch_days <= stop_days) or not _MIN_EPOCH_DAYS <= epoch_days <= _MAX_EPOCH_DAYS:
+			return
+		yield PlainDate._from_epoch_days(epoch_days)
+		index += 1
+
+
+def _month_days(year: int, month: int, weekdays: frozenset[int], month_days: tuple[int, ...], default_day: int | None, /) -> list[int]:
+	# the epoch days of one month matching BYMONTHDAY and BYDAY, in order
+	length = days_in_month(year, month)
+	if month_days:
+		days = sorted({month_day if month_day > 0 else length + month_day + 1 for month_day in month_days if month_day <= length and -month_day <= length})
+	elif weekdays:
+		days = range(1, length + 1)
+	elif default_day is not None and default_day <= length:
+		days = [default_day]
+	else:
+		return []
+	first = epoch_days_from_iso(year, month, 1) - 1
+	return [first + day for day in days if not weekdays or day_of_week(first + day) in weekdays]
+
+
+def _matches(epoch_days: int, weekdays: frozenset[int], month_days: tuple[int, ...], /) -> bool:
+	if weekdays and day_of_week(epoch_days) not in weekdays:
+		return False
+	if month_days:
+		year, month, day = iso_from_epoch_days(epoch_days)
+		length = days_in_month(year, month)
+		return any(day == (month_day if month_day > 0 else length + month_day + 1) for month_day in month_days)
+	return True
+
+
+def _dates(frequency: str, start_days: int, interval: int, weekdays: frozenset[int], month_days: tuple[int, ...], /) -> Iterator[int]:
+	# Epoch days of the candidate dates in ascending order, starting at start_days.
+	# Each period of `interval` units contributes the days BYDAY and BYMONTHDAY
+	# select in it, or the day matching the start when neither is given.
+	year, month, day = iso_from_epoch_days(start_days)
+	if frequency == 'day':
+		epoch_days = start_days
+		while epoch_days <= _MAX_EPOCH_DAYS:
+			if _matches(epoch_days, weekdays, month_days):
+				yield epoch_days
+			epoch_days += interval
+	elif frequency == 'week':
+		week_start = start_days - day_of_week(start_days) + 1
+		offsets = sorted(weekday - 1 for weekday in weekdays) if weekdays else [day_of_week(start_days) - 1]
+		while week_start <= _MAX_EPOCH_DAYS:
+			for offset in offsets:
+				epoch_days = week_start + offset
+				if epoch_days >= start_days and (not month_days or _matches(epoch_days, frozenset(), month_days)):
+					yield epoch_days
+			week_start += 7 * interval
+	elif frequency == 'month':
+		index = year * 12 + month - 1
+		while index < (_MAX_YEAR + 1) * 12:
+			year, month = divmod(index, 12)
+			days = _month_days(year, month + 1, weekdays, month_days, day)
+			yield from (epoch_days for epoch_days in days if epoch_days >= start_days)
+			index += interval
+	else:
+		start_month = month
+		while year <= _MAX_YEAR:
+			if weekdays or month_days:
+				days = [epoch_days for month in range(1, 13) for epoch_days in _month_days(year, month, weekdays, month_days, None)]
+			else:
+				# February 29 recurs in leap years only
+				days = _month_days(year, start_month, weekdays, month_days, day)
+			yield from (epoch_days for epoch_days in days if epoch_days >= start_days)
+			year += interval
+
+
+def recurrence(
+	start: 'ZonedDateTime | PlainDateTime | str',
+	time_zone: 'TimeZone | str | None' = None,
+	/,
+	frequency: Literal['day', 'week', 'month', 'year'] = 'day',
+	*,
+	interval: int = 1,
+	by_day: Iterable[int] | None = None,
+	by_month_day: Iterable[int] | None = None,
+	count: int | None = None,
+	until: 'Instant | str | None' = None,
+	disambiguation: Literal['compatible', 'earlier', 'later', 'reject'] = 'compatible',
+) -> Iterator[ZonedDateTime]:
+	# Lazily yields the occurrences of an RRULE-like rule, at the wall-clock time
+	# of start in time_zone (the zone of start for a ZonedDateTime), in order.
+	# by_day holds ISO weekdays (Monday is 1), by_month_day days of the month
+	# (negative counts from the end). count and until (inclusive) end the
+	# recurrence; dates before start are skipped. Wall-clock times in a DST gap
+	# or overlap are resolved with disambiguation, as in to_zoned_date_time.
+	if frequency not in ('day', 'week', 'month', 'year'):
+		raise ValueError(f'invalid recurrence frequency: {frequency!r}')
+	if interval < 1:
+		raise ValueError(f'recurrence interval must be positive: {interval}')
+	if count is not None and count < 0:
+		raise ValueError(f'recurrence count must not be negative: {count}')
+	if disambiguation not in _DISAMBIGUATIONS:
+		raise ValueError(f'invalid disambiguation: {disambiguation!r}')
+	weekdays = frozenset(by_day or ())
+	if not weekdays <= frozenset(range(1, 8)):
+		raise ValueError(f'by_day must hold ISO weekdays 1 to 7: {sorted(weekdays)}')
+	month_days = tuple(sorted(set(by_month_day or ())))
+	if any(not 1 <= abs(month_day) <= 31 for month_day in month_days):
+		raise ValueError(f'by_month_day must hold days 1 to 31 or -31 to -1: {list(month_days)}')
+	if isinstance(start, ZonedDateTime):
+		wall_nanoseconds = start._wall_nanoseconds
+		if time_zone is None:
+			time_zone = start._time_zone
+	else:
+		if not isinstance(start, PlainDateTime):
+			start = PlainDateTime.from_(start)
+		wall_nanoseconds = start._wall_nanoseconds
+		if time_zone is None:
+			raise TypeError('a time zone is required unless start is a ZonedDateTime')
+	if isinstance(time_zone, str):
+		time_zone = TimeZone(time_zone)
+	until_nanoseconds = None
+	if until is not None:
+		until_nanoseconds = (until if isinstance(until, Instant) else Instant.from_(until))._epoch_nanoseconds
+	start_days, time_of_day = divmod(wall_nanoseconds, 86400000000000)
+	return _occurrences(_dates(frequency, start_days, interval, weekdays, month_days), time_of_day, time_zone, count, until_nanoseconds, disambiguation)
+
+
+def _occurrences(dates: Iterator[int], time_of_day: int, time_zone: TimeZone, count: int | None, until_nanoseconds: int | None, disambiguation: str, /) -> Iterator[ZonedDateTime]:
+	# consecutive occurrences share the offset lookups of the resolver
+	resolve = time_zone._resolver(disambiguation)
+	new = ZonedDateTime._new
+	remaining = -1 if count is None else count
+	for epoch_days in dates:
+		if not remaining or epoch_days > _MAX_EPOCH_DAYS:
+			return
+		epoch_nanoseconds, offset, _ = resolve(epoch_days * 86400000000000 + time_of_day)
+		if not -_MAX_EPOCH_NANOSECONDS <= epoch_nanoseconds <= _MAX_EPOCH_NANOSECONDS:
+			if epoch_nanoseconds > 0:
+				return
+			continue
+		if until_nanoseconds is not None and epoch_nanoseconds > until_nanoseconds:
+			return
+		yield new(epoch_nanoseconds, time_zone, offset)
+		remaining -= 1
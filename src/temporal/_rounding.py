@@ -0,0 +1,86 @@
+from array import array
+from typing import Iterable, Literal
+
+__all__ = ['RoundingMode', 'ROUNDING_MODES', 'round_to_increment', 'round_array', 'as_if_positive', 'negated']
+
+RoundingMode = Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven']
+
+ROUNDING_MODES = frozenset(('ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'))
+
+
+# Points in time are rounded as if they were positive, so that e.g. 'trunc'
+# rounds 1969-12-31T23:59:59.5Z down like it rounds 1970-01-01T00:00:00.5Z.
+_AS_IF_POSITIVE: dict[str, RoundingMode] = {'trunc': 'floor', 'expand': 'ceil', 'halfTrunc': 'halfFloor', 'halfExpand': 'halfCeil'}
+
+
+def as_if_positive(rounding_mode: RoundingMode, /) -> RoundingMode:
+	return _AS_IF_POSITIVE.get(rounding_mode, rounding_mode)
+
+
+# since() rounds the negated until() difference with the mode mirrored around zero
+_NEGATED: dict[str, RoundingMode] = {'ceil': 'floor', 'floor': 'ceil', 'halfCeil': 'halfFloor', 'halfFloor': 'halfCeil'}
+
+
+def negated(rounding_mode: RoundingMode, /) -> RoundingMode:
+	return _NEGATED.get(rounding_mode, rounding_mode)
+
+
+def round_to_increment(value: int, increment: int, rounding_mode: RoundingMode, /) -> int:
+	# Exact integer rounding: `value` is split into a floored quotient and a
+	# non-negative remainder, and each mode only decides whether to step up.
+	quotient, remainder = divmod(value, increment)
+	if not remainder:
+		return value
+	if rounding_mode == 'floor':
+		up = False
+	elif rounding_mode == 'ceil':
+		up = True
+	elif rounding_mode == 'trunc':
+		up = value < 0
+	elif rounding_mode == 'expand':
+		up = value > 0
+	else:
+		twice = remainder * 2
+		if twice != increment:
+			up = twice > increment
+		elif rounding_mode == 'halfCeil':
+			up = True
+		elif rounding_mode == 'halfFloor':
+			up = False
+		elif rounding_mode == 'halfTrunc':
+			up = value < 0
+		elif rounding_mode == 'halfExpand':
+			up = value > 0
+		elif rounding_mode == 'halfEven':
+			up = quotient % 2 == 1
+		else:
+			raise ValueError(f'invalid rounding mode: {rounding_mode!r}')
+	return (quotient + up) * increment
+
+
+def round_array(values: Iterable[int], increment: int, rounding_mode: RoundingMode, /) -> 'array[int]':
+	# Column version of round_to_increment: one comprehension per mode, with
+	# the mode dispatched once rather than per element.
+	if increment == 1:
+		return array('q', values)
+	if rounding_mode == 'floor':
+		return array('q', [value // increment * increment for value in values])
+	if rounding_mode == 'ceil':
+		return array('q', [-(-value // increment) * increment for value in values])
+	if rounding_mode == 'trunc':
+		return array('q', [(value // increment if value >= 0 else -(-value // increment)) * increment for value in values])
+	if rounding_mode == 'expand':
+		return array('q', [(-(-value // increment) if value >= 0 else value // increment) * increment for value in values])
+	twice = increment * 2
+	if rounding_mode == 'halfCeil':
+		return array('q', [(value * 2 + increment) // twice * increment for value in values])
+	if rounding_mode == 'halfFloor':
+		return array('q', [-((increment - value * 2) // twice) * increment for value in values])
+	if rounding_mode == 'halfExpand':
+		return array('q', [((value * 2 + increment) // twice if value >= 0 else -((increment - value * 2) // twice)) * increment for value in values])
+	if rounding_mode == 'halfTrunc':
+		return array('q', [(-((increment - value * 2) // twice) if value >= 0 else (value * 2 + increment) // twice) * increment for value in values])
+	if rounding_mode == 'halfEven':
+		# halfCeil, stepping back down on exact ties that landed on an odd quotient
+		return array('q', [(quotient - (not remainder and quotient & 1)) * increment for quotient, remainder in (divmod(value * 2 + increment, twice) for value in values)])
+	raise ValueError(f'invalid rounding mode: {rounding_mode!r}')
@@ -1,18 +1,49 @@
-import zoneinfo as py_zoneinfo
-from dataclasses import dataclass
-from typing import Literal, Self, Sequence
+from array import array
+from dataclasses import FrozenInstanceError
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, NamedTuple, Self, Sequence
 
-from ._instant import Instant
+from ._calendar import iso_date_time_from_epoch_nanoseconds
+from ._deferred import deferred_module
+from ._formatter import format_offset
+from ._instant import _MAX_EPOCH_NANOSECONDS, Instant
+from ._parser import parse_date_time
+from ._wire import _BIG_ENDIAN
+from ._zone_rules import ZoneRules, zone_rules
 
-__all__ = ['TimeZone']
+if TYPE_CHECKING:
+	import zoneinfo as py_zoneinfo
+
+__all__ = ['TimeZone', 'ResolvedInstants']
+
+
+class ResolvedInstants(NamedTuple):
+	instants: '_instant_array.InstantArray'
+	# positions of the wall-clock times that were skipped or repeated by an offset change
+	gaps: 'array[int]'
+	overlaps: 'array[int]'
+
+
+def _checked_epoch_nanoseconds(epoch_nanoseconds: int, date_time: '_plain_date_time.PlainDateTime', /) -> int:
+	if not -_MAX_EPOCH_NANOSECONDS <= epoch_nanoseconds <= _MAX_EPOCH_NANOSECONDS:
+		raise ValueError(f'date-time out of range: {date_time}')
+	return epoch_nanoseconds
 
 
-@dataclass(frozen = True)
 class _TimeZoneBase:
-	py_tzinfo: py_zoneinfo.ZoneInfo
+	__slots__ = ('py_tzinfo', '_zone_rules')
+
+	py_tzinfo: 'py_zoneinfo.ZoneInfo'
+	_zone_rules: ZoneRules | None
+
+	def __setattr__(self, name: str, value: Any, /):
+		raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+	def __delattr__(self, name: str, /):
+		raise FrozenInstanceError(f'cannot delete field {name!r}')
 
 	@classmethod
-	def from_py_zoneinfo(cls, py_tzinfo: py_zoneinfo.ZoneInfo, /):
+	def from_py_zoneinfo(cls, py_tzinfo: 'py_zoneinfo.ZoneInfo', /):
 		return cls(py_tzinfo = py_tzinfo)
 
 	@classmethod
@@ -20,37 +51,128 @@ class _TimeZoneBase:
 		if isinstance(thing, TimeZone):
 			return thing
 		if isinstance(thing, _zoned_date_time.ZonedDateTime):
-			return cls(py_tzinfo = py_zoneinfo.ZoneInfo(thing.time_zone_id))
-		# TODO parse
-		return cls(py_tzinfo = py_zoneinfo.ZoneInfo('Europe/Warsaw'))
+			return thing._time_zone
+		try:
+			parsed = parse_date_time(thing)
+		except ValueError:
+			# not an ISO string, so it has to be a bare identifier
+			return cls(thing)
+		if parsed.time_zone is not None:
+			return cls(parsed.time_zone)
+		if parsed.utc_designator:
+			return cls('UTC')
+		raise ValueError(f'string has no time zone: {thing!r}')
+
+	def __eq__(self, other: object, /) -> bool:
+		if self is other:
+			return True
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self.py_tzinfo is other.py_tzinfo or self.py_tzinfo.key == other.py_tzinfo.key  # type: ignore
+
+	def __hash__(self) -> int:
+		return hash(self.py_tzinfo.key)
+
+
+_set_py_tzinfo = _TimeZoneBase.py_tzinfo.__set__  # type: ignore
+_set_zone_rules = _TimeZoneBase._zone_rules.__set__  # type: ignore
+
+_INTERNED_MAX = 1024
+
+_DISAMBIGUATIONS = ('compatible', 'earlier', 'later', 'reject')
+
+# past every representable instant
+_UNBOUNDED = 1 << 80
 
 
-@dataclass(frozen = True)
 class TimeZone(_TimeZoneBase):
 	# TODO handle offset zones
-	# TODO check __eq__ behavior
+	__slots__ = ()
+
+	# TimeZone(identifier) hands out one shared instance per identifier from a
+	# bounded LRU cache, so zone lookups and the compiled transition table are
+	# done once per zone rather than once per call.
+
+	def __new__(
+		cls,
+		time_zone_identifier: str | None = None,
+		/,
+		*,
+		py_tzinfo: 'py_zoneinfo.ZoneInfo | None' = None,
+	):
+		if py_tzinfo is not None and py_tzinfo.key is None:
+			# e.g. ZoneInfo.from_file; the transition table is compiled by key
+			raise ValueError(f'zoneinfo without key cannot be interned: {py_tzinfo!r}')
+		if cls is TimeZone:
+			interned = _interned(py_tzinfo.key if py_tzinfo else time_zone_identifier)
+			if py_tzinfo is None or py_tzinfo is interned.py_tzinfo:
+				return interned
+		if py_tzinfo is None:
+			if time_zone_identifier is None:
+				raise TypeError("TimeZone.__init__() missing 1 required positional argument: 'time_zone_identifier'")
+			py_tzinfo = _zone_info(time_zone_identifier)
+		return cls._new(py_tzinfo)
 
 	def __init__(
 		self,
-		time_zone_identifier: str,
+		time_zone_identifier: str | None = None,
 		/,
 		*,
-		py_tzinfo: py_zoneinfo.ZoneInfo | None = None,
+		py_tzinfo: 'py_zoneinfo.ZoneInfo | None' = None,
 	):
-		super().__init__(py_tzinfo or py_zoneinfo.ZoneInfo(time_zone_identifier))
+		# everything is set up in __new__
+		pass
+
+	@classmethod
+	def _new(cls, py_tzinfo: 'py_zoneinfo.ZoneInfo', /) -> Self:
+		self = object.__new__(cls)
+		_set_py_tzinfo(self, py_tzinfo)
+		_set_zone_rules(self, None)
+		return self
+
+	@staticmethod
+	def cache_info():
+		return _interned.cache_info()
+
+	@staticmethod
+	def cache_clear():
+		_interned.cache_clear()
+		zone_rules.cache_clear()
+
+	def __reduce__(self):
+		return (type(self), (self.id, ))
+
+	def __copy__(self) -> Self:
+		return self
+
+	def __deepcopy__(self, memo: dict[int, Any], /) -> Self:
+		return self
 
 	@property
 	def id(self):
 		return self.py_tzinfo.key
 
+	@property
+	def _rules(self) -> ZoneRules:
+		rules = self._zone_rules
+		if rules is None:
+			rules = zone_rules(self.id)
+			_set_zone_rules(self, rules)
+		return rules
+
 	def get_offset_nanoseconds_for(self, instant: 'Instant | str', /) -> int:
-		...
+		if not isinstance(instant, Instant):
+			instant = Instant.from_(instant)
+		return self._rules.offset_nanoseconds_for(instant.epoch_nanoseconds)
 
 	def get_offset_string_for(self, instant: 'Instant | str', /) -> str:
-		...
+		return format_offset(self.get_offset_nanoseconds_for(instant))
 
 	def get_plain_date_time_for(self, instant: 'Instant | str', /) -> '_plain_date_time.PlainDateTime':
-		...
+		if not isinstance(instant, Instant):
+			instant = Instant.from_(instant)
+		epoch_nanoseconds = instant.epoch_nanoseconds
+		return _plain_date_time.PlainDateTime._new(iso_date_time_from_epoch_nanoseconds(epoch_nanoseconds + self._rules.offset_nanoseconds_for(epoch_nanoseconds)))
 
 	def get_instant_for(
 		self,
@@ -59,16 +181,141 @@ class TimeZone(_TimeZoneBase):
 		*,
 		disambiguation: Literal['compatible', 'earlier', 'later', 'reject'] = 'compatible',
 	) -> 'Instant':
-		...
+		if disambiguation not in _DISAMBIGUATIONS:
+			raise ValueError(f'invalid disambiguation: {disambiguation!r}')
+		if not isinstance(date_time, _plain_date_time.PlainDateTime):
+			date_time = _plain_date_time.PlainDateTime.from_(date_time)
+		return Instant._from_epoch_nanoseconds(_checked_epoch_nanoseconds(self._epoch_nanoseconds_for(date_time._wall_nanoseconds, disambiguation), date_time))
 
 	def get_possible_instants_for(self, date_time: '_plain_date_time.PlainDateTime | str', /) -> 'Sequence[Instant]':
-		...
+		if not isinstance(date_time, _plain_date_time.PlainDateTime):
+			date_time = _plain_date_time.PlainDateTime.from_(date_time)
+		return [Instant._from_epoch_nanoseconds(_checked_epoch_nanoseconds(epoch_nanoseconds, date_time)) for epoch_nanoseconds in self._possible_epoch_nanoseconds(date_time._wall_nanoseconds)]
+
+	def get_instants_for(
+		self,
+		date_times: 'Iterable[_plain_date_time.PlainDateTime | str] | array[int] | bytes | bytearray | memoryview',
+		/,
+		*,
+		disambiguation: Literal['compatible', 'earlier', 'later', 'reject'] = 'compatible',
+	) -> 'ResolvedInstants':
+		# get_instant_for over many wall-clock times in one pass. They may also be
+		# given packed: as an array('q') of wall-clock nanoseconds, or as the
+		# little-endian PlainDateTime.to_bytes_many encoding. The positions that
+		# fell in a gap or an overlap are reported; 'reject' raises at the first.
+		if disambiguation not in _DISAMBIGUATIONS:
+			raise ValueError(f'invalid disambiguation: {disambiguation!r}')
+		if isinstance(date_times, (bytes, bytearray, memoryview)):
+			wall_nanoseconds = array('q')
+			wall_nanoseconds.frombytes(memoryview(date_times).cast('B'))
+			if _BIG_ENDIAN:
+				wall_nanoseconds.byteswap()
+		elif isinstance(date_times, array):
+			wall_nanoseconds = date_times
+		else:
+			PlainDateTime = _plain_date_time.PlainDateTime
+			wall_nanoseconds = [(date_time if isinstance(date_time, PlainDateTime) else PlainDateTime.from_(date_time))._wall_nanoseconds for date_time in date_times]
+		offset_for = self._rules.offset_nanoseconds_for
+		epoch_nanoseconds = []
+		append = epoch_nanoseconds.append
+		gaps = array('q')
+		overlaps = array('q')
+		low = high = offset = 0
+		for index, wall in enumerate(wall_nanoseconds):
+			# the fast path of _resolver, inlined for the common unambiguous row
+			epoch = wall - offset
+			if not low <= epoch < high:
+				possible = self._possible_epoch_nanoseconds(wall)
+				if len(possible) != 1:
+					(overlaps if possible else gaps).append(index)
+				try:
+					epoch = self._disambiguate(wall, possible, disambiguation)
+				except ValueError as e:
+					raise ValueError(f'row {index}: {e}') from e
+				offset = offset_for(epoch)
+				low, high = self._unambiguous_range(epoch)
+			append(epoch)
+		return ResolvedInstants(_instant_array.InstantArray.from_epoch_nanoseconds(epoch_nanoseconds), gaps, overlaps)
+
+	def _possible_epoch_nanoseconds(self, wall_nanoseconds: int, /) -> list[int]:
+		# The instants showing this wall-clock time, earlier first: one normally,
+		# none in a gap, two in an overlap. The offsets in effect a day before
+		# and a day after are the only candidates.
+		offset_for = self._rules.offset_nanoseconds_for
+		before = wall_nanoseconds - offset_for(wall_nanoseconds - 86400000000000)
+		after = wall_nanoseconds - offset_for(wall_nanoseconds + 86400000000000)
+		return [epoch_nanoseconds for epoch_nanoseconds in sorted({before, after}) if offset_for(epoch_nanoseconds) == wall_nanoseconds - epoch_nanoseconds]
+
+	def _epoch_nanoseconds_for(self, wall_nanoseconds: int, disambiguation: str, /) -> int:
+		return self._disambiguate(wall_nanoseconds, self._possible_epoch_nanoseconds(wall_nanoseconds), disambiguation)
+
+	def _disambiguate(self, wall_nanoseconds: int, possible: list[int], disambiguation: str, /) -> int:
+		if len(possible) == 1:
+			return possible[0]
+		if disambiguation == 'reject':
+			raise ValueError(f'{"ambiguous" if possible else "nonexistent"} wall-clock time in {self.id}: {_plain_date_time.PlainDateTime._new(iso_date_time_from_epoch_nanoseconds(wall_nanoseconds))}')
+		if possible:
+			return possible[-1] if disambiguation == 'later' else possible[0]
+		# in a gap: 'earlier' moves back by its length using the offset after it,
+		# 'compatible' and 'later' move forward using the offset before it
+		if disambiguation == 'earlier':
+			return wall_nanoseconds - self._rules.offset_nanoseconds_for(wall_nanoseconds + 86400000000000)
+		return wall_nanoseconds - self._rules.offset_nanoseconds_for(wall_nanoseconds - 86400000000000)
+
+	def _resolver(self, disambiguation: str, /) -> Callable[[int], tuple[int, int, int]]:
+		# Resolves many nearby wall-clock times to (epoch nanoseconds, offset,
+		# number of instants showing that wall-clock time). While an instant is
+		# more than a day from both ends of the last period of constant offset,
+		# its wall-clock time is unambiguous and needs no lookup.
+		rules = self._rules
+		low = high = offset = 0
+
+		def resolve(wall_nanoseconds: int, /) -> tuple[int, int, int]:
+			nonlocal low, high, offset
+			epoch_nanoseconds = wall_nanoseconds - offset
+			if low <= epoch_nanoseconds < high:
+				return epoch_nanoseconds, offset, 1
+			possible = self._possible_epoch_nanoseconds(wall_nanoseconds)
+			epoch_nanoseconds = self._disambiguate(wall_nanoseconds, possible, disambiguation)
+			offset = rules.offset_nanoseconds_for(epoch_nanoseconds)
+			low, high = self._unambiguous_range(epoch_nanoseconds)
+			return epoch_nanoseconds, offset, len(possible)
+
+		return resolve
+
+	def _unambiguous_range(self, epoch_nanoseconds: int, /) -> tuple[int, int]:
+		# the instants, around this one, at least a day from any offset change
+		rules = self._rules
+		previous = rules.previous_transition(epoch_nanoseconds + 1)
+		following = rules.next_transition(epoch_nanoseconds)
+		return (
+			-_UNBOUNDED if previous is None else previous + 86400000000000,
+			_UNBOUNDED if following is None else following - 86400000000000,
+		)
+
+	def _start_of_day(self, epoch_days: int, /) -> int:
+		return self._first_instant_at(epoch_days * 86400000000000)
+
+	def _first_instant_at(self, wall_nanoseconds: int, /) -> int:
+		# the first instant showing this wall-clock time; in a gap, the transition ending it
+		possible = self._possible_epoch_nanoseconds(wall_nanoseconds)
+		if possible:
+			return possible[0]
+		transition = self._rules.next_transition(wall_nanoseconds - self._rules.offset_nanoseconds_for(wall_nanoseconds + 86400000000000))
+		assert transition is not None
+		return transition
 
 	def get_next_transition(self, starting_point: 'Instant | str') -> 'Instant | None':
-		...
+		if not isinstance(starting_point, Instant):
+			starting_point = Instant.from_(starting_point)
+		epoch_nanoseconds = self._rules.next_transition(starting_point.epoch_nanoseconds)
+		return None if epoch_nanoseconds is None else Instant._from_epoch_nanoseconds(epoch_nanoseconds)
 
 	def get_previous_transition(self, starting_point: 'Instant | str') -> 'Instant | None':
-		...
+		if not isinstance(starting_point, Instant):
+			starting_point = Instant.from_(starting_point)
+		epoch_nanoseconds = self._rules.previous_transition(starting_point.epoch_nanoseconds)
+		return None if epoch_nanoseconds is None else Instant._from_epoch_nanoseconds(epoch_nanoseconds)
 
 	def __str__(self):
 		return self.id
@@ -77,4 +324,22 @@ class TimeZone(_TimeZoneBase):
 		return f'{type(self).__name__}.from_("{self}")'
 
 
-from . import _plain_date_time, _zoned_date_time  # type: ignore
+@lru_cache(maxsize = _INTERNED_MAX)
+def _interned(time_zone_identifier: str | None, /) -> TimeZone:
+	if time_zone_identifier is None:
+		raise TypeError("TimeZone.__init__() missing 1 required positional argument: 'time_zone_identifier'")
+	return TimeZone._new(_zone_info(time_zone_identifier))
+
+
+def _zone_info(time_zone_identifier: str, /) -> 'py_zoneinfo.ZoneInfo':
+	# zoneinfo is only loaded once a time zone is actually used
+	import zoneinfo as py_zoneinfo
+	return py_zoneinfo.ZoneInfo(time_zone_identifier)
+
+
+if TYPE_CHECKING:
+	from . import _instant_array, _plain_date_time, _zoned_date_time
+else:
+	_instant_array = deferred_module(globals(), '_instant_array')
+	_plain_date_time = deferred_module(globals(), '_plain_date_time')
+	_zoned_date_time = deferred_module(globals(), '_zoned_date_time')
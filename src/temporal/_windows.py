@@ -0,0 +1,144 @@
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Literal, NamedTuple
+
+from ._calendar import epoch_days_from_iso, iso_from_epoch_days
+from ._deferred import deferred_module
+from ._instant import Instant
+from ._time_zone import TimeZone
+from ._zoned_date_time import ZonedDateTime
+
+__all__ = ['Window', 'tumbling_windows', 'sliding_windows']
+
+
+class Window(NamedTuple):
+	# start inclusive, end exclusive
+	start: ZonedDateTime
+	end: ZonedDateTime
+
+
+def _month_index(wall_nanoseconds: int, /) -> int:
+	year, month, _ = iso_from_epoch_days(wall_nanoseconds // 86400000000000)
+	return year * 12 + month - 1
+
+
+# unit -> (index of the unit containing a wall-clock time, wall-clock start of the unit with an index)
+# Hours and days are counted from 1970-01-01, ISO weeks from Monday 1969-12-29 and months from year 0.
+_UNITS: dict[str, tuple[Callable[[int], int], Callable[[int], int]]] = {
+	'hour': (lambda wall: wall // 3600000000000, lambda index: index * 3600000000000),
+	'day': (lambda wall: wall // 86400000000000, lambda index: index * 86400000000000),
+	'week': (lambda wall: (wall // 86400000000000 + 3) // 7, lambda index: (index * 7 - 3) * 86400000000000),
+	'month': (_month_index, lambda index: epoch_days_from_iso(index // 12, index % 12 + 1, 1) * 86400000000000),
+}
+
+# the boundary caches are cleared instead of growing without bound
+_MAX_CACHED = 4096
+
+
+def _pairs(instants: 'Iterable[Instant | str]', /) -> Iterable[tuple[int, Instant]]:
+	if isinstance(instants, _instant_array.InstantArray):
+		values = instants._epoch_nanoseconds
+		return zip(values, map(Instant._from_epoch_nanoseconds, values))
+	return ((instant._epoch_nanoseconds, instant) for instant in (instant if isinstance(instant, Instant) else Instant.from_(instant) for instant in instants))
+
+
+def _windows(
+	instants: 'Iterable[Instant | str]',
+	time_zone: TimeZone | str,
+	unit: str,
+	size: int,
+	step: int,
+	/,
+) -> Iterator[tuple[Window, Instant]]:
+	# checked here rather than in the generator, so bad arguments fail at the call
+	if unit not in _UNITS:
+		raise ValueError(f'invalid window unit: {unit!r}')
+	if size < 1:
+		raise ValueError(f'window size must be positive: {size}')
+	if step < 1:
+		raise ValueError(f'window step must be positive: {step}')
+	if isinstance(time_zone, str):
+		time_zone = TimeZone(time_zone)
+	return _assign(_pairs(instants), time_zone, unit, size, step)
+
+
+def _assign(pairs: Iterable[tuple[int, Instant]], time_zone: TimeZone, unit: str, size: int, step: int, /) -> Iterator[tuple[Window, Instant]]:
+	unit_index, unit_start = _UNITS[unit]
+	offset_for = time_zone._rules.offset_nanoseconds_for
+	first_instant_at = time_zone._first_instant_at
+
+	# Units are the instants between the first instants of consecutive
+	# wall-clock boundaries, so a day is 23 or 25 hours long around a DST
+	# transition and every instant falls in exactly one unit.
+	starts: dict[int, int] = {}
+
+	def start_of(index: int, /) -> int:
+		start = starts.get(index)
+		if start is None:
+			if len(starts) >= _MAX_CACHED:
+				starts.clear()
+			start = starts[index] = first_instant_at(unit_start(index))
+		return start
+
+	windows: dict[int, Window] = {}
+
+	def window(number: int, /) -> Window:
+		found = windows.get(number)
+		if found is None:
+			if len(windows) >= _MAX_CACHED:
+				windows.clear()
+			start = start_of(number * step)
+			end = start_of(number * step + size)
+			found = windows[number] = Window(ZonedDateTime._new(start, time_zone, offset_for(start)), ZonedDateTime._new(end, time_zone, offset_for(end)))
+		return found
+
+	# Sorted streams stay in one unit for many elements in a row; those skip
+	# the offset lookup and reuse the windows of the previous element.
+	low = high = 0
+	current: tuple[Window, ...] = ()
+	for epoch_nanoseconds, instant in pairs:
+		if not low <= epoch_nanoseconds < high:
+			index = unit_index(epoch_nanoseconds + offset_for(epoch_nanoseconds))
+			# where an offset change repeats the wall clock across a boundary,
+			# the wall-clock unit and the one holding the instant differ by one
+			while epoch_nanoseconds < start_of(index):
+				index -= 1
+			while epoch_nanoseconds >= start_of(index + 1):
+				index += 1
+			low = start_of(index)
+			high = start_of(index + 1)
+			# window n covers the units n * step up to n * step + size
+			current = tuple(window(number) for number in range(-((size - 1 - index) // step), index // step + 1))
+		for found in current:
+			yield found, instant
+
+
+def tumbling_windows(
+	instants: 'Iterable[Instant | str]',
+	time_zone: TimeZone | str,
+	/,
+	unit: Literal['hour', 'day', 'week', 'month'],
+	*,
+	size: int = 1,
+) -> Iterator[tuple[Window, Instant]]:
+	# One (window, instant) pair per instant, in input order. Windows are `size`
+	# local wall-clock units long and do not overlap.
+	return _windows(instants, time_zone, unit, size, size)
+
+
+def sliding_windows(
+	instants: 'Iterable[Instant | str]',
+	time_zone: TimeZone | str,
+	/,
+	unit: Literal['hour', 'day', 'week', 'month'],
+	*,
+	size: int,
+	step: int = 1,
+) -> Iterator[tuple[Window, Instant]]:
+	# One (window, instant) pair for every window containing the instant,
+	# earliest window first. A new window of `size` units starts every `step` units.
+	return _windows(instants, time_zone, unit, size, step)
+
+
+if TYPE_CHECKING:
+	from . import _instant_array
+else:
+	_instant_array = deferred_module(globals(), '_instant_array')
@@ -0,0 +1,78 @@
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, Sequence
+
+__all__ = [
+	'INSTANT',
+	'PLAIN_DATE',
+	'PLAIN_TIME',
+	'PLAIN_DATE_TIME',
+	'ZONED_DATE_TIME',
+	'pack',
+	'unpack',
+	'iter_unpack',
+	'pack_column',
+	'zone_index',
+]
+
+# Fixed-width little-endian binary encodings, one record per value:
+#
+#   Instant        8 bytes   int64   epoch nanoseconds
+#   PlainDate      4 bytes   int32   days since 1970-01-01
+#   PlainTime      8 bytes   int64   nanoseconds since midnight
+#   PlainDateTime  8 bytes   int64   wall-clock nanoseconds since 1970-01-01T00:00
+#   ZonedDateTime 10 bytes   int64   epoch nanoseconds
+#                            uint16  index of the time zone in a zone table
+#
+# The int64 nanosecond encodings cover the years 1677-2262, like InstantArray.
+# The zone table is a sequence of time zone identifiers agreed on by both
+# sides; it is not part of the encoding.
+
+INSTANT = struct.Struct('<q')
+PLAIN_DATE = struct.Struct('<i')
+PLAIN_TIME = struct.Struct('<q')
+PLAIN_DATE_TIME = struct.Struct('<q')
+ZONED_DATE_TIME = struct.Struct('<qH')
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def pack(format: struct.Struct, /, *values: int) -> bytes:
+	try:
+		return format.pack(*values)
+	except struct.error:
+		raise ValueError(f'value out of range for the binary encoding: {values}') from None
+
+
+def unpack(format: struct.Struct, data: bytes | bytearray | memoryview, /) -> tuple[int, ...]:
+	try:
+		return format.unpack(data)
+	except struct.error:
+		raise ValueError(f'expected {format.size} bytes, got {len(data)}') from None
+
+
+def iter_unpack(format: struct.Struct, data: bytes | bytearray | memoryview, /) -> Iterator[tuple[int, ...]]:
+	# Reads the records straight from the buffer; nothing is sliced or copied.
+	try:
+		return format.iter_unpack(data)
+	except struct.error:
+		raise ValueError(f'buffer size is not a multiple of {format.size} bytes: {len(data)}') from None
+
+
+def pack_column(typecode: str, values: Iterable[int], /) -> bytes:
+	# One native array and one byte copy for single-field encodings.
+	try:
+		column = array(typecode, values)
+	except OverflowError:
+		raise ValueError('value out of range for the binary encoding') from None
+	if _BIG_ENDIAN:
+		column.byteswap()
+	return column.tobytes()
+
+
+def zone_index(zone_table: Sequence[str], time_zone_id: str, /) -> int:
+	try:
+		return zone_table.index(time_zone_id)
+	except ValueError:
+		raise ValueError(f'time zone not in the zone table: {time_zone_id!r}') from None
@@ -0,0 +1,284 @@
+import functools
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+from ._calendar import days_in_month, epoch_days_from_iso, is_leap_year, iso_from_epoch_days
+
+__all__ = ['ZoneRules', 'load_zone_rules', 'zone_rules']
+
+# A zone is compiled once from its TZif file into two flat arrays: the UTC
+# seconds of every offset change, and the offset in effect after each of them
+# (offsets[0] being the one before the first change). The POSIX TZ rule from
+# the file footer is expanded into more transitions, a few years at a time,
+# only once something asks about an instant past the end of the table.
+# Instants more than _FAR_YEARS past it get a table of their own instead,
+# covering only the years around them, so a lookup near the end of the
+# supported range doesn't expand the rule for every year up to there.
+
+_NO_START = -2**63
+_NO_LIMIT = 2**63 - 1
+_MAX_EPOCH_SECONDS = 86400 * 10**8
+_EXTEND_YEARS = 16
+_FAR_YEARS = 200
+# compiled zones kept by zone_rules; interned TimeZones hold their own reference
+_RULES_MAX = 1024
+
+
+class _DateRule(NamedTuple):
+	kind: str  # 'J' (1-365, no Feb 29), 'n' (0-365), or 'M' (month.week.weekday)
+	a: int
+	b: int
+	c: int
+	time: int  # local seconds after midnight, can be negative or above 24h
+
+	def local_seconds(self, year: int, /) -> int:
+		if self.kind == 'J':
+			days = epoch_days_from_iso(year, 1, 1) + self.a - 1 + (is_leap_year(year) and self.a >= 60)
+		elif self.kind == 'n':
+			days = epoch_days_from_iso(year, 1, 1) + self.a
+		else:
+			month, week, weekday = self.a, self.b, self.c
+			first = epoch_days_from_iso(year, month, 1)
+			day = 1 + (weekday - (first + 4)) % 7 + (week - 1) * 7
+			if day > days_in_month(year, month):
+				day -= 7
+			days = first + day - 1
+		return days * 86400 + self.time
+
+
+class _PosixRule(NamedTuple):
+	std_offset: int
+	dst_offset: int
+	start: _DateRule
+	end: _DateRule
+
+	def transitions(self, year: int, /) -> list[tuple[int, int]]:
+		return sorted([
+			(self.start.local_seconds(year) - self.std_offset, self.dst_offset),
+			(self.end.local_seconds(year) - self.dst_offset, self.std_offset),
+		])
+
+
+_posix_match = re.compile(
+	r'(?P<std><[^>]+>|[A-Za-z]{3,})(?P<std_offset>[+-]?\d{1,2}(?::\d{2}(?::\d{2})?)?)'
+	r'(?:(?P<dst><[^>]+>|[A-Za-z]{3,})(?P<dst_offset>[+-]?\d{1,2}(?::\d{2}(?::\d{2})?)?)?'
+	r',(?P<start>[^,]+),(?P<end>[^,]+))?',
+	re.ASCII,
+).fullmatch
+_date_rule_match = re.compile(
+	r'(?:J(?P<julian>\d{1,3})|(?P<day>\d{1,3})|M(?P<month>\d{1,2})\.(?P<week>[1-5])\.(?P<weekday>[0-6]))'
+	r'(?:/(?P<time>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?))?',
+	re.ASCII,
+).fullmatch
+
+
+def _posix_seconds(text: str, /) -> int:
+	sign = -1 if text[0] == '-' else 1
+	parts = [int(part) for part in text.lstrip('+-').split(':')] + [0, 0]
+	return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+def _parse_date_rule(text: str, /) -> _DateRule:
+	match = _date_rule_match(text)
+	if not match:
+		raise ValueError(f'invalid POSIX TZ rule: {text!r}')
+	time = _posix_seconds(match['time']) if match['time'] else 7200
+	if match['julian']:
+		return _DateRule('J', int(match['julian']), 0, 0, time)
+	if match['day']:
+		return _DateRule('n', int(match['day']), 0, 0, time)
+	return _DateRule('M', int(match['month']), int(match['week']), int(match['weekday']), time)
+
+
+def _parse_posix(text: str, /) -> tuple[int, _PosixRule | None]:
+	match = _posix_match(text)
+	if not match:
+		raise ValueError(f'invalid POSIX TZ string: {text!r}')
+	# POSIX offsets count hours west of Greenwich
+	std_offset = -_posix_seconds(match['std_offset'])
+	if not match['dst']:
+		return std_offset, None
+	dst_offset = -_posix_seconds(match['dst_offset']) if match['dst_offset'] else std_offset + 3600
+	return std_offset, _PosixRule(std_offset, dst_offset, _parse_date_rule(match['start']), _parse_date_rule(match['end']))
+
+
+def _read_tzif(data: bytes, /) -> tuple[list[int], list[int], int, str]:
+	if data[:4] != b'TZif':
+		raise ValueError('invalid TZif file')
+	version = data[4]
+	isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = struct.unpack('>6l', data[20:44])
+	time_size = 4
+	pos = 44
+	if version >= ord('2'):
+		# skip the 32-bit block, the 64-bit one follows with its own header
+		pos += timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt
+		isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = struct.unpack('>6l', data[pos + 20:pos + 44])
+		time_size = 8
+		pos += 44
+	times = list(struct.unpack(f'>{timecnt}{"q" if time_size == 8 else "l"}', data[pos:pos + timecnt * time_size]))
+	pos += timecnt * time_size
+	indices = data[pos:pos + timecnt]
+	pos += timecnt
+	types = [struct.unpack('>lBB', data[pos + i * 6:pos + i * 6 + 6])[0] for i in range(typecnt)]
+	pos += typecnt * 6 + charcnt + leapcnt * (time_size + 4) + isstdcnt + isutcnt
+	footer = ''
+	if version >= ord('2'):
+		footer = data[pos:].strip(b'\n').decode('ascii')
+	return times, [types[i] for i in indices], types[0], footer
+
+
+def _open_tzif(key: str, /) -> bytes:
+	# same search order as zoneinfo: TZPATH first, then the tzdata package
+	import zoneinfo as py_zoneinfo
+	if os.path.isabs(key) or '..' in key.split('/') or '\\' in key:
+		raise ValueError(f'invalid time zone key: {key!r}')
+	for directory in py_zoneinfo.TZPATH:
+		path = os.path.join(directory, key)
+		if os.path.isfile(path):
+			with open(path, 'rb') as file:
+				return file.read()
+	try:
+		import importlib.resources
+		return importlib.resources.files('tzdata.zoneinfo').joinpath(key).read_bytes()
+	except (ImportError, FileNotFoundError, IsADirectoryError, NotADirectoryError):
+		raise py_zoneinfo.ZoneInfoNotFoundError(f'No time zone found with key {key}') from None
+
+
+class _Table(NamedTuple):
+	transitions: 'array[int]'  # UTC epoch seconds
+	offsets: 'array[int]'  # nanoseconds, len(offsets) == len(transitions) + 1
+	limit: int  # the table is complete for instants below this epoch second
+	year: int  # last year expanded from the POSIX rule
+	start: int = _NO_START  # and from this one, for tables of far years
+
+
+def _never_changes(table: _Table, /) -> bool:
+	# A table of far years without a transition below its limit: the rule
+	# repeats every year, so it never changes the offset at all.
+	return table.start != _NO_START and not bisect_left(table.transitions, table.limit)
+
+
+class ZoneRules:
+	__slots__ = ('key', '_rule', '_table', '_far_table')
+
+	key: str
+	_rule: _PosixRule | None
+	_table: _Table
+	_far_table: _Table | None
+
+	def __init__(self, key: str, times: list[int], offsets: list[int], initial_offset: int, footer: str, /):
+		self.key = key
+		transitions = array('q')
+		offsets_ns = array('q', [initial_offset * 1000000000])
+		for time, offset in zip(times, offsets):
+			self._append(transitions, offsets_ns, time, offset * 1000000000)
+		self._rule = None
+		limit = _NO_LIMIT
+		year = 0
+		if footer:
+			std_offset, self._rule = _parse_posix(footer)
+			if self._rule is None:
+				if not transitions:
+					offsets_ns[0] = std_offset * 1000000000
+			else:
+				year = iso_from_epoch_days((transitions[-1] if transitions else 0) // 86400)[0] - 1
+				limit = 0
+		# Readers take the whole table in one attribute read, and it is only ever
+		# replaced by a longer one, so a concurrent extension can't tear a lookup.
+		self._table = _Table(transitions, offsets_ns, limit, year)
+		self._far_table = None
+
+	@staticmethod
+	def _append(transitions: 'array[int]', offsets: 'array[int]', time: int, offset: int, /):
+		if transitions and time <= transitions[-1]:
+			# collapse zero-length periods, e.g. the year boundary of an all-year DST rule
+			transitions.pop()
+			offsets.pop()
+		if offset != offsets[-1]:
+			transitions.append(time)
+			offsets.append(offset)
+
+	def _table_for(self, epoch_seconds: int, /) -> _Table:
+		table = self._table
+		if epoch_seconds < table.limit:
+			return table
+		assert self._rule is not None
+		year = iso_from_epoch_days(epoch_seconds // 86400)[0]
+		if year > table.year + _FAR_YEARS:
+			return self._far_table_for(epoch_seconds, year)
+		until = max(year + 1, table.year + _EXTEND_YEARS)
+		transitions = array('q', table.transitions)
+		offsets = array('q', table.offsets)
+		for year in range(table.year + 1, until + 1):
+			for time, offset in self._rule.transitions(year):
+				if not transitions or time >= transitions[-1]:
+					self._append(transitions, offsets, time, offset * 1000000000)
+		# two days of margin for transitions just after new year in far-east zones
+		table = self._table = _Table(transitions, offsets, (epoch_days_from_iso(until, 1, 1) - 2) * 86400, until)
+		return table
+
+	def _far_table_for(self, epoch_seconds: int, year: int, /) -> _Table:
+		# The rule for the years before, of and after `year` only. One more year
+		# is expanded first and cut off again, so that transitions undone by the
+		# next one collapse as they do in the shared table. The last such table is
+		# kept, for runs of lookups in the same years.
+		table = self._far_table
+		if table is not None and table.start <= epoch_seconds < table.limit:
+			return table
+		rule = self._rule
+		assert rule is not None
+		transitions = array('q')
+		offsets = array('q', [rule.transitions(year - 3)[-1][1] * 1000000000])
+		for time, offset in rule.transitions(year - 2) + rule.transitions(year - 1) + rule.transitions(year) + rule.transitions(year + 1):
+			if not transitions or time >= transitions[-1]:
+				self._append(transitions, offsets, time, offset * 1000000000)
+		start = (epoch_days_from_iso(year - 1, 1, 1) + 2) * 86400
+		index = bisect_left(transitions, start)
+		table = self._far_table = _Table(transitions[index:], offsets[index:], (epoch_days_from_iso(year + 2, 1, 1) - 2) * 86400, year + 1, start)
+		return table
+
+	def offset_nanoseconds_for(self, epoch_nanoseconds: int, /) -> int:
+		epoch_seconds = epoch_nanoseconds // 1000000000
+		table = self._table_for(epoch_seconds)
+		return table.offsets[bisect_right(table.transitions, epoch_seconds)]
+
+	def next_transition(self, epoch_nanoseconds: int, /) -> int | None:
+		epoch_seconds = epoch_nanoseconds // 1000000000
+		table = self._table_for(epoch_seconds)
+		while True:
+			index = bisect_right(table.transitions, epoch_seconds)
+			# the last rule transition of a table can be undone by the next extension
+			if index < len(table.transitions) and table.transitions[index] < table.limit:
+				break
+			if table.limit >= _MAX_EPOCH_SECONDS or _never_changes(table):
+				return None
+			table = self._table_for(table.limit)
+		if table.transitions[index] > _MAX_EPOCH_SECONDS:
+			return None
+		return table.transitions[index] * 1000000000
+
+	def previous_transition(self, epoch_nanoseconds: int, /) -> int | None:
+		epoch_seconds = -(-epoch_nanoseconds // 1000000000)
+		table = self._table_for(epoch_seconds)
+		index = bisect_left(table.transitions, epoch_seconds)
+		while not index and table.start != _NO_START:
+			# a table of far years without a transition before the instant
+			table = self._table if _never_changes(table) else self._table_for(table.start - 1)
+			index = bisect_left(table.transitions, epoch_seconds)
+		if not index:
+			return None
+		return table.transitions[index - 1] * 1000000000
+
+
+def load_zone_rules(key: str, /) -> ZoneRules:
+	times, offsets, initial_offset, footer = _read_tzif(_open_tzif(key))
+	return ZoneRules(key, times, offsets, initial_offset, footer)
+
+
+@functools.lru_cache(maxsize = _RULES_MAX)
+def zone_rules(key: str, /) -> ZoneRules:
+	return load_zone_rules(key)
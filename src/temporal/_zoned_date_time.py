@@ -1,59 +1,74 @@
 import datetime as py_datetime
-import zoneinfo as py_zoneinfo
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, Self
+from typing import Iterable, Iterator, Literal, Self, Sequence
 
-from ._duration import Duration
-from ._instant import Instant
-from ._plain_date import PlainDate
+from ._calendar import add_iso_date, difference_iso_date, iso_date_time_from_epoch_nanoseconds, iso_from_epoch_days
+from ._duration import Duration, difference_settings, round_settings
+from ._formatter import DEFAULT_PLAN, FormatPlan, format_offset, format_offset_rounded, format_plan
+from ._instant import _MAX_EPOCH_NANOSECONDS, Instant, _py_datetime_to_epoch_nanoseconds, _set_epoch_nanoseconds
+from ._parse_many import ParseError, parse_many
+from ._parser import ParsedDateTime, parse_date_time
+from ._plain_date import PlainDate, _DateFields
 from ._plain_date_time import PlainDateTime
 from ._plain_time import PlainTime
+from ._rounding import as_if_positive, negated, round_to_increment
 from ._time_zone import TimeZone
+from ._wire import ZONED_DATE_TIME, iter_unpack, pack, unpack, zone_index
 
 __all__ = ['ZonedDateTime']
 
 
-@dataclass(frozen = True)
-class _ZonedDateTimeBase:
-	py_datetimezoned: py_datetime.datetime
+class ZonedDateTime(Instant, _DateFields):
+	# An exact time (the Instant slot), the interned TimeZone and the UTC offset
+	# resolved for that time. The wall-clock fields are decomposed on first use
+	# and kept in _local; until then it is None.
+	__slots__ = ('_time_zone', '_offset_nanoseconds', '_local')
 
-	def __post_init__(self):
-		assert isinstance(self.py_datetimezoned.tzinfo, py_zoneinfo.ZoneInfo)
-
-	@classmethod
-	def from_py_datetimezoned(cls, py_datetimezoned: py_datetime.datetime):
-		return cls(py_datetimezoned = py_datetimezoned)
-
-
-@dataclass(frozen = True)
-class ZonedDateTime(_ZonedDateTimeBase, PlainDateTime, Instant):
-
-	@property
-	def py_datetimenaive(self) -> py_datetime.datetime:  # type: ignore
-		return self.py_datetimezoned.replace(tzinfo = None)
-
-	@property
-	def py_datetimeutc(self) -> py_datetime.datetime:  # type: ignore
-		return self.py_datetimezoned.astimezone(py_datetime.timezone.utc)
+	_time_zone: TimeZone
+	_offset_nanoseconds: int
+	_local: tuple[int, int, int, int, int, int, int, int, int] | None
 
 	def __init__(
 		self,
 		epoch_nanoseconds: int | None = None,
-		time_zone: 'TimeZone | None' = None,
+		time_zone: 'TimeZone | str | None' = None,
 		/,
 		*,
 		py_datetimezoned: py_datetime.datetime | None = None,
 	):
-		if not py_datetimezoned:
-			if epoch_nanoseconds is None and time_zone is None:
-				raise TypeError("ZonedDateTime.__init__() missing 2 required positional arguments: 'epoch_nanoseconds' and 'time_zone'")
-			if epoch_nanoseconds is None:
-				raise TypeError("ZonedDateTime.__init__() missing 1 required positional argument: 'epoch_nanoseconds'")
-			if time_zone is None:
-				raise TypeError("ZonedDateTime.__init__() missing 1 required positional argument: 'time_zone'")
-			py_datetimezoned = py_datetime.datetime.fromtimestamp(epoch_nanoseconds / 1000000000, tz = time_zone.py_tzinfo)
-			py_datetimezoned = py_datetimezoned.replace(microsecond = int(epoch_nanoseconds / 1000))
-		super().__init__(py_datetimezoned)
+		if py_datetimezoned:
+			# zoneinfo is already loaded if the datetime carries a ZoneInfo
+			import zoneinfo as py_zoneinfo
+			assert isinstance(py_datetimezoned.tzinfo, py_zoneinfo.ZoneInfo)
+			time_zone = TimeZone.from_py_zoneinfo(py_datetimezoned.tzinfo)
+			epoch_nanoseconds = _py_datetime_to_epoch_nanoseconds(py_datetimezoned)
+		elif epoch_nanoseconds is None and time_zone is None:
+			raise TypeError("ZonedDateTime.__init__() missing 2 required positional arguments: 'epoch_nanoseconds' and 'time_zone'")
+		elif epoch_nanoseconds is None:
+			raise TypeError("ZonedDateTime.__init__() missing 1 required positional argument: 'epoch_nanoseconds'")
+		elif time_zone is None:
+			raise TypeError("ZonedDateTime.__init__() missing 1 required positional argument: 'time_zone'")
+		elif isinstance(time_zone, str):
+			time_zone = TimeZone(time_zone)
+		if not -_MAX_EPOCH_NANOSECONDS <= epoch_nanoseconds <= _MAX_EPOCH_NANOSECONDS:
+			raise ValueError(f'epoch_nanoseconds out of range: {epoch_nanoseconds}')
+		_set_epoch_nanoseconds(self, epoch_nanoseconds)
+		_set_time_zone(self, time_zone)
+		_set_offset_nanoseconds(self, time_zone._rules.offset_nanoseconds_for(epoch_nanoseconds))
+		_set_local(self, None)
+
+	@classmethod
+	def _new(cls, epoch_nanoseconds: int, time_zone: TimeZone, offset_nanoseconds: int, /) -> Self:
+		# Skips the range check and the offset lookup, for callers that already have both.
+		self = object.__new__(cls)
+		_set_epoch_nanoseconds(self, epoch_nanoseconds)
+		_set_time_zone(self, time_zone)
+		_set_offset_nanoseconds(self, offset_nanoseconds)
+		_set_local(self, None)
+		return self
+
+	@classmethod
+	def from_py_datetimezoned(cls, py_datetimezoned: py_datetime.datetime):
+		return cls(py_datetimezoned = py_datetimezoned)
 
 	@classmethod
 	def from_(  # type: ignore
@@ -63,17 +78,164 @@ class ZonedDateTime(_ZonedDateTimeBase, PlainDateTime, Instant):
 			*,
 			overflow: Literal['constrain', 'reject'] = 'constrain',
 	) -> Self:
+		if thing.__class__ is cls:
+			return thing  # type: ignore
 		if isinstance(thing, ZonedDateTime):
-			return cls(py_datetimezoned = thing.py_datetimezoned.replace())
-		# TODO parse
-		return cls(py_datetimezoned = py_datetime.datetime(2000, 1, 1, tzinfo = py_zoneinfo.ZoneInfo('Europe/Warsaw')))
+			return cls._new(thing._epoch_nanoseconds, thing._time_zone, thing._offset_nanoseconds)
+		parsed = parse_date_time(thing)
+		if parsed.time_zone is None:
+			raise ValueError(f'ZonedDateTime string must have a time zone annotation: {thing!r}')
+		return cls._from_parsed(parsed, TimeZone(parsed.time_zone), thing)
+
+	@classmethod
+	def from_iter(cls, source: Iterable[str], /, *, errors: Literal['raise', 'skip'] | list[ParseError] = 'raise') -> Iterator[Self]:  # type: ignore
+		# the time zone comes from each string, so rows go through from_
+		return parse_many(cls.from_, source, errors = errors)
+
+	@classmethod
+	def _from_parsed(cls, parsed: ParsedDateTime, time_zone: TimeZone, thing: str, /) -> Self:
+		epoch_nanoseconds = parsed.epoch_nanoseconds
+		if epoch_nanoseconds is None:
+			# no offset in the string: resolve the wall-clock time like disambiguation = 'compatible'
+			epoch_nanoseconds = time_zone._epoch_nanoseconds_for(parsed.wall_nanoseconds, 'compatible')
+		if not -_MAX_EPOCH_NANOSECONDS <= epoch_nanoseconds <= _MAX_EPOCH_NANOSECONDS:
+			raise ValueError(f'epoch_nanoseconds out of range: {epoch_nanoseconds}')
+		offset_nanoseconds = time_zone._rules.offset_nanoseconds_for(epoch_nanoseconds)
+		if parsed.offset_nanoseconds is None or parsed.offset_nanoseconds == offset_nanoseconds:
+			return cls._new(epoch_nanoseconds, time_zone, offset_nanoseconds)
+		# an HH:MM offset may match the zone's offset rounded to the minute, as in Temporal
+		if parsed.offset_nanoseconds % 60000000000 or parsed.offset_nanoseconds != round_to_increment(offset_nanoseconds, 60000000000, 'halfExpand'):
+			raise ValueError(f'UTC offset does not match the time zone: {thing!r}')
+		return cls(epoch_nanoseconds + parsed.offset_nanoseconds - offset_nanoseconds, time_zone)
+
+	@classmethod
+	def _from_wire(cls, epoch_nanoseconds: int, index: int, time_zones: 'Sequence[TimeZone]', /) -> Self:
+		if index >= len(time_zones):
+			raise ValueError(f'time zone index out of range for the zone table: {index}')
+		time_zone = time_zones[index]
+		return cls._new(epoch_nanoseconds, time_zone, time_zone._rules.offset_nanoseconds_for(epoch_nanoseconds))
+
+	@classmethod
+	def from_bytes(cls, data: bytes | bytearray | memoryview, zone_table: Sequence[str], /) -> Self:  # type: ignore
+		epoch_nanoseconds, index = unpack(ZONED_DATE_TIME, data)
+		if index >= len(zone_table):
+			raise ValueError(f'time zone index out of range for the zone table: {index}')
+		time_zone = TimeZone(zone_table[index])
+		return cls._new(epoch_nanoseconds, time_zone, time_zone._rules.offset_nanoseconds_for(epoch_nanoseconds))
+
+	@classmethod
+	def from_bytes_iter(cls, data: bytes | bytearray | memoryview, zone_table: Sequence[str], /) -> Iterator[Self]:  # type: ignore
+		time_zones = [TimeZone(time_zone_id) for time_zone_id in zone_table]
+		new = cls._from_wire
+		return (new(epoch_nanoseconds, index, time_zones) for epoch_nanoseconds, index in iter_unpack(ZONED_DATE_TIME, data))
+
+	@staticmethod
+	def to_bytes_many(zoned_date_times: 'Iterable[ZonedDateTime]', zone_table: Sequence[str], /) -> bytes:  # type: ignore
+		indices = {time_zone_id: index for index, time_zone_id in enumerate(zone_table)}
+		records = bytearray()
+		for zoned_date_time in zoned_date_times:
+			time_zone_id = zoned_date_time._time_zone.id
+			if time_zone_id not in indices:
+				raise ValueError(f'time zone not in the zone table: {time_zone_id!r}')
+			records += pack(ZONED_DATE_TIME, zoned_date_time._epoch_nanoseconds, indices[time_zone_id])
+		return bytes(records)
+
+	def to_bytes(self, zone_table: Sequence[str], /) -> bytes:  # type: ignore
+		return pack(ZONED_DATE_TIME, self._epoch_nanoseconds, zone_index(zone_table, self._time_zone.id))
 
 	# TODO with_, with_plain_time, with_plain_date
 
+	@property
+	def _iso_date_time(self) -> tuple[int, int, int, int, int, int, int, int, int]:
+		local = self._local
+		if local is None:
+			local = iso_date_time_from_epoch_nanoseconds(self._epoch_nanoseconds + self._offset_nanoseconds)
+			# a complete tuple is published in one store, so concurrent readers
+			# see either None or the final fields
+			_set_local(self, local)
+		return local
+
+	@property
+	def _iso_date(self) -> tuple[int, int, int]:
+		return self._iso_date_time[:3]  # type: ignore
+
+	@property
+	def _iso_time(self) -> tuple[int, int, int, int, int, int]:
+		return self._iso_date_time[3:]  # type: ignore
+
+	@property
+	def _epoch_days(self) -> int:
+		return (self._epoch_nanoseconds + self._offset_nanoseconds) // 86400000000000
+
+	@property
+	def _wall_nanoseconds(self) -> int:
+		return self._epoch_nanoseconds + self._offset_nanoseconds
+
+	@property
+	def year(self, /) -> int:
+		return self._iso_date_time[0]
+
+	@property
+	def month(self, /) -> int:
+		return self._iso_date_time[1]
+
+	@property
+	def day(self, /) -> int:
+		return self._iso_date_time[2]
+
+	@property
+	def hour(self, /) -> int:
+		return self._iso_date_time[3]
+
+	@property
+	def minute(self, /) -> int:
+		return self._iso_date_time[4]
+
+	@property
+	def second(self, /) -> int:
+		return self._iso_date_time[5]
+
+	@property
+	def millisecond(self, /) -> int:
+		return self._iso_date_time[6]
+
+	@property
+	def microsecond(self, /) -> int:
+		return self._iso_date_time[7]
+
+	@property
+	def nanosecond(self, /) -> int:
+		return self._iso_date_time[8]
+
 	@property
 	def time_zone_id(self) -> str:
-		assert isinstance(self.py_datetimezoned.tzinfo, py_zoneinfo.ZoneInfo)
-		return self.py_datetimezoned.tzinfo.key
+		return self._time_zone.id
+
+	@property
+	def offset_nanoseconds(self) -> int:
+		return self._offset_nanoseconds
+
+	@property
+	def offset(self) -> str:
+		return format_offset(self._offset_nanoseconds)
+
+	@property
+	def py_datetimezoned(self) -> py_datetime.datetime:
+		return self.py_datetimeutc.astimezone(self._time_zone.py_tzinfo)
+
+	@property
+	def py_datetimenaive(self) -> py_datetime.datetime:
+		year, month, day, hour, minute, second, millisecond, microsecond, _ = self._iso_date_time
+		return py_datetime.datetime(year, month, day, hour, minute, second, millisecond * 1000 + microsecond)
+
+	@property
+	def py_date(self) -> py_datetime.date:
+		return py_datetime.date(*self._iso_date_time[:3])
+
+	@property
+	def py_time(self) -> py_datetime.time:
+		_, _, _, hour, minute, second, millisecond, microsecond, _ = self._iso_date_time
+		return py_datetime.time(hour, minute, second, millisecond * 1000 + microsecond)
 
 	def add(
 		self,
@@ -83,8 +245,19 @@ class ZonedDateTime(_ZonedDateTimeBase, PlainDateTime, Instant):
 	) -> 'ZonedDateTime':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		if overflow not in ('constrain', 'reject'):
+			raise ValueError(f'invalid overflow: {overflow!r}')
+		epoch_nanoseconds = self._epoch_nanoseconds
+		years, months, weeks, days = duration._fields[:4]
+		if years or months or weeks or days:
+			# calendar units move the wall-clock date, keeping the time of day, and
+			# the result is resolved in the zone; the time part is exact after that
+			year, month, day = self._iso_date
+			wall_nanoseconds = add_iso_date(year, month, day, years, months, weeks, days, overflow) * 86400000000000 + self._wall_nanoseconds % 86400000000000
+			if not -_MAX_EPOCH_NANOSECONDS - 86400000000000 <= wall_nanoseconds <= _MAX_EPOCH_NANOSECONDS + 86400000000000:
+				raise ValueError(f'date-time out of range: {self} + {duration}')
+			epoch_nanoseconds = self._time_zone._epoch_nanoseconds_for(wall_nanoseconds, 'compatible')
+		return ZonedDateTime(epoch_nanoseconds + duration._time_nanoseconds, self._time_zone)
 
 	def subtract(
 		self,
@@ -94,8 +267,110 @@ class ZonedDateTime(_ZonedDateTimeBase, PlainDateTime, Instant):
 	) -> 'ZonedDateTime':
 		if not isinstance(duration, Duration):
 			duration = Duration.from_(duration)
-		# TODO
-		return self
+		return self.add(duration.negated(), overflow)
+
+	def until(  # type: ignore
+		self,
+		other: 'Self | str',
+		/,
+		*,
+		largest_unit: Literal['auto', 'year', 'month', 'week', 'day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'auto',
+		smallest_unit: Literal['year', 'month', 'week', 'day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'nanosecond',
+		rounding_increment: int = 1,
+		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'trunc',
+	) -> 'Duration':
+		if not isinstance(other, type(self)):
+			other = type(self).from_(other)
+		return self._difference(other, largest_unit, smallest_unit, rounding_increment, rounding_mode)
+
+	def since(  # type: ignore
+		self,
+		other: 'Self | str',
+		/,
+		*,
+		largest_unit: Literal['auto', 'year', 'month', 'week', 'day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'auto',
+		smallest_unit: Literal['year', 'month', 'week', 'day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] = 'nanosecond',
+		rounding_increment: int = 1,
+		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'trunc',
+	) -> 'Duration':
+		if not isinstance(other, type(self)):
+			other = type(self).from_(other)
+		return self._difference(other, largest_unit, smallest_unit, rounding_increment, negated(rounding_mode)).negated()
+
+	def _difference(self, other: 'ZonedDateTime', largest_unit: str, smallest_unit: str, rounding_increment: int, rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'], /) -> 'Duration':
+		# hours are the default largest unit of ZonedDateTime differences
+		if largest_unit == 'auto':
+			largest_unit = 'day' if smallest_unit in ('year', 'month', 'week', 'day') else 'hour'
+		if largest_unit not in ('year', 'month', 'week', 'day'):
+			largest_unit, increment = difference_settings(largest_unit, smallest_unit, rounding_increment, rounding_mode)
+			return Duration._from_nanoseconds(round_to_increment(other._epoch_nanoseconds - self._epoch_nanoseconds, increment, rounding_mode), largest_unit)
+		if smallest_unit in ('year', 'month', 'week'):
+			raise ValueError(f'rounding to {smallest_unit!r} is not supported')
+		if smallest_unit == 'day':
+			increment = round_settings('day', rounding_increment, rounding_mode, 'date_time')
+		else:
+			increment = difference_settings('hour', smallest_unit, rounding_increment, rounding_mode)[1]
+		time_zone = self._time_zone
+		if other._time_zone != time_zone:
+			raise ValueError(f'cannot compute a difference in {largest_unit}s across time zones: {time_zone.id!r}, {other._time_zone.id!r}')
+		start = self._epoch_nanoseconds
+		end = other._epoch_nanoseconds
+		if start == end:
+			return Duration()
+		sign = 1 if end > start else -1
+		# Days are wall-clock days: the last day boundary, at the time of day of
+		# self, that does not pass other, with the exact time left after it.
+		# That boundary may be a day or two earlier than the date of other when
+		# the time of day of other is earlier, or falls in a DST gap.
+		start_days, start_time = divmod(self._wall_nanoseconds, 86400000000000)
+		end_days, end_time = divmod(other._wall_nanoseconds, 86400000000000)
+		days = end_days - sign if (end_time - start_time) * sign < 0 else end_days
+		while True:
+			intermediate = time_zone._epoch_nanoseconds_for(days * 86400000000000 + start_time, 'compatible')
+			nanoseconds = end - intermediate
+			if nanoseconds * sign >= 0:
+				break
+			days -= sign
+		if increment != 1:
+			# the day after the boundary may be 23 or 25 hours long; rounding up to it
+			# moves to the next day and rounds what is left of the time after that
+			day_length = time_zone._epoch_nanoseconds_for((days + sign) * 86400000000000 + start_time, 'compatible') - intermediate
+			if smallest_unit == 'day':
+				increment = abs(day_length)
+			rounded = round_to_increment(nanoseconds, increment, rounding_mode)
+			if (rounded - day_length) * sign >= 0:
+				days += sign
+				rounded = round_to_increment(rounded - day_length, increment, rounding_mode) if smallest_unit != 'day' else 0
+			nanoseconds = rounded
+		date = difference_iso_date(iso_from_epoch_days(start_days), iso_from_epoch_days(days), largest_unit)
+		return Duration._from_fields((*date, *Duration._from_nanoseconds(nanoseconds)._fields[4:]))
+
+	def round(  # type: ignore
+		self,
+		/,
+		smallest_unit: Literal['day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'],
+		*,
+		rounding_increment: int = 1,
+		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'halfExpand',
+	) -> Self:
+		increment = round_settings(smallest_unit, rounding_increment, rounding_mode, 'date_time')
+		rounding_mode = as_if_positive(rounding_mode)
+		time_zone = self._time_zone
+		offset_for = time_zone._rules.offset_nanoseconds_for
+		if smallest_unit == 'day':
+			# days are as long as the zone makes them, 23 or 25 hours around a transition
+			start = time_zone._start_of_day(self._epoch_days)
+			end = time_zone._start_of_day(self._epoch_days + 1)
+			epoch_nanoseconds = start + round_to_increment(self._epoch_nanoseconds - start, end - start, rounding_mode)
+		else:
+			wall_nanoseconds = round_to_increment(self._wall_nanoseconds, increment, rounding_mode)
+			# keep the offset if it still applies, so rounding within an overlap stays on its side
+			epoch_nanoseconds = wall_nanoseconds - self._offset_nanoseconds
+			if offset_for(epoch_nanoseconds) != self._offset_nanoseconds:
+				epoch_nanoseconds = time_zone._epoch_nanoseconds_for(wall_nanoseconds, 'compatible')
+		if not -_MAX_EPOCH_NANOSECONDS <= epoch_nanoseconds <= _MAX_EPOCH_NANOSECONDS:
+			raise ValueError(f'rounded date-time out of range: {self}')
+		return type(self)._new(epoch_nanoseconds, time_zone, offset_for(epoch_nanoseconds))
 
 	def to_string(
 		self,
@@ -106,46 +381,93 @@ class ZonedDateTime(_ZonedDateTimeBase, PlainDateTime, Instant):
 		smallest_unit: Literal['minute', 'second', 'millisecond', 'microsecond', 'nanosecond'] | None = None,
 		rounding_mode: Literal['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven'] = 'trunc',
 	) -> str:
-		# TODO
-		return str(self)
+		if isinstance(time_zone, str):
+			time_zone = TimeZone.from_(time_zone)
+		return self._format(format_plan(fractional_second_digits, smallest_unit, rounding_mode), time_zone or self._time_zone)
+
+	def _format(self, plan: FormatPlan, time_zone: TimeZone, /) -> str:
+		epoch_nanoseconds = round_to_increment(self._epoch_nanoseconds, plan.increment, plan.rounding_mode)
+		if epoch_nanoseconds == self._epoch_nanoseconds and time_zone is self._time_zone:
+			offset_nanoseconds = self._offset_nanoseconds
+		else:
+			offset_nanoseconds = time_zone._rules.offset_nanoseconds_for(epoch_nanoseconds)
+		return f'{plan.format_date_time(epoch_nanoseconds + offset_nanoseconds)}{format_offset_rounded(offset_nanoseconds)}[{time_zone.id}]'
 
 	def to_locale_string(self) -> str:  # TODO options
 		# TODO
 		return str(self)
 
 	def __str__(self):
-		if TYPE_CHECKING:
-			assert isinstance(self.py_datetimezoned.tzinfo, py_zoneinfo.ZoneInfo)
-		return f"{self.py_datetimezoned.isoformat()}[{self.py_datetimezoned.tzinfo.key}]"
+		return self._format(DEFAULT_PLAN, self._time_zone)
 
 	def __repr__(self):
 		return f'{type(self).__name__}.from_("{self}")'
 
+	def __eq__(self, other: object, /) -> bool:
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return self._epoch_nanoseconds == other._epoch_nanoseconds and self._time_zone == other._time_zone  # type: ignore
+
+	def __hash__(self) -> int:
+		return hash((self._epoch_nanoseconds, self._time_zone))
+
+	def __reduce__(self):
+		return (type(self), (self._epoch_nanoseconds, self._time_zone.id))
+
 	def to_zoned_date_time(
 		self,
 		*,
 		plain_date: 'PlainDate | str | None' = None,
 		plain_time: 'PlainTime | str | None' = None,
-		time_zone: 'TimeZone | None' = None,
+		time_zone: 'TimeZone | str | None' = None,
 		disambiguation: Literal['compatible', 'earlier', 'later', 'reject'] = 'compatible',
 	) -> 'ZonedDateTime':
 		if isinstance(plain_date, str):
 			plain_date = PlainDate.from_(plain_date)
 		elif plain_date is None:
-			plain_date = self
+			plain_date = self  # type: ignore
 		if isinstance(plain_time, str):
 			plain_time = PlainTime.from_(plain_time)
 		elif plain_time is None:
-			plain_time = self
+			plain_time = self  # type: ignore
 		if time_zone is None:
-			time_zone = TimeZone(self.time_zone_id)
-		return ZonedDateTime.from_py_datetimezoned(py_datetime.datetime.combine(plain_date.py_date, plain_time.py_time, time_zone.py_tzinfo))
+			time_zone = self._time_zone
+		elif isinstance(time_zone, str):
+			time_zone = TimeZone(time_zone)
+		if disambiguation not in ('compatible', 'earlier', 'later', 'reject'):
+			raise ValueError(f'invalid disambiguation: {disambiguation!r}')
+		# PlainTime keeps nanoseconds since midnight, the date-time types a wall clock
+		time_of_day = plain_time._nanosecond_of_day if isinstance(plain_time, PlainTime) else plain_time._wall_nanoseconds % 86400000000000  # type: ignore
+		epoch_nanoseconds = time_zone._epoch_nanoseconds_for(plain_date._epoch_days * 86400000000000 + time_of_day, disambiguation)  # type: ignore
+		if not -_MAX_EPOCH_NANOSECONDS <= epoch_nanoseconds <= _MAX_EPOCH_NANOSECONDS:
+			raise ValueError(f'date-time out of range: {plain_date.to_plain_date()}T{plain_time.to_plain_time()}')  # type: ignore
+		return ZonedDateTime._new(epoch_nanoseconds, time_zone, time_zone._rules.offset_nanoseconds_for(epoch_nanoseconds))
+
+	def to_plain_date_time(self) -> PlainDateTime:
+		return PlainDateTime._new(self._iso_date_time)
+
+	def to_plain_time(self) -> PlainTime:
+		return PlainTime._from_nanosecond_of_day(self._wall_nanoseconds % 86400000000000)
 
 	class ISOFields(PlainDateTime.ISOFields):
 		time_zone: TimeZone
 
 	def get_iso_fields(self) -> ISOFields:
+		year, month, day, hour, minute, second, millisecond, microsecond, nanosecond = self._iso_date_time
 		return ZonedDateTime.ISOFields(
-			**PlainDateTime.get_iso_fields(self),
-			time_zone = TimeZone(self.time_zone_id),
+			iso_year = year,
+			iso_month = month,
+			iso_day = day,
+			iso_hour = hour,
+			iso_minute = minute,
+			iso_second = second,
+			iso_millisecond = millisecond,
+			iso_microsecond = microsecond,
+			iso_nanosecond = nanosecond,
+			time_zone = self._time_zone,
 		)
+
+
+_set_time_zone = ZonedDateTime._time_zone.__set__  # type: ignore
+_set_offset_nanoseconds = ZonedDateTime._offset_nanoseconds.__set__  # type: ignore
+_set_local = ZonedDateTime._local.__set__  # type: ignore
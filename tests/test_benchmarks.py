@@ -0,0 +1,63 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+
+
+def _load(name: str, /):  # type: ignore
+	spec = importlib.util.spec_from_file_location(f'benchmarks_{name}', os.path.join(BENCHMARKS, f'{name}.py'))
+	module = importlib.util.module_from_spec(spec)  # type: ignore
+	spec.loader.exec_module(module)  # type: ignore
+	return module
+
+
+suite = _load('suite')
+CASES = suite.cases()
+
+
+@pytest.mark.parametrize('case', CASES, ids = [f'{case.group}-{case.name}' for case in CASES])
+def test_case_runs(case):  # type: ignore
+	teardown = case.setup() if case.setup is not None else None
+	try:
+		case.function()
+	finally:
+		if teardown is not None:
+			teardown()
+	if case.baseline is not None:
+		case.baseline()
+
+
+def test_case_names_are_unique():
+	names = [(case.group, case.name) for case in CASES]
+	assert len(names) == len(set(names))
+
+
+def test_measure():
+	result = suite.measure(lambda: None, 2, 0.0)
+	assert set(result) == {'best_ns', 'median_ns', 'loops'}
+	assert 0 <= result['best_ns'] <= result['median_ns'] and result['loops'] == 1
+
+
+def _report(path, timings: dict[str, float], /) -> str:  # type: ignore
+	with open(path, 'w') as file:
+		json.dump({'results': [{'group': 'g', 'name': name, 'best_ns': best_ns} for name, best_ns in timings.items()]}, file)
+	return str(path)
+
+
+@pytest.mark.parametrize('after, threshold, status, marks', [
+	({'a': 100.0, 'b': 200.0}, '1.1', 0, []),
+	({'a': 105.0, 'b': 150.0, 'c': 1.0}, '1.1', 0, ['faster', 'new']),
+	({'a': 120.0, 'b': 200.0}, '1.1', 1, ['slower']),
+	({'a': 120.0, 'b': 200.0}, '1.5', 0, []),
+])
+def test_compare_exit_status(tmp_path, after: dict[str, float], threshold: str, status: int, marks: list[str]):  # type: ignore
+	before = _report(tmp_path / 'before.json', {'a': 100.0, 'b': 200.0})
+	after_path = _report(tmp_path / 'after.json', after)
+	result = subprocess.run([sys.executable, os.path.join(BENCHMARKS, 'compare.py'), before, after_path, '--threshold', threshold], capture_output = True, text = True)
+	assert result.returncode == status
+	assert [mark for mark in ('slower', 'faster', 'new') if mark in result.stdout] == sorted(marks, key = ('slower', 'faster', 'new').index)
@@ -0,0 +1,101 @@
+import datetime as py_datetime
+import zoneinfo as py_zoneinfo
+from array import array
+from random import Random
+
+import pytest
+
+from temporal import PlainDateTime, TimeZone
+
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.timezone.utc)
+
+ZONES = ['Europe/Warsaw', 'America/New_York', 'Australia/Lord_Howe', 'America/St_Johns', 'Pacific/Apia', 'Asia/Kolkata']
+
+
+def _epoch_nanoseconds(value: py_datetime.datetime, /) -> int:
+	delta = value - _EPOCH
+	return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
+
+
+def _expected(value: py_datetime.datetime, zone: py_zoneinfo.ZoneInfo, disambiguation: str, /) -> tuple[int, str | None]:
+	# In a gap zoneinfo applies the offset before it for fold = 0 and the one
+	# after it for fold = 1; in an overlap fold = 0 is the earlier instant.
+	earlier, later = (_epoch_nanoseconds(value.replace(tzinfo = zone, fold = fold)) for fold in (0, 1))
+	if earlier == later:
+		return earlier, None
+	exists = value.replace(tzinfo = zone).astimezone(py_datetime.timezone.utc).astimezone(zone).replace(tzinfo = None) == value
+	if exists:
+		return (later if disambiguation == 'later' else earlier), 'overlap'
+	return (later if disambiguation == 'earlier' else earlier), 'gap'
+
+
+def _wall_times_near_transitions(zone: py_zoneinfo.ZoneInfo, random: Random, /) -> list[py_datetime.datetime]:
+	time_zone = TimeZone(zone.key)
+	values = []
+	transition = time_zone.get_next_transition('1900-01-01T00:00Z')
+	while transition is not None and len(values) < 800:
+		utc = _EPOCH + py_datetime.timedelta(microseconds = transition.epoch_nanoseconds // 1000)
+		wall = utc.astimezone(zone).replace(tzinfo = None)
+		for _ in range(8):
+			values.append(wall + py_datetime.timedelta(minutes = random.randrange(-150, 150)))
+		transition = time_zone.get_next_transition(transition)
+	return values
+
+
+def _plain_date_time(value: py_datetime.datetime, /) -> PlainDateTime:
+	return PlainDateTime(value.year, value.month, value.day, value.hour, value.minute, value.second)
+
+
+@pytest.mark.parametrize('key', ZONES)
+@pytest.mark.parametrize('disambiguation', ['compatible', 'earlier', 'later'])
+def test_get_instant_for_matches_zoneinfo(key: str, disambiguation: str):
+	zone = py_zoneinfo.ZoneInfo(key)
+	time_zone = TimeZone(key)
+	for value in _wall_times_near_transitions(zone, Random(key)):
+		expected, _ = _expected(value, zone, disambiguation)
+		assert time_zone.get_instant_for(_plain_date_time(value), disambiguation = disambiguation).epoch_nanoseconds == expected, value
+
+
+@pytest.mark.parametrize('key', ZONES)
+def test_reject(key: str):
+	zone = py_zoneinfo.ZoneInfo(key)
+	time_zone = TimeZone(key)
+	for value in _wall_times_near_transitions(zone, Random(key))[:200]:
+		expected, kind = _expected(value, zone, 'compatible')
+		if kind is None:
+			assert time_zone.get_instant_for(_plain_date_time(value), disambiguation = 'reject').epoch_nanoseconds == expected
+		else:
+			with pytest.raises(ValueError, match = 'ambiguous' if kind == 'overlap' else 'nonexistent'):
+				time_zone.get_instant_for(_plain_date_time(value), disambiguation = 'reject')
+
+
+def test_get_possible_instants_for():
+	time_zone = TimeZone('Europe/Warsaw')
+	assert time_zone.get_possible_instants_for('2024-03-31T02:30') == []
+	assert [str(instant) for instant in time_zone.get_possible_instants_for('2024-10-27T02:30')] == ['2024-10-27T00:30:00Z', '2024-10-27T01:30:00Z']
+	assert [str(instant) for instant in time_zone.get_possible_instants_for('2024-06-01T12:00')] == ['2024-06-01T10:00:00Z']
+
+
+@pytest.mark.parametrize('key', ZONES)
+@pytest.mark.parametrize('disambiguation', ['compatible', 'earlier', 'later'])
+def test_get_instants_for_matches_zoneinfo(key: str, disambiguation: str):
+	zone = py_zoneinfo.ZoneInfo(key)
+	values = _wall_times_near_transitions(zone, Random(key))
+	# long unambiguous stretches between the transitions exercise the fast path
+	values.sort()
+	expected = [_expected(value, zone, disambiguation) for value in values]
+	date_times = [_plain_date_time(value) for value in values]
+	time_zone = TimeZone(key)
+	for packed in (date_times, array('q', [date_time._wall_nanoseconds for date_time in date_times]), PlainDateTime.to_bytes_many(date_times)):
+		resolved = time_zone.get_instants_for(packed, disambiguation = disambiguation)
+		assert list(resolved.instants.epoch_nanoseconds) == [epoch_nanoseconds for epoch_nanoseconds, _ in expected]
+		assert list(resolved.gaps) == [index for index, (_, kind) in enumerate(expected) if kind == 'gap']
+		assert list(resolved.overlaps) == [index for index, (_, kind) in enumerate(expected) if kind == 'overlap']
+
+
+def test_get_instants_for_reject():
+	time_zone = TimeZone('Europe/Warsaw')
+	with pytest.raises(ValueError, match = 'row 1: nonexistent'):
+		time_zone.get_instants_for(['2024-03-31T01:30', '2024-03-31T02:30'], disambiguation = 'reject')
+	with pytest.raises(ValueError, match = 'invalid disambiguation'):
+		time_zone.get_instants_for([], disambiguation = 'first')  # type: ignore
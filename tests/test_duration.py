@@ -0,0 +1,158 @@
+import datetime as py_datetime
+import math
+from fractions import Fraction
+from random import Random
+
+import pytest
+
+from temporal import Duration
+from temporal._parser import parse_duration
+
+_UNIT_NANOSECONDS = {'day': 86400000000000, 'hour': 3600000000000, 'minute': 60000000000, 'second': 1000000000, 'millisecond': 1000000, 'microsecond': 1000, 'nanosecond': 1}
+
+
+def _random_durations(seed: str, /) -> list[Duration]:
+	random = Random(seed)
+	durations = []
+	for _ in range(300):
+		sign = random.choice((-1, 1))
+		fields = [random.randrange(0, limit) * sign for limit in (100000, 1000, 1000, 1000, 1000, 1000, 1000)]
+		durations.append(Duration(0, 0, 0, *fields))
+	return durations
+
+
+def _nanoseconds(duration: Duration, /) -> int:
+	return (((duration.days * 24 + duration.hours) * 60 + duration.minutes) * 60 + duration.seconds) * 1000000000 + duration.milliseconds * 1000000 + duration.microseconds * 1000 + duration.nanoseconds
+
+
+def test_fields():
+	duration = Duration(1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+	assert (duration.years, duration.months, duration.weeks, duration.days) == (1, 2, 3, 4)
+	assert (duration.hours, duration.minutes, duration.seconds) == (5, 6, 7)
+	assert (duration.milliseconds, duration.microseconds, duration.nanoseconds) == (8, 9, 10)
+	assert str(duration) == 'P1Y2M3W4DT5H6M7.00800901S'
+	assert Duration.from_(str(duration)) == duration
+
+
+@pytest.mark.parametrize('fields, message', [
+	((1, 0, 0, 0, -1), 'mixed signs'),
+	((2**32, ), 'out of range'),
+	((0, 0, 0, 0, 0, 0, 2**53), 'out of range'),
+])
+def test_invalid(fields: tuple[int, ...], message: str):
+	with pytest.raises(ValueError, match = message):
+		Duration(*fields)
+	with pytest.raises(TypeError):
+		Duration(1.5)  # type: ignore
+
+
+def test_sign_blank_negated_abs():
+	for duration in _random_durations('sign'):
+		nanoseconds = _nanoseconds(duration)
+		assert duration.sign == (nanoseconds > 0) - (nanoseconds < 0)
+		assert duration.blank == (nanoseconds == 0)
+		assert _nanoseconds(duration.negated()) == -nanoseconds
+		assert duration.negated().negated() == duration
+		assert _nanoseconds(duration.abs()) == abs(nanoseconds)
+		assert duration.abs().sign >= 0
+	assert Duration().blank and Duration().sign == 0
+	assert Duration.from_('-P1Y').negated() == Duration(1)
+
+
+@pytest.mark.parametrize('unit', ['day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'])
+def test_total_matches_fraction(unit: str):
+	for duration in _random_durations(unit):
+		assert duration.total(unit) == float(Fraction(_nanoseconds(duration), _UNIT_NANOSECONDS[unit]))  # type: ignore
+
+
+def test_total_matches_timedelta():
+	random = Random(0)
+	for _ in range(300):
+		value = py_datetime.timedelta(microseconds = random.randrange(-10 ** 15, 10 ** 15))
+		microseconds = value // py_datetime.timedelta(microseconds = 1)
+		sign = -1 if microseconds < 0 else 1
+		seconds, microseconds = divmod(abs(microseconds), 1000000)
+		duration = Duration(0, 0, 0, 0, 0, 0, seconds * sign, 0, microseconds * sign)
+		assert duration.total('second') == value.total_seconds()
+
+
+@pytest.mark.parametrize('largest_unit', ['day', 'hour', 'minute', 'second', 'millisecond', 'microsecond', 'nanosecond'])
+def test_balancing(largest_unit: str):
+	sizes = [('day', 86400000000000), ('hour', 3600000000000), ('minute', 60000000000), ('second', 1000000000), ('millisecond', 1000000), ('microsecond', 1000), ('nanosecond', 1)]
+	names = [name for name, _ in sizes]
+	for duration in _random_durations(largest_unit):
+		balanced = duration.round(largest_unit = largest_unit)  # type: ignore
+		nanoseconds = _nanoseconds(duration)
+		assert _nanoseconds(balanced) == nanoseconds
+		remainder = abs(nanoseconds)
+		expected = []
+		for name, size in sizes:
+			if names.index(name) < names.index(largest_unit):
+				expected.append(0)
+				continue
+			value, remainder = divmod(remainder, size)
+			expected.append(value if nanoseconds >= 0 else -value)
+		assert [balanced.days, balanced.hours, balanced.minutes, balanced.seconds, balanced.milliseconds, balanced.microseconds, balanced.nanoseconds] == expected
+
+
+@pytest.mark.parametrize('smallest_unit, increment', [('day', 1), ('hour', 6), ('minute', 15), ('second', 30), ('millisecond', 1), ('nanosecond', 10)])
+@pytest.mark.parametrize('rounding_mode', ['ceil', 'floor', 'trunc', 'halfExpand', 'halfEven'])
+def test_round(smallest_unit: str, increment: int, rounding_mode: str):
+	step = _UNIT_NANOSECONDS[smallest_unit] * increment
+	for duration in _random_durations(f'{smallest_unit}{rounding_mode}'):
+		exact = Fraction(_nanoseconds(duration), step)
+		expected = {
+			'ceil': math.ceil(exact),
+			'floor': math.floor(exact),
+			'trunc': math.trunc(exact),
+			'halfExpand': math.floor(abs(exact) + Fraction(1, 2)) * (1 if exact >= 0 else -1),
+			'halfEven': round(exact),
+		}[rounding_mode] * step
+		rounded = duration.round(smallest_unit, rounding_increment = increment, rounding_mode = rounding_mode)  # type: ignore
+		assert _nanoseconds(rounded) == expected
+
+
+def test_round_options():
+	assert str(Duration.from_('PT1H30M').round(largest_unit = 'minute')) == 'PT90M'
+	assert str(Duration.from_('PT90M').round(largest_unit = 'auto')) == 'PT90M'
+	assert str(Duration.from_('PT90M').round('hour')) == 'PT2H'
+	with pytest.raises(ValueError, match = 'at least one'):
+		Duration.from_('PT1H').round()
+	with pytest.raises(ValueError, match = 'without a starting point'):
+		Duration.from_('P1M').round('day')
+	with pytest.raises(ValueError, match = 'smaller than smallest unit'):
+		Duration.from_('PT1H').round('hour', largest_unit = 'minute')
+
+
+def test_add_subtract_and_compare():
+	for one, two in zip(_random_durations('add'), _random_durations('subtract')):
+		assert _nanoseconds(one.add(two)) == _nanoseconds(one) + _nanoseconds(two)
+		assert _nanoseconds(one.subtract(two)) == _nanoseconds(one) - _nanoseconds(two)
+		difference = _nanoseconds(one) - _nanoseconds(two)
+		assert Duration.compare(one, two) == (difference > 0) - (difference < 0)
+	assert str(Duration.from_('PT1H').add('PT59M60S')) == 'PT2H'
+	with pytest.raises(ValueError, match = 'without a starting point'):
+		Duration.from_('P1W').add('P1D')
+
+
+def test_to_string():
+	assert Duration.from_('PT1.987654321S').to_string(smallest_unit = 'millisecond') == 'PT1.987S'
+	assert Duration.from_('PT59.9999S').to_string(fractional_second_digits = 2, rounding_mode = 'halfExpand') == 'PT60.00S'
+	assert Duration.from_('-P1DT0.5S').to_string(fractional_second_digits = 0) == '-P1DT0S'
+	assert str(Duration()) == 'PT0S'
+
+
+@pytest.mark.parametrize('text, fields', [
+	('P1Y2M3W4DT5H6M7.008009010S', (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)),
+	('-PT1.5H', (0, 0, 0, 0, -1, -30, 0, 0, 0, 0)),
+	('PT0.000000001S', (0, 0, 0, 0, 0, 0, 0, 0, 0, 1)),
+	('P1D', (0, 0, 0, 1, 0, 0, 0, 0, 0, 0)),
+])
+def test_parse(text: str, fields: tuple[int, ...]):
+	assert parse_duration(text) == fields
+
+
+@pytest.mark.parametrize('text', ['P', 'PT', 'P1.5D', 'PT1.5H30M', 'PT1H.5M', '1D'])
+def test_parse_invalid(text: str):
+	with pytest.raises(ValueError):
+		parse_duration(text)
@@ -0,0 +1,135 @@
+import datetime as py_datetime
+import zoneinfo as py_zoneinfo
+from random import Random
+
+import pytest
+
+from temporal import Duration, Instant, PlainTime, TimeZone, ZonedDateTime
+from temporal._formatter import DEFAULT_PLAN, format_date, format_offset, format_offset_rounded, format_plan
+
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.timezone.utc)
+_MODES = ['ceil', 'floor', 'expand', 'trunc', 'halfCeil', 'halfFloor', 'halfExpand', 'halfTrunc', 'halfEven']
+_OPTIONS = [
+	*({'fractional_second_digits': digits} for digits in ('auto', 0, 1, 2, 3, 4, 5, 6, 7, 8, 9)),
+	*({'smallest_unit': unit} for unit in ('minute', 'second', 'millisecond', 'microsecond', 'nanosecond')),
+]
+
+
+def _round(value: int, increment: int, mode: str, /) -> int:
+	# points in time round as if positive: towards the past is floor
+	quotient, remainder = divmod(value, increment)
+	up = {
+		'ceil': remainder > 0,
+		'expand': remainder > 0,
+		'floor': False,
+		'trunc': False,
+		'halfCeil': 2 * remainder >= increment,
+		'halfExpand': 2 * remainder >= increment,
+		'halfFloor': 2 * remainder > increment,
+		'halfTrunc': 2 * remainder > increment,
+		'halfEven': 2 * remainder > increment or 2 * remainder == increment and quotient % 2 == 1,
+	}[mode]
+	return (quotient + up) * increment
+
+
+def _expected(epoch_nanoseconds: int, options: dict, mode: str, zone: py_datetime.tzinfo, /) -> str:  # type: ignore
+	unit = options.get('smallest_unit')
+	digits = {'minute': -1, 'second': 0, 'millisecond': 3, 'microsecond': 6, 'nanosecond': 9}[unit] if unit else options['fractional_second_digits']
+	increment = 60000000000 if digits == -1 else 1 if digits == 'auto' else 10 ** (9 - digits)
+	rounded = _round(epoch_nanoseconds, increment, mode)
+	seconds, nanoseconds = divmod(rounded, 1000000000)
+	value = (_EPOCH + py_datetime.timedelta(seconds = seconds)).astimezone(zone)
+	text = value.replace(tzinfo = None).isoformat(timespec = 'minutes' if digits == -1 else 'seconds')
+	if digits == 'auto':
+		text += f'.{nanoseconds:09}'.rstrip('0').rstrip('.')
+	elif digits > 0:
+		text += f'.{nanoseconds:09}'[:digits + 1]
+	return text
+
+
+def _samples() -> list[int]:
+	random = Random(0)
+	return [0, -1, 999999999, 1711846799999999999, 1711846800000000000] + [random.randrange(-2 * 10**18, 4 * 10**18) for _ in range(60)]
+
+
+@pytest.mark.parametrize('options', _OPTIONS, ids = str)
+@pytest.mark.parametrize('mode', _MODES)
+def test_instant_to_string(options: dict, mode: str):  # type: ignore
+	for value in _samples():
+		assert Instant(value).to_string(rounding_mode = mode, **options) == _expected(value, options, mode, py_datetime.timezone.utc) + 'Z'  # type: ignore
+
+
+@pytest.mark.parametrize('options', _OPTIONS, ids = str)
+def test_zoned_to_string(options: dict):  # type: ignore
+	zone = py_zoneinfo.ZoneInfo('Europe/Warsaw')
+	for value in _samples():
+		text = ZonedDateTime(value, TimeZone('Europe/Warsaw')).to_string(rounding_mode = 'halfExpand', **options)
+		assert text.startswith(_expected(value, options, 'halfExpand', zone))
+		assert text.endswith('[Europe/Warsaw]')
+		assert Instant(value).to_string(time_zone = 'Europe/Warsaw', rounding_mode = 'halfExpand', **options) == text[:-len('[Europe/Warsaw]')]
+
+
+@pytest.mark.parametrize('options', _OPTIONS, ids = str)
+def test_plain_time_to_string(options: dict):  # type: ignore
+	for value in _samples():
+		nanoseconds = value % 86400000000000
+		seconds, nanosecond = divmod(nanoseconds, 1000000000)
+		plain_time = PlainTime(seconds // 3600, seconds // 60 % 60, seconds % 60, nanosecond // 1000000, nanosecond // 1000 % 1000, nanosecond % 1000)
+		expected = _expected(nanoseconds, options, 'ceil', py_datetime.timezone.utc)
+		# rounding past midnight wraps around
+		assert plain_time.to_string(rounding_mode = 'ceil', **options) == expected.split('T')[1]
+
+
+def test_defaults():
+	assert str(Instant(1)) == Instant(1).to_string() == '1970-01-01T00:00:00.000000001Z'
+	assert Instant(-1).to_string(smallest_unit = 'second') == '1969-12-31T23:59:59Z'
+	assert Instant(-1).to_string(smallest_unit = 'second', rounding_mode = 'halfEven') == '1970-01-01T00:00:00Z'
+	assert PlainTime(23, 59, 59, 999).to_string(smallest_unit = 'second', rounding_mode = 'halfExpand') == '00:00:00'
+
+
+@pytest.mark.parametrize('options, message', [
+	({'fractional_second_digits': 10}, 'invalid fractional second digits'),
+	({'fractional_second_digits': -1}, 'invalid fractional second digits'),
+	({'fractional_second_digits': '3'}, 'invalid fractional second digits'),
+	({'smallest_unit': 'hour'}, 'invalid smallest unit'),
+	({'rounding_mode': 'nearest'}, 'invalid rounding mode'),
+])
+def test_invalid_options(options: dict, message: str):  # type: ignore
+	with pytest.raises(ValueError, match = message):
+		Instant(0).to_string(**options)
+	with pytest.raises(ValueError, match = message):
+		PlainTime(0).to_string(**options)
+
+
+@pytest.mark.parametrize('digits', [True, False, 1.0, 3.0, 0.0])
+def test_digits_that_equal_an_int_are_rejected(digits: object):
+	# the plans for 0, 1 and 3 are cached first, and must not be found for these
+	for cached in (0, 1, 3):
+		format_plan(cached, None, 'trunc')
+	with pytest.raises(ValueError, match = 'invalid fractional second digits'):
+		format_plan(digits, None, 'trunc')  # type: ignore
+	with pytest.raises(ValueError, match = 'invalid fractional second digits'):
+		Instant(0).to_string(fractional_second_digits = digits)  # type: ignore
+	with pytest.raises(ValueError, match = 'invalid fractional second digits'):
+		Duration.from_('PT1S').to_string(fractional_second_digits = digits)  # type: ignore
+
+
+def test_plans_are_reused():
+	assert format_plan() is DEFAULT_PLAN
+	for mode in _MODES:
+		for digits in ('auto', 0, 3, 9):
+			assert format_plan(digits, None, mode) is format_plan(digits, None, mode)  # type: ignore
+	# smallest_unit takes precedence over the digits, so these plans agree
+	assert format_plan(4, 'millisecond', 'floor').increment == format_plan(3, None, 'floor').increment == 1000000
+	assert format_plan('auto', None, 'trunc').increment == 1
+
+
+def test_date_and_offset_helpers():
+	assert format_date(2024, 1, 2) == '2024-01-02'
+	assert format_date(-1, 12, 31) == '-000001-12-31'
+	assert format_date(10000, 1, 1) == '+010000-01-01'
+	assert format_offset(0) == '+00:00'
+	assert format_offset(-(5 * 3600 + 30 * 60) * 1000000000) == '-05:30'
+	assert format_offset(1234567890123) == '+00:20:34.567890123'
+	assert format_offset_rounded(1234567890123) == '+00:21'
+	assert format_offset_rounded(-30 * 1000000000) == '-00:01'
@@ -0,0 +1,71 @@
+import copy
+import pickle
+
+import pytest
+
+from temporal import Duration, Instant, PlainDate, PlainDateTime, PlainTime, TimeZone, ZonedDateTime
+
+_VALUES = [
+	Instant(1711846800123456789),
+	PlainDate(2024, 2, 29),
+	PlainTime(23, 59, 59, 999, 999, 999),
+	PlainDateTime(2024, 3, 31, 2, 30, 0, 0, 0, 1),
+	ZonedDateTime(1711846800123456789, TimeZone('Europe/Warsaw')),
+	Duration(1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+]
+
+
+def _subclass(cls: type, /) -> type:
+	return type(f'My{cls.__name__}', (cls, ), {'__slots__': ()})
+
+
+@pytest.mark.parametrize('value', _VALUES, ids = lambda value: type(value).__name__)
+def test_exact_types_are_returned_unchanged(value):  # type: ignore
+	cls = type(value)
+	assert cls.from_(value) is value
+	assert copy.copy(value) is value
+	assert copy.deepcopy(value) is value
+	assert copy.deepcopy([value, value])[0] is value
+	assert cls.from_(str(value)) == value
+
+
+@pytest.mark.parametrize('value', _VALUES, ids = lambda value: type(value).__name__)
+def test_subclasses_are_converted(value):  # type: ignore
+	cls = type(value)
+	subclass = _subclass(cls)
+	converted = subclass.from_(value)
+	assert converted is not value and type(converted) is subclass
+	assert str(converted) == str(value)
+	assert subclass.from_(converted) is converted
+	back = cls.from_(converted)
+	assert back is not converted and type(back) is cls
+	assert back == value
+	assert type(copy.copy(converted)) is subclass and str(copy.deepcopy(converted)) == str(value)
+
+
+@pytest.mark.parametrize('value', _VALUES, ids = lambda value: type(value).__name__)
+def test_pickle_round_trip(value):  # type: ignore
+	for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+		loaded = pickle.loads(pickle.dumps(value, protocol))
+		assert type(loaded) is type(value) and loaded == value
+
+
+def test_conversions_between_types():
+	zoned_date_time = _VALUES[4]
+	assert Instant.from_(zoned_date_time) == Instant(zoned_date_time.epoch_nanoseconds)
+	assert type(Instant.from_(zoned_date_time)) is Instant
+	assert PlainDateTime.from_(zoned_date_time) == PlainDateTime(2024, 3, 31, 3, 0, 0, 123, 456, 789)
+	assert PlainDate.from_(PlainDateTime(2024, 3, 31, 2, 30)) == PlainDate(2024, 3, 31)
+	assert PlainTime.from_(PlainDateTime(2024, 3, 31, 2, 30)) == PlainTime(2, 30)
+
+
+def test_time_zones_are_shared():
+	zoned_date_time = _VALUES[4]
+	time_zone = TimeZone('Europe/Warsaw')
+	assert TimeZone.from_(time_zone) is time_zone
+	assert TimeZone.from_(zoned_date_time) is zoned_date_time._time_zone
+	assert copy.copy(time_zone) is time_zone and copy.deepcopy(time_zone) is time_zone
+	# the zone is pickled as its identifier, not as zoneinfo data
+	data = pickle.dumps(zoned_date_time)
+	assert b'Europe/Warsaw' in data and b'zoneinfo' not in data
+	assert pickle.loads(data).time_zone_id == 'Europe/Warsaw'
@@ -0,0 +1,86 @@
+import copy
+import datetime as py_datetime
+import pickle
+from dataclasses import FrozenInstanceError
+from random import Random
+
+import pytest
+
+from temporal import Instant
+
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.timezone.utc)
+_MAX_EPOCH_NANOSECONDS = 86400 * 10**8 * 10**9
+
+
+def _samples() -> list[int]:
+	random = Random(0)
+	return [0, 1, -1, 999, -999, 1000, -1001, _MAX_EPOCH_NANOSECONDS, -_MAX_EPOCH_NANOSECONDS] + [random.randrange(-2**62, 2**62) for _ in range(500)]
+
+
+def test_epoch_units_are_exact():
+	for value in _samples():
+		instant = Instant(value)
+		assert instant.epoch_nanoseconds == value
+		assert instant.epoch_microseconds == value // 1000
+		assert instant.epoch_milliseconds == value // 1000000
+		assert instant.epoch_seconds == value // 1000000000
+		assert Instant.from_epoch_nanoseconds(value) == instant
+		assert Instant.from_epoch_microseconds(value // 1000).epoch_nanoseconds == value // 1000 * 1000
+
+
+def test_from_epoch_units_do_not_go_through_floats():
+	# none of these products fits in the 53 bits of a float
+	assert Instant.from_epoch_seconds(-8639999999999).epoch_nanoseconds == -8639999999999 * 10**9
+	assert Instant.from_epoch_milliseconds(8639999999999 * 10**3 + 1).epoch_nanoseconds == (8639999999999 * 10**3 + 1) * 10**6
+	assert Instant.from_epoch_microseconds(-(2**53 + 1)).epoch_nanoseconds == -(2**53 + 1) * 10**3
+	assert Instant.from_epoch_nanoseconds(2**53 + 1).epoch_nanoseconds == 2**53 + 1
+
+
+def test_py_datetimeutc_matches_datetime():
+	random = Random(1)
+	for _ in range(500):
+		value = py_datetime.datetime(1, 1, 1, tzinfo = py_datetime.timezone.utc) + py_datetime.timedelta(microseconds = random.randrange(3652058 * 86400 * 10**6))
+		instant = Instant(py_datetimeutc = value)
+		assert instant.py_datetimeutc == value
+		assert Instant.from_py_datetimeutc(value) == instant
+		assert instant.epoch_nanoseconds == (value - _EPOCH) // py_datetime.timedelta(microseconds = 1) * 1000
+	# the nanoseconds below a microsecond are dropped, rounding towards the past
+	assert Instant(-1).py_datetimeutc == _EPOCH - py_datetime.timedelta(microseconds = 1)
+
+
+def test_range():
+	with pytest.raises(ValueError, match = 'out of range'):
+		Instant(_MAX_EPOCH_NANOSECONDS + 1)
+	with pytest.raises(ValueError, match = 'out of range'):
+		Instant(-_MAX_EPOCH_NANOSECONDS - 1)
+	with pytest.raises(TypeError):
+		Instant()
+
+
+def test_frozen():
+	instant = Instant(1)
+	with pytest.raises(FrozenInstanceError):
+		instant._epoch_nanoseconds = 2  # type: ignore
+	with pytest.raises(FrozenInstanceError):
+		del instant._epoch_nanoseconds  # type: ignore
+	with pytest.raises(FrozenInstanceError):
+		instant.foo = 1  # type: ignore
+	assert not hasattr(instant, '__dict__')
+	assert instant.epoch_nanoseconds == 1
+
+
+def test_equality_and_hash():
+	assert Instant(5) == Instant(5) and Instant(5) != Instant(6)
+	assert len({Instant(5), Instant(5), Instant(6)}) == 2
+	assert sorted([Instant(3), Instant(-1), Instant(2)]) == [Instant(-1), Instant(2), Instant(3)]
+
+
+def test_pickle_and_copy_round_trip():
+	for value in _samples()[:50]:
+		instant = Instant(value)
+		for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+			assert pickle.loads(pickle.dumps(instant, protocol)) == instant
+		assert copy.copy(instant) == instant
+		assert copy.deepcopy(instant) == instant
+	# a single int, not a datetime
+	assert Instant(1).__reduce__() == (Instant, (1, ))
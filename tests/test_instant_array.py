@@ -0,0 +1,147 @@
+import datetime as py_datetime
+import zoneinfo as py_zoneinfo
+from array import array
+from random import Random
+
+import pytest
+
+from temporal import Instant, InstantArray
+
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.UTC)
+_SAMPLES = [-2208988800123456789, -1, 0, 1, 1711846799999999999, 1711846800000000000, 1729990800000000001, 4102444800000000000]
+
+
+def test_elements_match_instants():
+	instants = InstantArray.from_epoch_nanoseconds(_SAMPLES)
+	assert list(instants) == [Instant(value) for value in _SAMPLES]
+	assert InstantArray([str(instant) for instant in instants]) == instants
+	assert InstantArray.from_iter(map(str, instants)) == instants
+	assert InstantArray.from_bytes(instants.to_bytes()) == instants
+	assert list(InstantArray.from_epoch_seconds([value // 10**9 for value in _SAMPLES]).epoch_seconds) == [value // 10**9 for value in _SAMPLES]
+	assert instants.min() == Instant(min(_SAMPLES)) and instants.max() == Instant(max(_SAMPLES))
+
+
+def test_iso_fields_match_zoneinfo():
+	instants = InstantArray.from_epoch_nanoseconds(_SAMPLES)
+	zone = py_zoneinfo.ZoneInfo('Europe/Warsaw')
+	columns = instants.get_iso_fields('Europe/Warsaw')
+	for index, value in enumerate(_SAMPLES):
+		expected = (_EPOCH + py_datetime.timedelta(microseconds = value // 1000)).astimezone(zone)
+		assert (columns['iso_year'][index], columns['iso_month'][index], columns['iso_day'][index]) == (expected.year, expected.month, expected.day)
+		assert (columns['iso_hour'][index], columns['iso_minute'][index], columns['iso_second'][index]) == (expected.hour, expected.minute, expected.second)
+		assert columns['iso_microsecond'][index] == expected.microsecond % 1000 and columns['iso_nanosecond'][index] == value % 1000
+		assert columns['offset_nanoseconds'][index] == expected.utcoffset() // py_datetime.timedelta(microseconds = 1) * 1000
+		assert (columns['day_of_week'][index], columns['week_of_year'][index]) == expected.isocalendar()[2:0:-1]
+
+
+def test_arithmetic_matches_instants():
+	instants = InstantArray.from_epoch_nanoseconds(_SAMPLES)
+	other = Instant.from_('2000-01-01T00:00Z')
+	assert list(instants.add('PT1H30M')) == [Instant(value).add('PT1H30M') for value in _SAMPLES]
+	assert list(instants.until(other, largest_unit = 'hour', smallest_unit = 'second', rounding_mode = 'halfExpand')) == [Instant(value).until(other, largest_unit = 'hour', smallest_unit = 'second', rounding_mode = 'halfExpand') for value in _SAMPLES]
+	for mode in ('floor', 'ceil', 'trunc', 'expand', 'halfExpand', 'halfEven'):
+		assert list(instants.round('minute', rounding_increment = 15, rounding_mode = mode)) == [Instant(value).round('minute', rounding_increment = 15, rounding_mode = mode) for value in _SAMPLES]  # type: ignore
+	assert list(instants.compare(other)) == [(value > 946684800000000000) - (value < 946684800000000000) for value in _SAMPLES]
+
+
+@pytest.mark.parametrize('build, message', [
+	(lambda: InstantArray.from_epoch_seconds([1, 10**12]), 'epoch seconds out of range for InstantArray: 1000000000000'),
+	(lambda: InstantArray.from_epoch_milliseconds(iter([-10**17])), 'epoch milliseconds out of range for InstantArray: -100000000000000000'),
+	(lambda: InstantArray.from_epoch_nanoseconds([0, 2**63]), 'epoch nanoseconds out of range for InstantArray: 9223372036854775808'),
+	(lambda: InstantArray.from_epoch_nanoseconds(array('Q', [2**63])), 'epoch nanoseconds out of range for InstantArray: 9223372036854775808'),
+	(lambda: InstantArray(['+275000-01-01T00:00Z']), 'epoch nanoseconds out of range for InstantArray: 8615994624000000000000'),
+	(lambda: InstantArray.from_epoch_nanoseconds([2**63 - 1]).add('PT1S'), 'out of range for InstantArray'),
+])
+def test_out_of_range(build, message):  # type: ignore
+	with pytest.raises(ValueError, match = message):
+		build()
+
+
+def _random_instants(seed: str, /) -> InstantArray:
+	random = Random(seed)
+	return InstantArray.from_epoch_nanoseconds([random.randrange(-2**62, 2**62) for _ in range(300)])
+
+
+def test_add_subtract_match_instants():
+	instants = _random_instants('add')
+	for duration in ('PT0S', 'PT1H30M', '-PT0.000000001S', 'PT12345678.987654321S'):
+		assert list(instants.add(duration)) == [instant.add(duration) for instant in instants]
+		assert list(instants.subtract(duration)) == [instant.subtract(duration) for instant in instants]
+	with pytest.raises(ValueError):
+		instants.add('P1D')
+
+
+@pytest.mark.parametrize('largest_unit, smallest_unit, increment, mode', [
+	('auto', 'nanosecond', 1, 'trunc'),
+	('hour', 'second', 30, 'halfExpand'),
+	('minute', 'millisecond', 5, 'floor'),
+	('second', 'microsecond', 250, 'ceil'),
+	('nanosecond', 'nanosecond', 1, 'halfEven'),
+])
+def test_until_since_match_instants(largest_unit: str, smallest_unit: str, increment: int, mode: str):
+	options = {'largest_unit': largest_unit, 'smallest_unit': smallest_unit, 'rounding_increment': increment, 'rounding_mode': mode}
+	one = _random_instants('one')
+	two = _random_instants('two')
+	assert list(one.until(two, **options)) == [a.until(b, **options) for a, b in zip(one, two)]
+	assert list(one.since(two, **options)) == [a.since(b, **options) for a, b in zip(one, two)]
+	assert list(one.until(two[0], **options)) == [a.until(two[0], **options) for a in one]
+	assert list(one.since(str(two[0]), **options)) == [a.since(two[0], **options) for a in one]
+
+
+def test_compare_matches_instants():
+	one = _random_instants('compare')
+	two = InstantArray([*one[:100], *_random_instants('other')[100:]])
+	assert list(one.compare(two)) == [(a > b) - (a < b) for a, b in zip(one, two)]
+	assert list(one.compare(one[7])) == [(a > one[7]) - (a < one[7]) for a in one]
+	assert list(one.compare(str(one[7]))) == list(one.compare(one[7]))
+
+
+@pytest.mark.parametrize('operation', [
+	lambda instants: instants.compare(instants[1:]),
+	lambda instants: instants.until(instants[1:]),
+	lambda instants: instants.since(instants[:-1]),
+])
+def test_length_mismatch(operation):  # type: ignore
+	with pytest.raises(ValueError, match = 'length mismatch: 300 != 299'):
+		operation(_random_instants('mismatch'))
+
+
+@pytest.mark.parametrize('smallest_unit, increment', [('hour', 3), ('minute', 1), ('second', 10), ('millisecond', 1), ('microsecond', 500), ('nanosecond', 1)])
+@pytest.mark.parametrize('mode', ['floor', 'ceil', 'trunc', 'expand', 'halfExpand', 'halfTrunc', 'halfEven'])
+def test_round_matches_instants(smallest_unit: str, increment: int, mode: str):
+	instants = _random_instants(f'{smallest_unit}{mode}')
+	rounded = instants.round(smallest_unit, rounding_increment = increment, rounding_mode = mode)  # type: ignore
+	assert list(rounded) == [instant.round(smallest_unit, rounding_increment = increment, rounding_mode = mode) for instant in instants]  # type: ignore
+
+
+@pytest.mark.parametrize('operation, message', [
+	(lambda: InstantArray.from_epoch_nanoseconds([2**63 - 1]).round('hour'), 'result out of range for InstantArray'),
+	(lambda: InstantArray.from_epoch_nanoseconds([-2**63]).round('second', rounding_mode = 'floor'), 'result out of range for InstantArray'),
+	(lambda: InstantArray.from_epoch_nanoseconds([-2**63]).until(Instant(2**63 - 1)), 'difference out of range for DurationArray'),
+	(lambda: InstantArray.from_epoch_nanoseconds([2**63 - 1]).since(InstantArray.from_epoch_nanoseconds([-1])), 'difference out of range for DurationArray'),
+	(lambda: InstantArray.from_epoch_nanoseconds([-2**63]).subtract('PT0.000000001S'), 'out of range for InstantArray'),
+])
+def test_overflow_is_value_error(operation, message: str):  # type: ignore
+	with pytest.raises(ValueError, match = message):
+		operation()
+
+
+def test_bytes_round_trip():
+	instants = InstantArray([*_random_instants('bytes'), Instant(2**63 - 1), Instant(-2**63)])
+	data = instants.to_bytes()
+	assert len(data) == 8 * len(instants)
+	assert InstantArray.from_bytes(data) == instants
+	assert InstantArray.from_bytes(bytearray(data)) == instants
+	assert list(InstantArray.from_bytes(data[8:16])) == [instants[1]]
+
+
+def test_from_epoch_nanoseconds_buffers():
+	instants = InstantArray([*_random_instants('buffers'), Instant(2**63 - 1), Instant(-2**63)])
+	values = [instant.epoch_nanoseconds for instant in instants]
+	assert InstantArray.from_epoch_nanoseconds(instants.epoch_nanoseconds) == instants
+	assert InstantArray.from_epoch_nanoseconds(memoryview(array('q', values))) == instants
+	assert InstantArray.from_epoch_nanoseconds(memoryview(array('i', [1, -2]))) == InstantArray([Instant(1), Instant(-2)])
+	# raw bytes are the little-endian encoding, whatever the native byte order
+	for data in (instants.to_bytes(), bytearray(instants.to_bytes()), memoryview(instants.to_bytes())):
+		with pytest.raises(TypeError, match = 'from_bytes'):
+			InstantArray.from_epoch_nanoseconds(data)
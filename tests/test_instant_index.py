@@ -0,0 +1,137 @@
+from random import Random
+
+import pytest
+
+from temporal import Instant, InstantArray, InstantIndex, TimeZone, ZonedDateTime
+
+
+def _random_entries(seed: str, /, count: int = 300) -> list[tuple[int, int]]:
+	# few distinct values, so that most instants are duplicates
+	random = Random(seed)
+	return [(random.randrange(-50, 50) * 1000000000, row_id) for row_id in random.sample(range(10 * count), count)]
+
+
+def _index(entries: list[tuple[int, int]], /) -> InstantIndex:
+	return InstantIndex([Instant(value) for value, _ in entries], row_ids = [row_id for _, row_id in entries])
+
+
+def _scan(entries: list[tuple[int, int]], /) -> list[tuple[int, int]]:
+	# what the index should hold: sorted by instant, equal instants in input order
+	return sorted(entries, key = lambda entry: entry[0])
+
+
+def _pairs(index: InstantIndex, /) -> list[tuple[int, int]]:
+	return [(entry.instant.epoch_nanoseconds, entry.row_id) for entry in index]
+
+
+def test_entries_are_stable_sorted():
+	entries = _random_entries('sorted')
+	index = _index(entries)
+	assert _pairs(index) == _scan(entries)
+	assert list(index.instants) == [Instant(value) for value, _ in _scan(entries)]
+	assert list(index.row_ids) == [row_id for _, row_id in _scan(entries)]
+	assert _pairs(InstantIndex([Instant(value) for value, _ in entries])) == _scan([(value, position) for position, (value, _) in enumerate(entries)])
+	with pytest.raises(ValueError, match = 'length mismatch'):
+		InstantIndex([Instant(0)], row_ids = [])
+
+
+def test_between_matches_scan():
+	entries = _random_entries('between')
+	index = _index(entries)
+	scan = _scan(entries)
+	for start in range(-52, 53, 3):
+		for end in range(start - 2, 53, 5):
+			start_value, end_value = start * 1000000000, end * 1000000000
+			expected = [entry for entry in scan if start_value <= entry[0] < end_value]
+			assert _pairs(index.between(Instant(start_value), Instant(end_value))) == expected
+	# start is included and end is not, with every duplicate of either
+	value = scan[len(scan) // 2][0]
+	assert _pairs(index.between(Instant(value), Instant(value + 1))) == [entry for entry in scan if entry[0] == value]
+	assert _pairs(index.between(Instant(value - 1), Instant(value))) == []
+	assert len(index.between(Instant(value), Instant(value))) == 0
+
+
+def test_asof_matches_scan():
+	entries = _random_entries('asof')
+	index = _index(entries)
+	scan = _scan(entries)
+	for query in range(-52 * 1000000000, 52 * 1000000000, 250000000):
+		before = [entry for entry in scan if entry[0] <= query]
+		found = index.asof(Instant(query))
+		if not before:
+			assert found is None
+		else:
+			# on an exact tie, the last of the equal entries
+			assert (found.instant.epoch_nanoseconds, found.row_id) == before[-1]  # type: ignore
+	assert index.asof(Instant(scan[0][0] - 1)) is None
+	assert InstantIndex().asof(Instant(0)) is None
+
+
+def test_nearest_matches_scan():
+	entries = _random_entries('nearest', 40)
+	index = _index(entries)
+	scan = _scan(entries)
+	for query in range(-52 * 1000000000, 52 * 1000000000, 125000000):
+		# the earlier entry on a tie in distance; among equal instants the one
+		# next to query in index order
+		distance = min(abs(value - query) for value, _ in scan)
+		earlier = [entry for entry in scan if entry[0] < query and query - entry[0] == distance]
+		later = [entry for entry in scan if entry[0] >= query and entry[0] - query == distance]
+		expected = earlier[-1] if earlier else later[0]
+		found = index.nearest(Instant(query))
+		assert (found.instant.epoch_nanoseconds, found.row_id) == expected  # type: ignore
+	assert InstantIndex().nearest(Instant(0)) is None
+
+
+def test_nearest_tie_prefers_the_earlier_entry():
+	index = InstantIndex([Instant(0), Instant(10)], row_ids = [1, 2])
+	assert index.nearest(Instant(5)).row_id == 1  # type: ignore
+	assert index.nearest(Instant(6)).row_id == 2  # type: ignore
+	assert index.nearest(Instant(-100)).row_id == 1 and index.nearest(Instant(100)).row_id == 2  # type: ignore
+
+
+def test_merge_matches_scan():
+	ours = _random_entries('ours')
+	theirs = [(value + 500000000 * (row_id % 2), row_id + 100000) for value, row_id in _random_entries('theirs')]
+	merged = _index(ours).merge(_index(theirs))
+	# ours first among equal instants, as a stable sort of ours + theirs gives
+	assert _pairs(merged) == _scan(_scan(ours) + _scan(theirs))
+	assert _pairs(_index(ours).merge(InstantIndex())) == _scan(ours)
+
+
+def test_append_matches_scan():
+	random = Random(0)
+	entries = _random_entries('append')
+	index = InstantIndex()
+	added: list[tuple[int, int]] = []
+	for value, row_id in entries:
+		# mostly in order, sometimes far back
+		if random.random() < 0.8:
+			value = (added[-1][0] if added else 0) + random.randrange(0, 3) * 1000000000
+		index.append(Instant(value), row_id)
+		added.append((value, row_id))
+	assert _pairs(index) == _scan(added)
+	default = InstantIndex([Instant(5)])
+	default.append(Instant(1))
+	assert _pairs(default) == [(1, 1), (5, 0)]
+
+
+def test_zoned_date_time_and_string_keys():
+	entries = _random_entries('keys')
+	index = _index(entries)
+	instant = Instant(entries[0][0])
+	zoned_date_time = ZonedDateTime(entries[0][0], TimeZone('Asia/Kolkata'))
+	for key in (zoned_date_time, str(instant), str(zoned_date_time)):
+		assert index.asof(key) == index.asof(instant)
+		assert index.nearest(key) == index.nearest(instant)
+		assert index.between(key, '1970-01-01T00:01Z') == index.between(instant, Instant(60000000000))
+	appended = InstantIndex(InstantArray([instant]))
+	appended.append(str(zoned_date_time), 7)
+	assert _pairs(appended) == [(entries[0][0], 0), (entries[0][0], 7)]
+
+
+def test_slices():
+	index = _index(_random_entries('slices'))
+	assert _pairs(index[10:20]) == _pairs(index)[10:20]
+	with pytest.raises(ValueError, match = 'ascending'):
+		index[::-1]
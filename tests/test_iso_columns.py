@@ -0,0 +1,77 @@
+from random import Random
+
+import pytest
+
+from temporal import Instant, InstantArray, PlainDate, PlainDateTime, TimeZone, ZonedDateTime, get_iso_fields_columns
+
+_FIELDS = ['iso_year', 'iso_month', 'iso_day', 'iso_hour', 'iso_minute', 'iso_second', 'iso_millisecond', 'iso_microsecond', 'iso_nanosecond']
+_COLUMNS = [*_FIELDS, 'day_of_week', 'week_of_year', 'offset_nanoseconds']
+
+
+def _around_transitions() -> list[int]:
+	# every 7 minutes and a few nanoseconds from two hours before to two hours
+	# after the Warsaw transitions of 2024, and the last days of 2024
+	random = Random(0)
+	values = []
+	for transition in (1711846800000000000, 1729990800000000000, 1735603200000000000):
+		for step in range(-18, 19):
+			values.append(transition + step * 420000000000 + random.randrange(1000))
+	return values
+
+
+def _expected(zoned_date_time: ZonedDateTime, /) -> list[int]:
+	fields = zoned_date_time.get_iso_fields()
+	return [*(fields[name] for name in _FIELDS), zoned_date_time.day_of_week, zoned_date_time.week_of_year, zoned_date_time.offset_nanoseconds]  # type: ignore
+
+
+def _rows(columns, /) -> list[list[int]]:  # type: ignore
+	return [list(row) for row in zip(*(columns[name] for name in _COLUMNS))]
+
+
+@pytest.mark.parametrize('key', ['Europe/Warsaw', 'America/St_Johns', 'Australia/Lord_Howe', 'UTC'])
+def test_instants_match_zoned_date_times(key: str):
+	values = _around_transitions()
+	expected = [_expected(ZonedDateTime(value, TimeZone(key))) for value in values]
+	assert _rows(get_iso_fields_columns([Instant(value) for value in values], key)) == expected
+	assert _rows(get_iso_fields_columns(InstantArray.from_epoch_nanoseconds(values), TimeZone(key))) == expected
+	assert _rows(InstantArray.from_epoch_nanoseconds(values).get_iso_fields(key)) == expected
+
+
+def test_zoned_date_times_keep_their_zones():
+	keys = ['Europe/Warsaw', 'America/New_York', 'Asia/Kolkata']
+	zoned_date_times = [ZonedDateTime(value, TimeZone(keys[index % 3])) for index, value in enumerate(_around_transitions())]
+	columns = get_iso_fields_columns(zoned_date_times, 'UTC')
+	assert list(columns) == _COLUMNS
+	assert _rows(columns) == [_expected(zoned_date_time) for zoned_date_time in zoned_date_times]
+
+
+def test_plain_types_have_no_offset():
+	plain_date_times = [ZonedDateTime(value, TimeZone('Europe/Warsaw')).to_plain_date_time() for value in _around_transitions()]
+	rows = _rows(get_iso_fields_columns(plain_date_times))
+	assert [row[:9] for row in rows] == [[plain.get_iso_fields()[name] for name in _FIELDS] for plain in plain_date_times]  # type: ignore
+	assert [row[9:] for row in rows] == [[plain.day_of_week, plain.week_of_year, 0] for plain in plain_date_times]
+	dates = [PlainDate(2024, 12, 30), PlainDate(-1, 1, 1)]
+	assert _rows(get_iso_fields_columns(dates)) == [[2024, 12, 30, 0, 0, 0, 0, 0, 0, 1, 1, 0], [-1, 1, 1, 0, 0, 0, 0, 0, 0, 5, 53, 0]]
+
+
+def test_empty_and_errors():
+	assert _rows(get_iso_fields_columns([])) == []
+	assert all(len(column) == 0 for column in get_iso_fields_columns(InstantArray(), 'UTC').values())
+	with pytest.raises(TypeError, match = 'time zone is required'):
+		get_iso_fields_columns([Instant(0)])
+	with pytest.raises(TypeError, match = 'time zone is required'):
+		get_iso_fields_columns(InstantArray([Instant(0)]))
+	with pytest.raises(TypeError, match = 'expected PlainDate'):
+		get_iso_fields_columns(['2024-01-01'])  # type: ignore
+
+
+def test_numpy_matches_arrays():
+	numpy = pytest.importorskip('numpy')
+	values = _around_transitions()
+	columns = get_iso_fields_columns(InstantArray.from_epoch_nanoseconds(values), 'Europe/Warsaw')
+	records = get_iso_fields_columns(InstantArray.from_epoch_nanoseconds(values), 'Europe/Warsaw', as_numpy = True)
+	assert isinstance(records, numpy.ndarray)
+	assert list(records.dtype.names) == _COLUMNS
+	for name in _COLUMNS:
+		assert records[name].tolist() == list(columns[name])  # type: ignore
+	assert get_iso_fields_columns([PlainDateTime(2024, 1, 1)], as_numpy = True)['offset_nanoseconds'].tolist() == [0]
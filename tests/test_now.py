@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+
+import pytest
+
+from temporal import Now, _now
+
+
+def test_localtime_is_stat_at_most_once_per_interval(monkeypatch: pytest.MonkeyPatch):
+	calls: list[str] = []
+	lstat = os.lstat
+
+	def counting_lstat(path: str, /) -> os.stat_result:
+		# tzlocal resolves paths with lstat too
+		if path == _now._LOCALTIME:
+			calls.append(path)
+		return lstat(path)
+
+	monkeypatch.setattr(_now.os, 'lstat', counting_lstat)
+	monkeypatch.setattr(_now, '_localtime_identity', None)
+	monkeypatch.delenv('TZ', raising = False)
+	first = Now.time_zone_id()
+	calls.clear()
+	monkeypatch.setattr(_now, '_localtime_identity', None)
+	assert Now.time_zone_id() == first
+	for _ in range(100):
+		assert Now.time_zone_id() == first
+	assert len(calls) == 1
+	# TZ is still compared on every call, and a refresh looks at the file again
+	monkeypatch.setenv('TZ', 'Asia/Tokyo')
+	assert Now.time_zone_id() == 'Asia/Tokyo'
+	calls.clear()
+	assert Now.refresh_time_zone_id() == 'Asia/Tokyo'
+	assert calls
+	calls.clear()
+	# and so does the first call after the interval
+	monkeypatch.setattr(_now, '_localtime_identity', (0, ()))
+	Now.time_zone_id()
+	assert len(calls) == 1
+
+
+def test_coarse_clock(monkeypatch: pytest.MonkeyPatch):
+	now = [1714979289123456789]
+	monkeypatch.setattr(_now, '_read_coarse_clock', lambda: now[0])
+	monkeypatch.setattr(_now.time, 'time_ns', lambda: now[0])
+	Now.set_coarse_clock()
+	try:
+		first = Now.instant()
+		assert first.epoch_nanoseconds == 1714979289123000000
+		now[0] += 500000
+		# the Instant of the tick is reused
+		assert Now.instant() is first
+		now[0] += 500000
+		assert Now.instant().epoch_nanoseconds == 1714979289124000000
+	finally:
+		Now.set_coarse_clock(None)
+	assert Now.instant().epoch_nanoseconds == now[0]
+	with pytest.raises(ValueError):
+		Now.set_coarse_clock(0)
+
+
+def test_coarse_clock_source():
+	read = _now._coarse_clock()
+	if sys.platform == 'linux':
+		assert read is not time.time_ns
+	# the coarse clock lags by at most a few kernel ticks
+	before = time.time_ns()
+	value = read()
+	assert before - 100000000 < value <= time.time_ns()
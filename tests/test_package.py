@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import temporal
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def test_public_names():
+	assert not hasattr(temporal, 'TYPE_CHECKING')
+	assert [name for name in dir(temporal) if not name.startswith('_')] == sorted(temporal.__all__)
+	for name in temporal.__all__:
+		assert getattr(temporal, name).__name__ == name
+
+
+def _loaded_after(code: str, /) -> set[str]:
+	# a fresh interpreter, so that nothing this test session imported counts
+	result = subprocess.run([sys.executable, '-c', f'import sys\n{code}\nprint(*sys.modules)'], capture_output = True, text = True, check = True, env = {**os.environ, 'PYTHONPATH': SRC})
+	return {name for name in result.stdout.split() if name.startswith('temporal.')}
+
+
+@pytest.mark.parametrize('name, not_loaded', [
+	('Duration', {'_instant', '_time_zone', '_zoned_date_time'}),
+	('PlainDate', {'_plain_time', '_time_zone', '_zone_rules', '_zoned_date_time'}),
+	('PlainTime', {'_plain_date', '_time_zone', '_zone_rules', '_zoned_date_time'}),
+	('Instant', {'_time_zone', '_zone_rules', '_zoned_date_time'}),
+	('PlainDateTime', {'_time_zone', '_zone_rules', '_zoned_date_time'}),
+	('TimeZone', {'_plain_date_time', '_zoned_date_time'}),
+	('InstantArray', {'_iso_columns', '_zoned_date_time'}),
+])
+def test_names_load_only_their_modules(name: str, not_loaded: set[str]):
+	loaded = _loaded_after(f'import temporal\ntemporal.{name}')
+	assert f'temporal.{temporal._MODULES[name]}' in loaded
+	assert not loaded & {f'temporal.{module}' for module in not_loaded}
+
+
+@pytest.mark.parametrize('module', sorted({*temporal._MODULES.values()}))
+def test_modules_import_on_their_own(module: str):
+	# no import order is needed to resolve the references between modules
+	assert f'temporal.{module}' in _loaded_after(f'import temporal.{module}')
@@ -0,0 +1,55 @@
+import datetime as py_datetime
+
+import pytest
+
+from temporal import Instant, InstantArray
+from temporal._parse_many import ParseError, instant_nanoseconds_parser, parse_many
+
+
+def _expected(text: str, /) -> int:
+	value = py_datetime.datetime.fromisoformat(text.replace('z', 'Z'))
+	return (value - py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.UTC)) // py_datetime.timedelta(microseconds = 1) * 1000
+
+
+def test_cached_rows_match_datetime():
+	parse = instant_nanoseconds_parser()
+	rows = [f'2024-03-{day:02}T{hour:02}:{minute:02}:07.{day:06}{suffix}' for day in (1, 2, 31) for hour in (0, 13, 23) for minute in (0, 59) for suffix in ('Z', '+05:30', '-08:00', 'z')]
+	# the second pass goes through the caches seeded by the first
+	for _ in range(2):
+		assert [parse(row) for row in rows] == [_expected(row) for row in rows]
+
+
+def test_cached_rows_are_validated():
+	parse = instant_nanoseconds_parser()
+	parse('2024-01-01T00:00:00Z')
+	for row in ('2024-01-01T24:00:00Z', '2024-01-01T00:60:00Z', '2024-01-01T00:00:00.Z', '2024-01-01T00:00:00.1234567890Z', '2024-01-01T00:00:00'):
+		with pytest.raises(ValueError):
+			parse(row)
+
+
+def test_errors():
+	rows = ['2024-01-01T00:00Z', 'nope', ' 2024-01-02T00:00+01:00\n', '2024-01-01T00:00']
+	with pytest.raises(ValueError, match = 'row 1'):
+		list(Instant.from_iter(rows))
+	assert len(list(Instant.from_iter(rows, errors = 'skip'))) == 2
+	errors: list[ParseError] = []
+	assert len(list(Instant.from_iter(rows, errors = errors))) == 2
+	assert [(error.index, error.text) for error in errors] == [(1, 'nope'), (3, '2024-01-01T00:00')]
+
+
+def test_invalid_errors_option():
+	# rejected at the call, before any row is read
+	with pytest.raises(ValueError):
+		parse_many(int, ['1'], errors = 'ignore')  # type: ignore
+	with pytest.raises(ValueError):
+		Instant.from_iter([], errors = None)  # type: ignore
+
+
+def test_out_of_range_rows():
+	rows = ['+275000-01-01T00:00Z', '2024-01-01T00:00Z', '2300-01-01T00:00:00Z']
+	assert len(list(Instant.from_iter(rows + ['+275760-09-13T00:00:00.000000001Z'], errors = 'skip'))) == 3
+	errors: list[ParseError] = []
+	assert InstantArray.from_iter(rows, errors = errors) == InstantArray(['2024-01-01T00:00Z'])
+	assert [error.index for error in errors] == [0, 2]
+	with pytest.raises(ValueError, match = 'row 0'):
+		InstantArray.from_iter(rows)
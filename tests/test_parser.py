@@ -0,0 +1,102 @@
+import datetime as py_datetime
+from random import Random
+
+import pytest
+
+from temporal import Instant
+from temporal._parser import parse_date_time
+
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.timezone.utc)
+
+
+def _epoch_nanoseconds(value: py_datetime.datetime, /) -> int:
+	delta = value - _EPOCH
+	return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
+
+
+@pytest.mark.parametrize('layout', [
+	'%Y-%m-%dT%H:%M:%S.{fraction}{offset}',
+	'%Y-%m-%d %H:%M:%S,{fraction}{offset}',
+	'%Y%m%dT%H%M%S.{fraction}{offset}',
+	'%Y-%m-%dt%H:%M:%S.{fraction}{offset}',
+])
+def test_matches_datetime(layout: str):
+	random = Random(layout)
+	for _ in range(500):
+		offset = py_datetime.timedelta(minutes = random.randrange(-18 * 60 + 1, 18 * 60))
+		value = py_datetime.datetime(
+			random.randrange(1, 10000),
+			random.randrange(1, 13),
+			random.randrange(1, 29),
+			random.randrange(24),
+			random.randrange(60),
+			random.randrange(60),
+			random.randrange(1000000),
+			tzinfo = py_datetime.timezone(offset),
+		)
+		hours, minutes = divmod(abs(offset) // py_datetime.timedelta(minutes = 1), 60)
+		sign = '-' if offset < py_datetime.timedelta(0) else '+'
+		text = value.strftime(layout.format(fraction = f'{value.microsecond:06}', offset = f'{sign}{hours:02}:{minutes:02}'))
+		if text[:4] != f'{value.year:04}':
+			# strftime doesn't pad years before 1000 everywhere
+			continue
+		assert Instant.from_(text).epoch_nanoseconds == _epoch_nanoseconds(value), text
+		parsed = parse_date_time(text)
+		assert (parsed.year, parsed.month, parsed.day, parsed.hour, parsed.minute, parsed.second, parsed.nanosecond) == (
+			value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond * 1000,
+		)
+
+
+@pytest.mark.parametrize('text', [
+	'2024-05-06T07:08:09Z',
+	'2024-05-06T07:08:09.5+05:30',
+	'2024-05-06T07:08Z',
+	'2024-05-06T07Z',
+	'20240506T070809-0130',
+	'2024-05-06T07:08:09,123456-00:00',
+	'2024-05-06 07:08:09z',
+])
+def test_instant_matches_fromisoformat(text: str):
+	value = py_datetime.datetime.fromisoformat(text.replace('z', 'Z'))
+	assert Instant.from_(text).epoch_nanoseconds == _epoch_nanoseconds(value)
+
+
+def test_nanosecond_fraction():
+	assert Instant.from_('1970-01-01T00:00:00.000000001Z').epoch_nanoseconds == 1
+	assert Instant.from_('1969-12-31T23:59:59.999999999Z').epoch_nanoseconds == -1
+	assert parse_date_time('2024-05-06T07:08:09.12Z').nanosecond == 120000000
+
+
+def test_extended_years():
+	assert Instant.from_('+010000-01-01T00:00Z').epoch_nanoseconds == 253402300800000000000
+	assert parse_date_time('-000001-12-31T23:59').year == -1
+	with pytest.raises(ValueError, match = 'invalid ISO 8601 string'):
+		parse_date_time('-000000-01-01T00:00Z')
+
+
+def test_annotations():
+	parsed = parse_date_time('2024-05-06T07:08:09-04:00[!America/New_York][u-ca=iso8601]')
+	assert parsed.offset_nanoseconds == -4 * 3600000000000
+	assert parsed.time_zone == 'America/New_York'
+	assert parsed.calendar == 'iso8601'
+
+
+def test_leap_second_is_clamped():
+	assert parse_date_time('2016-12-31T23:59:60Z').second == 59
+
+
+@pytest.mark.parametrize('text', [
+	'',
+	'2024-05-06T',
+	'2024-13-01T00:00Z',
+	'2024-02-30T00:00Z',
+	'2024-05-06T24:00Z',
+	'2024-05-06T07:60Z',
+	'2024-05-06T07:08:09Z+01:00',
+	'2024-05-06Z',
+	'2024-05-06T07:08:09.1234567890Z',
+	'２０２４-05-06T07:08:09Z',
+])
+def test_invalid(text: str):
+	with pytest.raises(ValueError):
+		parse_date_time(text)
@@ -0,0 +1,89 @@
+import datetime as py_datetime
+import pickle
+from random import Random
+
+import pytest
+
+from temporal import Duration, PlainDate, _plain_date
+
+
+def _random_dates(seed: str, /) -> list[py_datetime.date]:
+	random = Random(seed)
+	return [py_datetime.date.fromordinal(random.randrange(1, 3652060)) for _ in range(500)]
+
+
+@pytest.mark.parametrize('duration, expected', [
+	('P1D', '2024-02-01'),
+	('P1M', '2024-02-29'),
+	('-P1M', '2023-12-31'),
+	('P1Y1M', '2025-02-28'),
+	('P1W1D', '2024-02-08'),
+	('PT47H', '2024-02-01'),
+	('-PT47H', '2024-01-30'),
+])
+def test_add(duration: str, expected: str):
+	assert str(PlainDate(2024, 1, 31).add(duration)) == expected
+
+
+def test_add_days_matches_date():
+	for value in _random_dates('add'):
+		days = Random(value.toordinal()).randrange(-1000, 1000)
+		if 1 <= value.toordinal() - abs(days) and value.toordinal() + abs(days) <= 3652059:
+			assert PlainDate.from_py_date(value).add(Duration(0, 0, 0, days)).py_date == value + py_datetime.timedelta(days = days)
+			assert PlainDate.from_py_date(value).subtract(Duration(0, 0, 0, days)).py_date == value - py_datetime.timedelta(days = days)
+
+
+def test_add_reject_and_range():
+	assert PlainDate(2024, 3, 31).subtract('P1M') == PlainDate(2024, 2, 29)
+	with pytest.raises(ValueError, match = 'invalid date'):
+		PlainDate(2024, 3, 31).subtract('P1M', 'reject')
+	with pytest.raises(ValueError, match = 'invalid overflow'):
+		PlainDate(2024, 3, 31).add('P1M', 'ignore')  # type: ignore
+	with pytest.raises(ValueError, match = 'out of range'):
+		PlainDate(275760, 9, 13).add('P1D')
+
+
+def test_until_days_matches_date():
+	dates = _random_dates('until')
+	for one, two in zip(dates, dates[1:]):
+		assert PlainDate.from_py_date(one).until(PlainDate.from_py_date(two)).days == (two - one).days
+		assert PlainDate.from_py_date(one).since(PlainDate.from_py_date(two)).days == (one - two).days
+
+
+def test_until_calendar_units():
+	one = PlainDate(2024, 1, 31)
+	assert str(one.until('2024-03-01')) == 'P30D'
+	assert str(one.until('2024-03-01', largest_unit = 'month')) == 'P1M1D'
+	assert str(one.until('2024-02-29', largest_unit = 'month')) == 'P29D'
+	assert str(PlainDate(2024, 3, 1).until(one, largest_unit = 'month')) == '-P1M1D'
+	assert str(one.until('2025-03-01', largest_unit = 'year')) == 'P1Y1M1D'
+	assert str(one.until('2024-03-01', largest_unit = 'week')) == 'P4W2D'
+	assert str(PlainDate(2024, 3, 1).since(one, largest_unit = 'month')) == 'P1M1D'
+	assert one.until(one) == type(one.until(one))()
+	with pytest.raises(ValueError, match = 'not supported'):
+		one.until('2025-01-01', smallest_unit = 'month')
+	with pytest.raises(ValueError, match = 'invalid largest unit'):
+		one.until('2025-01-01', largest_unit = 'hour')  # type: ignore
+
+
+def test_until_add_round_trip():
+	dates = _random_dates('round trip')
+	for one, two in zip(dates, dates[1:]):
+		one, two = PlainDate.from_py_date(one), PlainDate.from_py_date(two)
+		for unit in ('year', 'month', 'week', 'day'):
+			assert one.add(one.until(two, largest_unit = unit)) == two
+			assert two.subtract(two.since(one, largest_unit = unit)) == one
+
+
+def test_fields_match_date(monkeypatch):  # type: ignore
+	dates = _random_dates('fields')
+	plain_dates = [PlainDate.from_py_date(value) for value in dates]
+	plain_dates += [PlainDate(value.year, value.month, value.day) for value in dates]
+	plain_dates += [PlainDate.from_(str(value)) for value in dates]
+	plain_dates += [PlainDate.from_bytes(plain_date.to_bytes()) for plain_date in plain_dates[:len(dates)]]
+	# the fields are read from the instance, not derived again on every access
+	monkeypatch.setattr(_plain_date, 'iso_from_epoch_days', None)
+	for value, plain_date in zip(dates * 4, plain_dates):
+		assert (plain_date.year, plain_date.month, plain_date.day) == (value.year, value.month, value.day)
+		assert plain_date.py_date == value
+	assert pickle.loads(pickle.dumps(plain_dates[0])) == plain_dates[0]
@@ -0,0 +1,159 @@
+import datetime as py_datetime
+import pickle
+from dataclasses import FrozenInstanceError
+from random import Random
+
+import pytest
+
+from temporal import Duration, PlainDate, PlainDateTime, PlainTime
+
+
+def _random_datetimes(seed: str, /) -> list[tuple[py_datetime.datetime, int]]:
+	random = Random(seed)
+	return [(py_datetime.datetime(1, 1, 1) + py_datetime.timedelta(microseconds = random.randrange(3652058 * 86400 * 10**6)), random.randrange(1000)) for _ in range(500)]
+
+
+def _plain(value: py_datetime.datetime, nanosecond: int, /) -> PlainDateTime:
+	return PlainDateTime(value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond // 1000, value.microsecond % 1000, nanosecond)
+
+
+def test_fields_match_datetime():
+	for value, nanosecond in _random_datetimes('fields'):
+		plain = _plain(value, nanosecond)
+		assert (plain.year, plain.month, plain.day) == (value.year, value.month, value.day)
+		assert (plain.hour, plain.minute, plain.second) == (value.hour, value.minute, value.second)
+		assert (plain.millisecond, plain.microsecond, plain.nanosecond) == (value.microsecond // 1000, value.microsecond % 1000, nanosecond)
+		assert (plain.day_of_week, plain.day_of_year) == (value.isoweekday(), value.timetuple().tm_yday)
+		assert (plain.year_of_week, plain.week_of_year) == value.isocalendar()[:2]
+		assert plain.month_code == f'M{value.month:02}'
+		assert plain.days_in_year == (py_datetime.date(value.year, 12, 31) - py_datetime.date(value.year, 1, 1)).days + 1
+		assert plain.py_datetimenaive == value
+		assert (plain.py_date, plain.py_time) == (value.date(), value.time())
+
+
+def test_iso_fields_match_datetime():
+	for value, nanosecond in _random_datetimes('iso'):
+		fields = _plain(value, nanosecond).get_iso_fields()
+		assert (fields['iso_year'], fields['iso_month'], fields['iso_day']) == (value.year, value.month, value.day)
+		assert (fields['iso_hour'], fields['iso_minute'], fields['iso_second']) == (value.hour, value.minute, value.second)
+		assert fields['iso_millisecond'] * 1000 + fields['iso_microsecond'] == value.microsecond
+		assert fields['iso_nanosecond'] == nanosecond
+
+
+def test_string_round_trip_keeps_nanoseconds():
+	for value, nanosecond in _random_datetimes('str'):
+		plain = _plain(value, nanosecond)
+		text = str(plain)
+		fraction = f'{value.microsecond * 1000 + nanosecond:09}'.rstrip('0')
+		assert text == value.isoformat(timespec = 'seconds') + (f'.{fraction}' if fraction else '')
+		assert PlainDateTime.from_(text) == plain
+		assert PlainDateTime.from_py_datetimenaive(value) == plain.with_(nanosecond = 0)
+	assert str(PlainDateTime(2024, 1, 2, 3, 4, 5, 6, 7, 8)) == '2024-01-02T03:04:05.006007008'
+	assert str(PlainDateTime(2024, 1, 2)) == '2024-01-02T00:00:00'
+
+
+def test_extended_years():
+	assert PlainDateTime.from_('-000001-12-31T23:59').year == -1
+	assert str(PlainDateTime(-271821, 4, 19, 0, 0, 0, 0, 0, 1)) == '-271821-04-19T00:00:00.000000001'
+	assert str(PlainDateTime(275760, 9, 13, 23, 59, 59, 999, 999, 999)) == '+275760-09-13T23:59:59.999999999'
+	with pytest.raises(ValueError, match = 'out of range'):
+		PlainDateTime(-271821, 4, 19)
+	with pytest.raises(ValueError, match = 'out of range'):
+		PlainDateTime(275760, 9, 14)
+
+
+@pytest.mark.parametrize('fields, message', [
+	((2023, 2, 29), 'invalid date'),
+	((2024, 13, 1), 'invalid date'),
+	((2024, 1, 1, 24), 'invalid time'),
+	((2024, 1, 1, 0, 60), 'invalid time'),
+	((2024, 1, 1, 0, 0, 0, 0, 0, 1000), 'invalid time'),
+])
+def test_invalid(fields: tuple[int, ...], message: str):
+	with pytest.raises(ValueError, match = message):
+		PlainDateTime(*fields)
+
+
+def test_date_and_time_parts():
+	plain = PlainDateTime(2024, 2, 29, 13, 14, 15, 16, 17, 18)
+	assert plain.to_plain_time() == PlainTime(13, 14, 15, 16, 17, 18)
+	assert PlainDate.from_(plain) == PlainDate(2024, 2, 29)
+	assert plain.with_plain_time('01:02') == PlainDateTime(2024, 2, 29, 1, 2)
+	assert plain.with_plain_date('2023-03-01') == PlainDateTime(2023, 3, 1, 13, 14, 15, 16, 17, 18)
+	assert plain.to_plain_date_time(plain_date = PlainDate(2020, 1, 1)) == PlainDateTime(2020, 1, 1, 13, 14, 15, 16, 17, 18)
+	assert plain.with_(year = 2025, day = 28, nanosecond = 0) == PlainDateTime(2025, 2, 28, 13, 14, 15, 16, 17)
+	assert PlainDateTime.from_(PlainDate(2024, 5, 6)) == PlainDateTime(2024, 5, 6)
+
+
+def test_frozen_and_pickle():
+	plain = PlainDateTime(2024, 2, 29, 13, 14, 15, 16, 17, 18)
+	with pytest.raises(FrozenInstanceError):
+		plain._iso_date_time = (2024, 1, 1, 0, 0, 0, 0, 0, 0)  # type: ignore
+	with pytest.raises(FrozenInstanceError):
+		del plain._iso_date_time  # type: ignore
+	assert not hasattr(plain, '__dict__')
+	assert pickle.loads(pickle.dumps(plain)) == plain
+	assert hash(plain) == hash(PlainDateTime.from_(str(plain)))
+	assert plain != PlainDateTime(2024, 2, 29, 13, 14, 15, 16, 17, 19)
+
+
+@pytest.mark.parametrize('duration, expected', [
+	('P1D', '2024-02-01T23:00:00'),
+	('P1M', '2024-02-29T23:00:00'),
+	('P1MT2H', '2024-03-01T01:00:00'),
+	('-P1MT23H', '2023-12-31T00:00:00'),
+	('PT0.000000001S', '2024-01-31T23:00:00.000000001'),
+])
+def test_add(duration: str, expected: str):
+	assert str(PlainDateTime(2024, 1, 31, 23).add(duration)) == expected
+
+
+def test_add_matches_datetime():
+	values = _random_datetimes('add')
+	random = Random(0)
+	for value, nanosecond in values:
+		microseconds = random.randrange(-10**15, 10**15)
+		try:
+			expected = value + py_datetime.timedelta(microseconds = microseconds)
+		except OverflowError:
+			continue
+		duration = Duration(0, 0, 0, 0, 0, 0, 0, 0, microseconds)
+		assert _plain(value, nanosecond).add(duration) == _plain(expected, nanosecond)
+		assert _plain(expected, nanosecond).subtract(duration) == _plain(value, nanosecond)
+	with pytest.raises(ValueError, match = 'invalid date'):
+		PlainDateTime(2024, 1, 31).add('P1M', 'reject')
+
+
+def test_until_matches_datetime():
+	values = _random_datetimes('until')
+	for (one, one_nanosecond), (two, two_nanosecond) in zip(values, values[1:]):
+		nanoseconds = ((two - one) // py_datetime.timedelta(microseconds = 1)) * 1000 + two_nanosecond - one_nanosecond
+		assert _plain(one, one_nanosecond).until(_plain(two, two_nanosecond), largest_unit = 'hour') == Duration._from_nanoseconds(nanoseconds)
+		difference = _plain(one, one_nanosecond).until(_plain(two, two_nanosecond))
+		assert difference.days * 86400000000000 + difference._time_nanoseconds == nanoseconds
+		assert abs(difference._time_nanoseconds) < 86400000000000
+
+
+def test_until_calendar_units_and_rounding():
+	one = PlainDateTime(2024, 1, 31, 12)
+	two = PlainDateTime(2024, 3, 1, 11)
+	assert str(one.until(two)) == 'P29DT23H'
+	assert str(one.until(two, largest_unit = 'month')) == 'P29DT23H'
+	assert str(two.until(one, largest_unit = 'month')) == '-P1MT23H'
+	assert str(two.since(one, largest_unit = 'month')) == 'P1MT23H'
+	assert str(one.until(two, largest_unit = 'week')) == 'P4W1DT23H'
+	assert str(one.until(two, largest_unit = 'month', smallest_unit = 'day', rounding_mode = 'halfExpand')) == 'P1M1D'
+	assert str(one.until(two, smallest_unit = 'hour', rounding_increment = 6, rounding_mode = 'ceil')) == 'P30D'
+	assert str(one.until(two, smallest_unit = 'minute', rounding_increment = 30)) == 'P29DT23H'
+	assert str(one.until(two, largest_unit = 'minute')) == 'PT43140M'
+	with pytest.raises(ValueError, match = 'not supported'):
+		one.until(two, largest_unit = 'year', smallest_unit = 'month')
+
+
+def test_until_add_round_trip():
+	values = _random_datetimes('round trip')
+	for (one, one_nanosecond), (two, two_nanosecond) in zip(values, values[1:]):
+		one, two = _plain(one, one_nanosecond), _plain(two, two_nanosecond)
+		for unit in ('year', 'month', 'week', 'day', 'hour'):
+			assert one.add(one.until(two, largest_unit = unit)) == two
+			assert two.subtract(two.since(one, largest_unit = unit)) == one
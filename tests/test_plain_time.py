@@ -0,0 +1,95 @@
+import datetime as py_datetime
+import pickle
+from dataclasses import FrozenInstanceError
+from random import Random
+
+import pytest
+
+from temporal import Duration, PlainDateTime, PlainTime, TimeZone, ZonedDateTime
+
+
+def _random_times(seed: str, /) -> list[tuple[py_datetime.time, int]]:
+	random = Random(seed)
+	return [(py_datetime.time(random.randrange(24), random.randrange(60), random.randrange(60), random.randrange(1000000)), random.randrange(1000)) for _ in range(500)]
+
+
+def _plain(value: py_datetime.time, nanosecond: int, /) -> PlainTime:
+	return PlainTime(value.hour, value.minute, value.second, value.microsecond // 1000, value.microsecond % 1000, nanosecond)
+
+
+def test_fields_keep_nanoseconds():
+	for value, nanosecond in _random_times('fields'):
+		plain = _plain(value, nanosecond)
+		assert (plain.hour, plain.minute, plain.second) == (value.hour, value.minute, value.second)
+		assert (plain.millisecond, plain.microsecond, plain.nanosecond) == (value.microsecond // 1000, value.microsecond % 1000, nanosecond)
+		assert plain.py_time == value
+		assert PlainTime.from_py_time(value) == plain.with_(nanosecond = 0)
+		fields = plain.get_iso_fields()
+		assert [fields[name] for name in ('iso_hour', 'iso_minute', 'iso_second', 'iso_millisecond', 'iso_microsecond', 'iso_nanosecond')] == [plain.hour, plain.minute, plain.second, plain.millisecond, plain.microsecond, nanosecond]  # type: ignore
+
+
+def test_string_round_trip():
+	for value, nanosecond in _random_times('str'):
+		plain = _plain(value, nanosecond)
+		fraction = f'{value.microsecond * 1000 + nanosecond:09}'.rstrip('0')
+		assert str(plain) == value.isoformat(timespec = 'seconds') + (f'.{fraction}' if fraction else '')
+		assert PlainTime.from_(str(plain)) == plain
+	assert str(PlainTime(23, 59, 59, 999, 999, 999)) == '23:59:59.999999999'
+
+
+def test_from_date_times():
+	plain_date_time = PlainDateTime(2024, 3, 31, 2, 30, 0, 1, 2, 3)
+	assert PlainTime.from_(plain_date_time) == plain_date_time.to_plain_time() == PlainTime(2, 30, 0, 1, 2, 3)
+	zoned_date_time = ZonedDateTime(1711846800000000001, TimeZone('Europe/Warsaw'))
+	assert PlainTime.from_(zoned_date_time) == zoned_date_time.to_plain_time() == PlainTime(3, 0, 0, 0, 0, 1)
+	assert PlainTime.from_(PlainTime(1, 2, 3, 4, 5, 6)) == PlainTime(1, 2, 3, 4, 5, 6)
+
+
+@pytest.mark.parametrize('fields', [(24, ), (0, 60), (0, 0, 60), (0, 0, 0, 1000), (0, 0, 0, 0, -1), (0, 0, 0, 0, 0, 1000)])
+def test_invalid(fields: tuple[int, ...]):
+	with pytest.raises(ValueError, match = 'invalid time'):
+		PlainTime(*fields)
+
+
+def test_frozen_and_pickle():
+	plain = PlainTime(13, 14, 15, 16, 17, 18)
+	with pytest.raises(FrozenInstanceError):
+		plain._nanosecond_of_day = 0  # type: ignore
+	with pytest.raises(FrozenInstanceError):
+		del plain._nanosecond_of_day  # type: ignore
+	assert not hasattr(plain, '__dict__')
+	assert pickle.loads(pickle.dumps(plain)) == plain
+	assert hash(plain) == hash(PlainTime.from_('13:14:15.016017018'))
+	assert plain != PlainTime(13, 14, 15, 16, 17, 19)
+
+
+def test_add_wraps_around_midnight():
+	assert PlainTime(23).add('PT2H30M') == PlainTime(1, 30)
+	assert PlainTime(1).subtract('PT2H') == PlainTime(23)
+	assert PlainTime(12).add('P1Y2M3DT1H') == PlainTime(13)
+	for value, nanosecond in _random_times('add'):
+		microseconds = Random(value.microsecond).randrange(-10**12, 10**12)
+		start = py_datetime.datetime.combine(py_datetime.date(2000, 1, 1), value)
+		expected = (start + py_datetime.timedelta(microseconds = microseconds)).time()
+		duration = Duration(0, 0, 0, 0, 0, 0, 0, 0, microseconds)
+		assert _plain(value, nanosecond).add(duration) == _plain(expected, nanosecond)
+		assert _plain(expected, nanosecond).subtract(duration) == _plain(value, nanosecond)
+
+
+def test_until_and_since():
+	times = _random_times('until')
+	for (one, one_nanosecond), (two, two_nanosecond) in zip(times, times[1:]):
+		day = py_datetime.date(2000, 1, 1)
+		microseconds = (py_datetime.datetime.combine(day, two) - py_datetime.datetime.combine(day, one)) // py_datetime.timedelta(microseconds = 1)
+		nanoseconds = microseconds * 1000 + two_nanosecond - one_nanosecond
+		difference = _plain(one, one_nanosecond).until(_plain(two, two_nanosecond))
+		assert difference == Duration._from_nanoseconds(nanoseconds)
+		assert _plain(two, two_nanosecond).since(_plain(one, one_nanosecond)) == difference
+		assert _plain(one, one_nanosecond).add(difference) == _plain(two, two_nanosecond)
+	assert str(PlainTime(1).until('03:30')) == 'PT2H30M'
+	assert str(PlainTime(1).until('03:30', largest_unit = 'minute')) == 'PT150M'
+	assert str(PlainTime(1).until('03:30', smallest_unit = 'hour', rounding_mode = 'halfExpand')) == 'PT3H'
+	assert str(PlainTime(1).since('03:30', smallest_unit = 'hour', rounding_mode = 'floor')) == '-PT3H'
+	assert str(PlainTime(1).since('03:30', smallest_unit = 'hour')) == '-PT2H'
+	with pytest.raises(ValueError):
+		PlainTime(1).until('03:30', largest_unit = 'day')  # type: ignore
@@ -0,0 +1,126 @@
+import datetime as py_datetime
+import itertools
+import zoneinfo as py_zoneinfo
+
+import pytest
+
+from temporal import PlainDate, PlainDateTime, ZonedDateTime, date_range, recurrence
+
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.timezone.utc)
+
+
+def _epoch_nanoseconds(value: py_datetime.datetime, /) -> int:
+	delta = value - _EPOCH
+	return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
+
+
+def _selected(date: py_datetime.date, start: py_datetime.date, frequency: str, interval: int, by_day: set[int], by_month_day: set[int], /) -> bool:
+	# whether a rule selects a date, checked one date at a time
+	next_month = date.replace(day = 28) + py_datetime.timedelta(days = 4)
+	length = (next_month - py_datetime.timedelta(days = next_month.day)).day
+	if by_day and date.isoweekday() not in by_day:
+		return False
+	if by_month_day and date.day not in {day if day > 0 else length + day + 1 for day in by_month_day}:
+		return False
+	if frequency == 'day':
+		return (date - start).days % interval == 0
+	if frequency == 'week':
+		weeks = (date - py_datetime.timedelta(days = date.weekday()) - (start - py_datetime.timedelta(days = start.weekday()))).days // 7
+		return weeks % interval == 0 and (bool(by_day) or date.weekday() == start.weekday())
+	if frequency == 'month':
+		months = (date.year - start.year) * 12 + date.month - start.month
+		return months % interval == 0 and (bool(by_day or by_month_day) or date.day == start.day)
+	return (date.year - start.year) % interval == 0 and (bool(by_day or by_month_day) or (date.month, date.day) == (start.month, start.day))
+
+
+def _expected(start: py_datetime.datetime, zone: py_zoneinfo.ZoneInfo, frequency: str, interval: int, by_day: set[int], by_month_day: set[int], count: int, /) -> list[int]:
+	found = []
+	date = start.date()
+	while len(found) < count:
+		if _selected(date, start.date(), frequency, interval, by_day, by_month_day):
+			# fold = 0 is the 'compatible' choice in gaps and overlaps alike
+			found.append(_epoch_nanoseconds(py_datetime.datetime.combine(date, start.time(), tzinfo = zone)))
+		date += py_datetime.timedelta(days = 1)
+	return found
+
+
+@pytest.mark.parametrize('frequency, interval, by_day, by_month_day', [
+	('day', 1, (), ()),
+	('day', 3, (1, 5), ()),
+	('week', 1, (), ()),
+	('week', 2, (2, 4, 7), ()),
+	('week', 1, (1,), (1, 2, 3, 4, 5, 6, 7)),
+	('month', 1, (), ()),
+	('month', 2, (), (-1, 15)),
+	('month', 1, (5,), (13,)),
+	('month', 1, (6, 7), ()),
+	('year', 1, (), ()),
+	('year', 2, (), (1,)),
+	('year', 1, (1,), ()),
+])
+@pytest.mark.parametrize('start', ['2023-01-31T02:30', '2024-02-29T23:15', '2024-03-31T02:30', '2024-10-27T02:30:15'])
+def test_matches_zoneinfo(start: str, frequency: str, interval: int, by_day: tuple[int, ...], by_month_day: tuple[int, ...]):
+	zone = py_zoneinfo.ZoneInfo('Europe/Warsaw')
+	count = 60
+	found = recurrence(start, 'Europe/Warsaw', frequency, interval = interval, by_day = by_day, by_month_day = by_month_day, count = count)  # type: ignore
+	expected = _expected(py_datetime.datetime.fromisoformat(start), zone, frequency, interval, set(by_day), set(by_month_day), count)
+	assert [occurrence.epoch_nanoseconds for occurrence in found] == expected
+
+
+def test_zoned_start_and_until():
+	start = ZonedDateTime.from_('2024-03-29T02:30+01:00[Europe/Warsaw]')
+	found = [str(occurrence) for occurrence in recurrence(start, until = '2024-04-01T00:30Z')]
+	assert found == [
+		'2024-03-29T02:30:00+01:00[Europe/Warsaw]',
+		'2024-03-30T02:30:00+01:00[Europe/Warsaw]',
+		'2024-03-31T03:30:00+02:00[Europe/Warsaw]',
+		'2024-04-01T02:30:00+02:00[Europe/Warsaw]',
+	]
+
+
+def test_disambiguation():
+	found = recurrence('2024-10-26T02:30', 'Europe/Warsaw', count = 2, disambiguation = 'later')
+	assert [str(occurrence) for occurrence in found] == ['2024-10-26T02:30:00+02:00[Europe/Warsaw]', '2024-10-27T02:30:00+01:00[Europe/Warsaw]']
+	with pytest.raises(ValueError, match = 'nonexistent'):
+		list(recurrence('2024-03-30T02:30', 'Europe/Warsaw', count = 2, disambiguation = 'reject'))
+
+
+def test_is_lazy():
+	found = recurrence(PlainDateTime(2024, 1, 1, 9), 'UTC', 'year')
+	assert [occurrence.year for occurrence in itertools.islice(found, 3)] == [2024, 2025, 2026]
+
+
+@pytest.mark.parametrize('arguments', [
+	{'frequency': 'hour'},
+	{'interval': 0},
+	{'count': -1},
+	{'by_day': (0,)},
+	{'by_month_day': (32,)},
+	{'disambiguation': 'first'},
+])
+def test_invalid_arguments(arguments: dict):
+	with pytest.raises(ValueError):
+		recurrence('2024-01-01T00:00', 'UTC', **arguments)
+	with pytest.raises(TypeError):
+		recurrence('2024-01-01T00:00')
+
+
+@pytest.mark.parametrize('unit, step', [('day', 1), ('day', 5), ('day', -3), ('week', 2), ('week', -1)])
+def test_date_range_matches_timedelta(unit: str, step: int):
+	start = py_datetime.date(2024, 2, 27)
+	stop = start + py_datetime.timedelta(days = 100 if step > 0 else -100)
+	days = step * 7 if unit == 'week' else step
+	expected = [start + py_datetime.timedelta(days = days * index) for index in range(-(-100 // abs(days)))]
+	assert [str(date) for date in date_range(str(start), str(stop), unit, step = step)] == [str(date) for date in expected]  # type: ignore
+
+
+def test_date_range_months_keep_the_day():
+	assert [str(date) for date in date_range('2024-01-31', '2024-06-01', 'month')] == ['2024-01-31', '2024-02-29', '2024-03-31', '2024-04-30', '2024-05-31']
+	assert [str(date) for date in date_range('2024-03-31', '2023-12-01', 'month', step = -1)] == ['2024-03-31', '2024-02-29', '2024-01-31', '2023-12-31']
+
+
+def test_date_range_without_stop_ends_with_the_range():
+	assert list(itertools.islice(date_range(PlainDate(2024, 1, 1), step = 7), 2)) == [PlainDate(2024, 1, 1), PlainDate(2024, 1, 8)]
+	assert str(list(date_range('+275760-09-10'))[-1]) == '+275760-09-13'
+	with pytest.raises(ValueError, match = 'zero'):
+		date_range('2024-01-01', step = 0)
@@ -0,0 +1,106 @@
+import decimal
+import math
+from fractions import Fraction
+from random import Random
+
+import pytest
+
+from temporal import Instant, InstantArray, PlainTime
+from temporal._rounding import ROUNDING_MODES, negated, round_array, round_to_increment
+
+_DECIMAL_MODES = {
+	'ceil': decimal.ROUND_CEILING,
+	'floor': decimal.ROUND_FLOOR,
+	'expand': decimal.ROUND_UP,
+	'trunc': decimal.ROUND_DOWN,
+	'halfExpand': decimal.ROUND_HALF_UP,
+	'halfTrunc': decimal.ROUND_HALF_DOWN,
+	'halfEven': decimal.ROUND_HALF_EVEN,
+}
+
+
+def _reference(value: int, increment: int, rounding_mode: str, /) -> int:
+	if rounding_mode == 'halfCeil':
+		return math.floor(Fraction(value, increment) + Fraction(1, 2)) * increment
+	if rounding_mode == 'halfFloor':
+		return math.ceil(Fraction(value, increment) - Fraction(1, 2)) * increment
+	context = decimal.Context(prec = 100, rounding = _DECIMAL_MODES[rounding_mode])
+	return int(context.divide(decimal.Decimal(value), decimal.Decimal(increment)).to_integral_value(context = context)) * increment
+
+
+def _values(random: Random, increment: int, /) -> list[int]:
+	# exact ties and their neighbours next to random values of both signs
+	values = [0, increment, -increment, increment // 2, -(increment // 2), 2 ** 62, -2 ** 62]
+	for _ in range(300):
+		quotient = random.randrange(-10 ** 9, 10 ** 9)
+		values.append(quotient * increment + random.randrange(increment))
+		if increment % 2 == 0:
+			values.extend(quotient * increment + increment // 2 + step for step in (-1, 0, 1))
+	return values
+
+
+@pytest.mark.parametrize('rounding_mode', sorted(ROUNDING_MODES))
+@pytest.mark.parametrize('increment', [1, 2, 3, 10, 1000, 86400000000000])
+def test_round_to_increment(rounding_mode: str, increment: int):
+	for value in _values(Random(f'{rounding_mode}{increment}'), increment):
+		assert round_to_increment(value, increment, rounding_mode) == _reference(value, increment, rounding_mode), value  # type: ignore
+
+
+@pytest.mark.parametrize('rounding_mode', sorted(ROUNDING_MODES))
+@pytest.mark.parametrize('increment', [1, 2, 3, 10, 1000, 86400000000000])
+def test_round_array(rounding_mode: str, increment: int):
+	values = [value for value in _values(Random(increment), increment) if abs(value) < 2 ** 62]
+	assert list(round_array(values, increment, rounding_mode)) == [round_to_increment(value, increment, rounding_mode) for value in values]  # type: ignore
+
+
+@pytest.mark.parametrize('rounding_mode', sorted(ROUNDING_MODES))
+def test_negated(rounding_mode: str):
+	for value in _values(Random(rounding_mode), 10):
+		assert -round_to_increment(-value, 10, negated(rounding_mode)) == round_to_increment(value, 10, rounding_mode)  # type: ignore
+
+
+def test_invalid_rounding_mode():
+	with pytest.raises(ValueError, match = 'invalid rounding mode'):
+		round_to_increment(5, 10, 'nearest')  # type: ignore
+	with pytest.raises(ValueError, match = 'invalid rounding mode'):
+		round_array([5], 10, 'nearest')  # type: ignore
+
+
+@pytest.mark.parametrize('rounding_mode, before, after', [
+	('trunc', '1969-12-31T23:59:59.5Z', '1969-12-31T23:59:59Z'),
+	('trunc', '1970-01-01T00:00:00.5Z', '1970-01-01T00:00:00Z'),
+	('expand', '1969-12-31T23:59:59.5Z', '1970-01-01T00:00:00Z'),
+	('halfExpand', '1969-12-31T23:59:59.5Z', '1970-01-01T00:00:00Z'),
+	('halfTrunc', '1969-12-31T23:59:59.5Z', '1969-12-31T23:59:59Z'),
+	('halfEven', '1969-12-31T23:59:58.5Z', '1969-12-31T23:59:58Z'),
+])
+def test_instant_rounds_as_if_positive(rounding_mode: str, before: str, after: str):
+	assert str(Instant.from_(before).round('second', rounding_mode = rounding_mode)) == after  # type: ignore
+
+
+@pytest.mark.parametrize('rounding_mode', sorted(ROUNDING_MODES))
+def test_instant_array_matches_instant(rounding_mode: str):
+	random = Random(rounding_mode)
+	instants = InstantArray.from_epoch_nanoseconds([random.randrange(-10 ** 18, 10 ** 18) // 500 * 500 for _ in range(500)])
+	for unit, increment in [('hour', 1), ('minute', 15), ('second', 30), ('millisecond', 1)]:
+		rounded = instants.round(unit, rounding_increment = increment, rounding_mode = rounding_mode)  # type: ignore
+		assert list(rounded) == [instant.round(unit, rounding_increment = increment, rounding_mode = rounding_mode) for instant in instants]  # type: ignore
+
+
+def test_plain_time_wraps_at_midnight():
+	assert str(PlainTime(23, 59, 30).round('minute')) == '00:00:00'
+	assert str(PlainTime(23, 59, 29).round('minute')) == '23:59:00'
+
+
+@pytest.mark.parametrize('unit, increment', [('hour', 5), ('minute', 7), ('second', 86401), ('nanosecond', 0)])
+def test_invalid_increment(unit: str, increment: int):
+	with pytest.raises(ValueError, match = 'invalid rounding increment'):
+		Instant(0).round(unit, rounding_increment = increment)  # type: ignore
+
+
+def test_instant_increment_divides_a_day():
+	# unlike times of day, instants may round to e.g. 60 seconds or 24 hours
+	assert str(Instant.from_('2024-05-06T07:08:31Z').round('second', rounding_increment = 60)) == '2024-05-06T07:09:00Z'
+	assert str(Instant.from_('2024-05-06T13:00Z').round('hour', rounding_increment = 24)) == '2024-05-07T00:00:00Z'
+	with pytest.raises(ValueError, match = 'invalid rounding increment'):
+		PlainTime(7, 8, 31).round('second', rounding_increment = 60)
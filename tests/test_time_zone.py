@@ -0,0 +1,99 @@
+import datetime as py_datetime
+import os
+import zoneinfo as py_zoneinfo
+
+import pytest
+
+from temporal import Instant, TimeZone
+from temporal._zone_rules import _RULES_MAX, ZoneRules, load_zone_rules, zone_rules
+
+_ZONES = ['Europe/Warsaw', 'America/New_York', 'America/Sao_Paulo', 'Australia/Lord_Howe', 'Pacific/Chatham', 'Asia/Kolkata', 'Africa/Casablanca', 'UTC']
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.UTC)
+
+
+def _offset_nanoseconds(zone: py_zoneinfo.ZoneInfo, epoch_seconds: int, /) -> int:
+	offset = (_EPOCH + py_datetime.timedelta(seconds = epoch_seconds)).astimezone(zone).utcoffset()
+	assert offset is not None
+	return offset // py_datetime.timedelta(microseconds = 1) * 1000
+
+
+@pytest.mark.parametrize('key', _ZONES)
+def test_offsets_match_zoneinfo(key: str):
+	time_zone = TimeZone(key)
+	zone = py_zoneinfo.ZoneInfo(key)
+	# every 3 days and an hour from 1900 to 2100, then sparser up to 9999
+	for epoch_seconds in [*range(-2208988800, 4102444800, 86400 * 3 + 3617), *range(4102444800, 253402214400, 8640000 * 7 + 3617)]:
+		assert time_zone.get_offset_nanoseconds_for(Instant.from_epoch_seconds(epoch_seconds)) == _offset_nanoseconds(zone, epoch_seconds)
+
+
+@pytest.mark.parametrize('key', _ZONES)
+def test_transitions_match_zoneinfo(key: str):
+	time_zone = TimeZone(key)
+	zone = py_zoneinfo.ZoneInfo(key)
+	instant = Instant.from_('1950-01-01T00:00Z')
+	for _ in range(60):
+		following = time_zone.get_next_transition(instant)
+		if following is None:
+			break
+		seconds = following.epoch_nanoseconds // 1000000000
+		assert _offset_nanoseconds(zone, seconds - 1) != _offset_nanoseconds(zone, seconds)
+		assert time_zone.get_previous_transition(following.add('PT1S')) == following
+		instant = following
+
+
+@pytest.mark.parametrize('key', ['America/Santiago'])
+def test_far_years_match_expanded_rule(key: str, monkeypatch: pytest.MonkeyPatch):
+	# instants far past the expanded table get tables of their own; both must agree
+	rules = load_zone_rules(key)
+	probes = [epoch_seconds * 1000000000 for epoch_seconds in range(7000000000000, 8640000000000, 41000000000)] + [8640000000000000000000]
+	found = [(rules.offset_nanoseconds_for(value), rules.next_transition(value), rules.previous_transition(value)) for value in probes]
+	monkeypatch.setattr('temporal._zone_rules._FAR_YEARS', 10**9)
+	expanded = load_zone_rules(key)
+	assert found == [(expanded.offset_nanoseconds_for(value), expanded.next_transition(value), expanded.previous_transition(value)) for value in probes]
+	assert len(rules._table.transitions) < len(expanded._table.transitions)
+
+
+def test_rule_that_never_changes_the_offset():
+	# DST all year, from a rule that starts as soon as it ends
+	rules = ZoneRules('X', [0, 1000000000], [-18000, -14400], -18000, 'EST5EDT,0/0,J365/25')
+	far = 8639990000000000000000
+	assert rules.offset_nanoseconds_for(far) == -14400000000000
+	assert rules.next_transition(far) is None and rules.next_transition(2 * 10**18) is None
+	assert rules.previous_transition(far) == rules.previous_transition(2 * 10**18) == 1000000000000000000
+
+
+def test_interning():
+	assert TimeZone('Europe/Warsaw') is TimeZone('Europe/Warsaw') is TimeZone(py_tzinfo = py_zoneinfo.ZoneInfo('Europe/Warsaw'))
+	assert TimeZone.from_('2024-01-01T00:00+01:00[Europe/Warsaw]') is TimeZone('Europe/Warsaw')
+
+
+def test_cache_info_counts_every_lookup():
+	TimeZone.cache_clear()
+	for _ in range(3):
+		TimeZone('Asia/Tokyo')
+	TimeZone('Europe/Lisbon')
+	info = TimeZone.cache_info()
+	assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+	TimeZone.cache_clear()
+	assert TimeZone.cache_info().currsize == 0
+
+
+def test_cache_clear_drops_compiled_rules():
+	assert zone_rules.cache_info().maxsize == _RULES_MAX
+	time_zone = TimeZone('America/Chicago')
+	time_zone.get_offset_nanoseconds_for(Instant(0))
+	assert zone_rules.cache_info().currsize > 0
+	TimeZone.cache_clear()
+	assert zone_rules.cache_info().currsize == 0
+	assert TimeZone('America/Chicago') is not time_zone
+	assert TimeZone('America/Chicago').get_offset_nanoseconds_for(Instant(0)) == -6 * 3600000000000
+
+
+def test_zoneinfo_without_key():
+	path = next(os.path.join(directory, 'Europe', 'Warsaw') for directory in py_zoneinfo.TZPATH if os.path.exists(os.path.join(directory, 'Europe', 'Warsaw')))
+	with open(path, 'rb') as file:
+		py_tzinfo = py_zoneinfo.ZoneInfo.from_file(file)
+	with pytest.raises(ValueError, match = 'without key'):
+		TimeZone.from_py_zoneinfo(py_tzinfo)
+	with pytest.raises(TypeError):
+		TimeZone()
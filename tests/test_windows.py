@@ -0,0 +1,133 @@
+import datetime as py_datetime
+import zoneinfo as py_zoneinfo
+from random import Random
+
+import pytest
+
+from temporal import Instant, InstantArray, sliding_windows, tumbling_windows
+
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.timezone.utc)
+
+# Sao Paulo and Havana moved their clocks at midnight, Lord Howe by half an hour
+ZONES = ['Europe/Warsaw', 'America/Sao_Paulo', 'America/Havana', 'Australia/Lord_Howe', 'UTC']
+
+
+def _epoch_nanoseconds(value: py_datetime.datetime, /) -> int:
+	delta = value - _EPOCH
+	return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
+
+
+def _truncate(wall: py_datetime.datetime, unit: str, /) -> py_datetime.datetime:
+	if unit == 'hour':
+		return wall.replace(minute = 0, second = 0, microsecond = 0)
+	wall = wall.replace(hour = 0, minute = 0, second = 0, microsecond = 0)
+	if unit == 'week':
+		return wall - py_datetime.timedelta(days = wall.weekday())
+	if unit == 'month':
+		return wall.replace(day = 1)
+	return wall
+
+
+def _next(wall: py_datetime.datetime, unit: str, /) -> py_datetime.datetime:
+	if unit == 'month':
+		return wall.replace(year = wall.year + wall.month // 12, month = wall.month % 12 + 1)
+	return wall + {'hour': py_datetime.timedelta(hours = 1), 'day': py_datetime.timedelta(days = 1), 'week': py_datetime.timedelta(weeks = 1)}[unit]
+
+
+def _previous(wall: py_datetime.datetime, unit: str, /) -> py_datetime.datetime:
+	if unit == 'month':
+		return wall.replace(year = wall.year - (wall.month == 1), month = (wall.month - 2) % 12 + 1)
+	return wall - {'hour': py_datetime.timedelta(hours = 1), 'day': py_datetime.timedelta(days = 1), 'week': py_datetime.timedelta(weeks = 1)}[unit]
+
+
+def _expected_unit(epoch_nanoseconds: int, zone: py_zoneinfo.ZoneInfo, unit: str, /) -> tuple[int, int]:
+	# A unit starts at the first instant showing its first wall-clock time; with
+	# fold = 0 zoneinfo gives that instant, or the end of the gap hiding it.
+	def start(wall: py_datetime.datetime, /) -> int:
+		return _epoch_nanoseconds(wall.replace(tzinfo = zone, fold = 0))
+
+	local = (_EPOCH + py_datetime.timedelta(microseconds = epoch_nanoseconds // 1000)).astimezone(zone).replace(tzinfo = None)
+	wall = _truncate(local, unit)
+	while epoch_nanoseconds < start(wall):
+		wall = _previous(wall, unit)
+	while epoch_nanoseconds >= start(_next(wall, unit)):
+		wall = _next(wall, unit)
+	return start(wall), start(_next(wall, unit))
+
+
+def _instants_near_transitions(key: str, /) -> list[int]:
+	zone = py_zoneinfo.ZoneInfo(key)
+	random = Random(key)
+	values = [random.randrange(0, 2 * 10 ** 18) // 1000 * 1000 for _ in range(200)]
+	for year in (1996, 2010, 2018, 2024):
+		for month in range(1, 13):
+			for day in (1, 2, 3, 4, 5, 6, 7, 8, 10, 15, 16, 22, 27, 28, 31):
+				try:
+					wall = py_datetime.datetime(year, month, day)
+				except ValueError:
+					continue
+				utc = wall.replace(tzinfo = zone).astimezone(py_datetime.timezone.utc)
+				values.append(_epoch_nanoseconds(utc) + random.randrange(-4 * 3600, 4 * 3600) * 1000000000)
+	return values
+
+
+@pytest.mark.parametrize('key', ZONES)
+@pytest.mark.parametrize('unit', ['hour', 'day', 'week', 'month'])
+def test_tumbling_windows_match_zoneinfo(key: str, unit: str):
+	zone = py_zoneinfo.ZoneInfo(key)
+	values = _instants_near_transitions(key)
+	found = list(tumbling_windows(InstantArray.from_epoch_nanoseconds(values), key, unit))  # type: ignore
+	assert [instant.epoch_nanoseconds for _, instant in found] == values
+	for (window, _), value in zip(found, values):
+		assert (window.start.epoch_nanoseconds, window.end.epoch_nanoseconds) == _expected_unit(value, zone, unit), value
+		assert window.start.time_zone_id == key
+
+
+@pytest.mark.parametrize('key', ZONES)
+def test_sorted_input_matches_unsorted(key: str):
+	values = _instants_near_transitions(key)
+	instants = [Instant(value) for value in values]
+	expected = dict(zip(values, (window for window, _ in tumbling_windows(instants, key, 'day'))))
+	values.sort()
+	assert [window for window, _ in tumbling_windows(map(Instant, values), key, 'day')] == [expected[value] for value in values]
+
+
+def test_day_lengths_follow_the_clock():
+	(spring, _), = tumbling_windows(['2024-03-31T12:00Z'], 'Europe/Warsaw', 'day')
+	(autumn, _), = tumbling_windows(['2024-10-27T12:00Z'], 'Europe/Warsaw', 'day')
+	assert str(spring.start) == '2024-03-31T00:00:00+01:00[Europe/Warsaw]'
+	assert spring.end.epoch_nanoseconds - spring.start.epoch_nanoseconds == 23 * 3600000000000
+	assert autumn.end.epoch_nanoseconds - autumn.start.epoch_nanoseconds == 25 * 3600000000000
+
+
+def test_weeks_start_on_monday():
+	(window, _), = tumbling_windows(['2024-05-09T12:00Z'], 'UTC', 'week', size = 2)
+	assert window.start.day_of_week == 1
+	assert window.end.epoch_nanoseconds - window.start.epoch_nanoseconds == 14 * 86400000000000
+
+
+@pytest.mark.parametrize('unit, size, step', [('hour', 6, 2), ('day', 7, 1), ('month', 3, 1), ('week', 4, 3), ('day', 2, 5)])
+def test_sliding_windows(unit: str, size: int, step: int):
+	zone = py_zoneinfo.ZoneInfo('Europe/Warsaw')
+	values = _instants_near_transitions('Europe/Warsaw')[:400]
+	found: dict[int, list] = {}
+	for window, instant in sliding_windows(map(Instant, values), 'Europe/Warsaw', unit, size = size, step = step):  # type: ignore
+		found.setdefault(instant.epoch_nanoseconds, []).append(window)
+	for value in values:
+		windows = found.get(value, [])
+		assert windows == sorted(windows, key = lambda window: window.start.epoch_nanoseconds)
+		for window in windows:
+			assert window.start.epoch_nanoseconds <= value < window.end.epoch_nanoseconds
+			# every window is `size` whole units long
+			end = window.start.epoch_nanoseconds
+			for _ in range(size):
+				end = _expected_unit(end, zone, unit)[1]
+			assert end == window.end.epoch_nanoseconds
+		# a unit is covered by size // step or size // step + 1 windows
+		assert len(windows) in (size // step, -(-size // step))
+
+
+@pytest.mark.parametrize('unit, size, step', [('year', 1, 1), ('day', 0, 1), ('day', 1, 0)])
+def test_invalid_arguments(unit: str, size: int, step: int):
+	with pytest.raises(ValueError):
+		sliding_windows([], 'UTC', unit, size = size, step = step)  # type: ignore
@@ -0,0 +1,119 @@
+import datetime as py_datetime
+import struct
+import zoneinfo as py_zoneinfo
+from random import Random
+
+import pytest
+
+from temporal import Instant, InstantArray, PlainDate, PlainDateTime, PlainTime, TimeZone, ZonedDateTime
+
+_EPOCH = py_datetime.datetime(1970, 1, 1, tzinfo = py_datetime.timezone.utc)
+_MIN_INT64 = -2 ** 63
+_MAX_INT64 = 2 ** 63 - 1
+
+ZONE_TABLE = ['UTC', 'Europe/Warsaw', 'America/New_York', 'Australia/Lord_Howe']
+
+
+def _datetimes(seed: str, /) -> list[py_datetime.datetime]:
+	# the int64 nanosecond encodings cover 1677-09-21 to 2262-04-11
+	random = Random(seed)
+	return [py_datetime.datetime(1678, 1, 1) + py_datetime.timedelta(microseconds = random.randrange(584 * 365 * 86400 * 10 ** 6)) for _ in range(500)]
+
+
+def test_instant_matches_datetime():
+	for value in _datetimes('instant'):
+		delta = value.replace(tzinfo = py_datetime.timezone.utc) - _EPOCH
+		epoch_nanoseconds = (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
+		instant = Instant(epoch_nanoseconds)
+		assert instant.to_bytes() == struct.pack('<q', epoch_nanoseconds)
+		assert Instant.from_bytes(instant.to_bytes()) == instant
+
+
+def test_plain_date_matches_datetime():
+	random = Random(0)
+	dates = [py_datetime.date.fromordinal(random.randrange(1, py_datetime.date.max.toordinal())) for _ in range(500)]
+	plain_dates = [PlainDate(date.year, date.month, date.day) for date in dates]
+	data = PlainDate.to_bytes_many(plain_dates)
+	assert data == b''.join(struct.pack('<i', date.toordinal() - 719163) for date in dates)
+	assert list(PlainDate.from_bytes_iter(data)) == plain_dates
+	assert PlainDate.from_bytes(plain_dates[0].to_bytes()) == plain_dates[0]
+
+
+def test_plain_time_matches_datetime():
+	random = Random(0)
+	times = [py_datetime.time(random.randrange(24), random.randrange(60), random.randrange(60), random.randrange(1000000)) for _ in range(500)]
+	plain_times = [PlainTime(time.hour, time.minute, time.second, time.microsecond // 1000, time.microsecond % 1000) for time in times]
+	data = PlainTime.to_bytes_many(plain_times)
+	assert data == b''.join(struct.pack('<q', ((time.hour * 60 + time.minute) * 60 + time.second) * 1000000000 + time.microsecond * 1000) for time in times)
+	assert list(PlainTime.from_bytes_iter(data)) == plain_times
+
+
+def test_plain_date_time_matches_datetime():
+	values = _datetimes('plain')
+	plain_date_times = [PlainDateTime(value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond // 1000, value.microsecond % 1000) for value in values]
+	data = PlainDateTime.to_bytes_many(plain_date_times)
+	expected = []
+	for value in values:
+		delta = value - py_datetime.datetime(1970, 1, 1)
+		expected.append(struct.pack('<q', (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000))
+	assert data == b''.join(expected)
+	assert list(PlainDateTime.from_bytes_iter(data)) == plain_date_times
+	assert [PlainDateTime.from_bytes(record) for record in expected[:10]] == plain_date_times[:10]
+
+
+def test_zoned_date_time_round_trip():
+	random = Random(0)
+	zoned_date_times = [ZonedDateTime(random.randrange(-2 ** 62, 2 ** 62), TimeZone(random.choice(ZONE_TABLE))) for _ in range(500)]
+	data = ZonedDateTime.to_bytes_many(zoned_date_times, ZONE_TABLE)
+	assert len(data) == 10 * len(zoned_date_times)
+	assert data[:10] == zoned_date_times[0].to_bytes(ZONE_TABLE)
+	decoded = list(ZonedDateTime.from_bytes_iter(data, ZONE_TABLE))
+	assert decoded == zoned_date_times
+	assert ZonedDateTime.from_bytes(data[10:20], ZONE_TABLE) == zoned_date_times[1]
+	# the offsets are computed again on decoding and agree with zoneinfo
+	for zoned_date_time in decoded[:100]:
+		value = _EPOCH + py_datetime.timedelta(microseconds = zoned_date_time.epoch_nanoseconds // 1000)
+		offset = value.astimezone(py_zoneinfo.ZoneInfo(zoned_date_time.time_zone_id)).utcoffset()
+		assert zoned_date_time.offset_nanoseconds == offset // py_datetime.timedelta(microseconds = 1) * 1000
+
+
+def test_zone_table_errors():
+	zoned_date_time = ZonedDateTime(0, TimeZone('Asia/Tokyo'))
+	with pytest.raises(ValueError, match = 'not in the zone table'):
+		zoned_date_time.to_bytes(ZONE_TABLE)
+	with pytest.raises(ValueError, match = 'not in the zone table'):
+		ZonedDateTime.to_bytes_many([zoned_date_time], ZONE_TABLE)
+	with pytest.raises(ValueError, match = 'index out of range'):
+		ZonedDateTime.from_bytes(struct.pack('<qH', 0, len(ZONE_TABLE)), ZONE_TABLE)
+
+
+def test_buffers_are_not_copied():
+	instants = [Instant(value) for value in (0, 1, -1, _MIN_INT64, _MAX_INT64)]
+	data = bytearray(b'\x00' * 3 + Instant.to_bytes_many(instants))
+	view = memoryview(data)[3:]
+	assert list(Instant.from_bytes_iter(view)) == instants
+	assert list(InstantArray.from_bytes(view)) == instants
+	assert InstantArray(instants).to_bytes() == bytes(view)
+
+
+@pytest.mark.parametrize('encode', [
+	lambda: Instant(_MAX_INT64 + 1).to_bytes(),
+	lambda: Instant.to_bytes_many([Instant(_MIN_INT64 - 1)]),
+	lambda: PlainDateTime(2262, 4, 12).to_bytes(),
+	lambda: PlainDateTime.to_bytes_many([PlainDateTime(1677, 9, 21)]),
+])
+def test_encode_out_of_range(encode):
+	with pytest.raises(ValueError, match = 'out of range for the binary encoding'):
+		encode()
+
+
+@pytest.mark.parametrize('decode, message', [
+	(lambda: Instant.from_bytes(b'\x00' * 7), 'expected 8 bytes'),
+	(lambda: list(PlainDate.from_bytes_iter(b'\x00' * 6)), 'multiple of 4 bytes'),
+	(lambda: InstantArray.from_bytes(b'\x00' * 9), 'multiple of 8 bytes'),
+	(lambda: PlainDate.from_bytes(struct.pack('<i', 2 ** 31 - 1)), 'epoch days out of range'),
+	(lambda: PlainTime.from_bytes(struct.pack('<q', 86400000000000)), 'nanosecond of day out of range'),
+])
+def test_decode_errors(decode, message: str):
+	with pytest.raises(ValueError, match = message):
+		decode()
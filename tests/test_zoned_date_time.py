@@ -0,0 +1,111 @@
+import datetime as py_datetime
+import zoneinfo as py_zoneinfo
+from random import Random
+
+import pytest
+
+from temporal import Instant, ZonedDateTime
+from temporal._parse_many import ParseError
+
+
+def test_from_iter():
+	strings = ['2024-03-31T02:30[Europe/Warsaw]', ' 2024-10-27T02:30+01:00[Europe/Warsaw] ']
+	assert list(ZonedDateTime.from_iter(strings)) == [ZonedDateTime.from_(string.strip()) for string in strings]
+
+
+def test_from_iter_errors():
+	errors: list[ParseError] = []
+	found = list(ZonedDateTime.from_iter(['2024-01-01T00:00Z', '2024-01-01T00:00Z[UTC]'], errors = errors))
+	assert found == [ZonedDateTime.from_('2024-01-01T00:00Z[UTC]')]
+	assert [error.index for error in errors] == [0]
+	with pytest.raises(ValueError, match = 'row 0'):
+		list(ZonedDateTime.from_iter(['2024-01-01T00:00Z']))
+
+
+@pytest.mark.parametrize('duration, expected', [
+	('P1D', '2024-03-31T12:00:00+02:00[Europe/Warsaw]'),
+	('PT24H', '2024-03-31T13:00:00+02:00[Europe/Warsaw]'),
+	('P1M', '2024-04-30T12:00:00+02:00[Europe/Warsaw]'),
+	('-P1M', '2024-02-29T12:00:00+01:00[Europe/Warsaw]'),
+	('P1Y11M', '2026-02-28T12:00:00+01:00[Europe/Warsaw]'),
+	('P1W1DT1H', '2024-04-07T13:00:00+02:00[Europe/Warsaw]'),
+])
+def test_add_calendar_units(duration: str, expected: str):
+	assert str(ZonedDateTime.from_('2024-03-30T12:00[Europe/Warsaw]').add(duration)) == expected
+
+
+def test_add_calendar_units_matches_datetime():
+	zone = py_zoneinfo.ZoneInfo('America/New_York')
+	start = py_datetime.datetime(2023, 1, 31, 12, 30, tzinfo = zone)
+	zoned_date_time = ZonedDateTime(py_datetimezoned = start)
+	for days in range(0, 800, 7):
+		# aware datetime arithmetic keeps the wall clock, like calendar days
+		assert zoned_date_time.add(f'P{days}D').py_datetimezoned == start + py_datetime.timedelta(days = days)
+
+
+def test_add_into_gap_and_reject():
+	assert str(ZonedDateTime.from_('2024-03-30T02:30[Europe/Warsaw]').add('P1D')) == '2024-03-31T03:30:00+02:00[Europe/Warsaw]'
+	assert ZonedDateTime.from_('2024-01-31T00:00[UTC]').subtract('-P1M') == ZonedDateTime.from_('2024-02-29T00:00[UTC]')
+	with pytest.raises(ValueError):
+		ZonedDateTime.from_('2024-01-31T00:00[UTC]').add('P1M', 'reject')
+	with pytest.raises(ValueError):
+		ZonedDateTime.from_('2024-01-31T00:00[UTC]').add('P1M', 'ignore')  # type: ignore
+
+
+def test_until_calendar_units():
+	one = ZonedDateTime.from_('2024-03-30T12:00[Europe/Warsaw]')
+	two = ZonedDateTime.from_('2024-03-31T12:00[Europe/Warsaw]')
+	assert str(one.until(two)) == 'PT23H'
+	assert str(one.until(two, largest_unit = 'day')) == 'P1D'
+	assert str(two.since(one, largest_unit = 'day')) == 'P1D'
+	assert str(two.until(one, largest_unit = 'day')) == '-P1D'
+	one = ZonedDateTime.from_('2024-01-31T12:00[Europe/Warsaw]')
+	two = ZonedDateTime.from_('2024-03-01T11:00[Europe/Warsaw]')
+	assert str(one.until(two, largest_unit = 'month')) == 'P29DT23H'
+	assert str(two.until(one, largest_unit = 'month')) == '-P1MT23H'
+	assert str(one.until(two, largest_unit = 'week')) == 'P4W1DT23H'
+	assert str(one.until(two, largest_unit = 'month', smallest_unit = 'day', rounding_mode = 'halfExpand')) == 'P1M1D'
+	with pytest.raises(ValueError):
+		one.until(two, largest_unit = 'year', smallest_unit = 'month')
+	with pytest.raises(ValueError):
+		one.until(two.to_zoned_date_time(time_zone = 'UTC'), largest_unit = 'day')
+
+
+def test_until_add_round_trip():
+	random = Random(0)
+	for time_zone in ('America/New_York', 'Australia/Lord_Howe'):
+		for _ in range(300):
+			one = ZonedDateTime(random.randrange(-10**18, 2 * 10**18), time_zone)
+			two = ZonedDateTime(random.randrange(-10**18, 2 * 10**18), time_zone)
+			for unit in ('year', 'month', 'week', 'day'):
+				assert one.add(one.until(two, largest_unit = unit)) == two
+				assert two.subtract(two.since(one, largest_unit = unit)) == one
+
+
+def test_ordering_with_instants():
+	zoned_date_time = ZonedDateTime.from_('2024-03-31T03:00+02:00[Europe/Warsaw]')
+	instant = Instant.from_('2024-03-31T00:30Z')
+	assert instant < zoned_date_time and zoned_date_time > instant
+	assert instant <= zoned_date_time.to_instant() <= zoned_date_time
+	assert zoned_date_time >= zoned_date_time.to_instant().to_zoned_date_time_iso('UTC') >= zoned_date_time
+	assert sorted([zoned_date_time, instant]) == [instant, zoned_date_time]
+	assert zoned_date_time != zoned_date_time.to_instant()
+	with pytest.raises(TypeError):
+		zoned_date_time < zoned_date_time.to_plain_date_time()  # type: ignore
+
+
+def test_from_without_offset():
+	zone = py_zoneinfo.ZoneInfo('Europe/Warsaw')
+	for hour in range(0, 24 * 400, 7):
+		wall = py_datetime.datetime(2023, 1, 1, 0, 17, 5, 123456) + py_datetime.timedelta(hours = hour)
+		zoned_date_time = ZonedDateTime.from_(f'{wall.isoformat()}789[Europe/Warsaw]')
+		# fold = 0 is 'compatible' outside gaps; the UTC round trip rules gaps out
+		expected = wall.replace(tzinfo = zone)
+		if expected.astimezone(py_datetime.UTC).astimezone(zone).replace(tzinfo = None) == wall:
+			assert zoned_date_time.py_datetimezoned == expected
+			assert zoned_date_time.nanosecond == 789
+	assert str(ZonedDateTime.from_('2024-03-31T02:30[Europe/Warsaw]')) == '2024-03-31T03:30:00+02:00[Europe/Warsaw]'
+	assert str(ZonedDateTime.from_('+010000-10-27T02:30[Europe/Warsaw]')) == '+010000-10-27T02:30:00+02:00[Europe/Warsaw]'
+	assert str(ZonedDateTime.from_('-271821-04-20T00:00[UTC]')) == '-271821-04-20T00:00:00+00:00[UTC]'
+	with pytest.raises(ValueError):
+		ZonedDateTime.from_('+275760-09-13T00:00:00.000000001[UTC]')